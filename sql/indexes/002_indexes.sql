@@ -24,3 +24,18 @@ CREATE INDEX IF NOT EXISTS idx_relations_run_id
 
 CREATE INDEX IF NOT EXISTS idx_data_windows_run_object
     ON data_windows (run_id, object_id);
+
+CREATE INDEX IF NOT EXISTS idx_relations_run_src_type
+    ON relations (run_id, src_id, relation_type);
+
+CREATE INDEX IF NOT EXISTS idx_objects_run_name
+    ON objects (run_id, name);
+
+CREATE INDEX IF NOT EXISTS idx_relations_run_dst
+    ON relations (run_id, dst_id);
+
+CREATE INDEX IF NOT EXISTS idx_sql_tables_run_table
+    ON sql_tables (run_id, table_name, rw_type);
+
+CREATE INDEX IF NOT EXISTS idx_sql_tables_run_sql
+    ON sql_tables (run_id, sql_id, rw_type);
@@ -0,0 +1,18 @@
+CREATE VIRTUAL TABLE objects_search USING fts5(
+    type,
+    name,
+    module,
+    source_path,
+    content = 'objects',
+    content_rowid = 'id',
+    tokenize = 'trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS objects_search_after_insert
+AFTER INSERT ON objects
+BEGIN
+    INSERT INTO objects_search (rowid, type, name, module, source_path)
+    VALUES (new.id, new.type, new.name, new.module, new.source_path);
+END;
+
+INSERT INTO objects_search (objects_search) VALUES ('rebuild');
@@ -91,3 +91,22 @@ CREATE TABLE IF NOT EXISTS data_windows (
     FOREIGN KEY (object_id) REFERENCES objects(id),
     UNIQUE (run_id, object_id, dw_name)
 );
+
+CREATE TABLE IF NOT EXISTS run_summary (
+    run_id TEXT PRIMARY KEY,
+    total_objects INTEGER NOT NULL,
+    table_objects INTEGER NOT NULL,
+    app_objects INTEGER NOT NULL,
+    relations INTEGER NOT NULL,
+    sql_statements INTEGER NOT NULL,
+    sql_tables INTEGER NOT NULL,
+    FOREIGN KEY (run_id) REFERENCES runs(run_id)
+);
+
+CREATE TABLE IF NOT EXISTS run_relation_counts (
+    run_id TEXT NOT NULL,
+    relation_type TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (run_id, relation_type),
+    FOREIGN KEY (run_id) REFERENCES runs(run_id)
+);
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 import re
+import string
 from typing import cast
 
 from pb_analyzer.common import (
@@ -13,6 +16,7 @@ from pb_analyzer.common import (
     FunctionRecord,
     ObjectRecord,
     ParseResult,
+    ParsedObject,
     RelationRecord,
     RelationType,
     RwType,
@@ -22,29 +26,76 @@ from pb_analyzer.common import (
 )
 from pb_analyzer.rules import TableMappingConfig
 
-_CALL_PATTERN = re.compile(r"\b([A-Za-z_][A-Za-z0-9_]*)\s*\(")
-_OPEN_PATTERN = re.compile(r"\bopen(?:withparm)?\s*\(\s*([A-Za-z_][A-Za-z0-9_]*)", re.IGNORECASE)
-_TRIGGER_EVENT_PATTERN = re.compile(r"\btrigger\s+event\s+([A-Za-z_][A-Za-z0-9_]*)", re.IGNORECASE)
-_SQL_COMMENT_BLOCK = re.compile(r"/\*.*?\*/", re.DOTALL)
-_SQL_COMMENT_LINE = re.compile(r"--.*?$", re.MULTILINE)
+# open/trigger 대상은 lookahead로 캡처해 대상 이름 위치에서 시작하는 다른 참조도 같은 스캔에서 검출한다.
+# 반복 구간은 possessive 수량자로 고정해 긴 식별자/공백에서 역추적이 일어나지 않게 한다.
+# ASCII 소문자로 바꾼 스크립트에 적용하므로 캡처한 이름을 그대로 소문자 키 조회에 쓴다.
+_SCRIPT_REFERENCE_PATTERN = re.compile(
+    r"\bopen(?:withparm)?+\s*+\(\s*+(?=(?P<open>[a-z_][a-z0-9_]*+))"
+    r"|\btrigger\s++event\s++(?=(?P<trigger>[a-z_][a-z0-9_]*+))"
+    r"|\b(?P<call>[a-z_][a-z0-9_]*+)\s*+\("
+)
+_SQL_TOKEN_PATTERN = re.compile(r"/\*|--|;")
 _SQL_KIND_PATTERN = re.compile(r"\b(SELECT|INSERT|UPDATE|DELETE|MERGE)\b", re.IGNORECASE)
+# 주석은 공백으로 치환되므로 키워드가 원문에 연속으로 없으면 SQL 문도 있을 수 없다.
+_SQL_KEYWORD_HINT_PATTERN = re.compile(r"SELECT|INSERT|UPDATE|DELETE|MERGE", re.IGNORECASE)
+_WORD_PATTERN = re.compile(r"\w+")
+# str.lower()는 'İ' 같은 비ASCII 문자를 결합 문자로 풀어 단어 경계를 바꾸므로 ASCII 대문자만 내린다.
+_ASCII_LOWER_TABLE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+_TABLE_NAME = r"([A-Z_][A-Z0-9_$.#]*+)"
+_SELECT_TABLE_PATTERN = re.compile(rf"\b(?:FROM|JOIN)\s++{_TABLE_NAME}")
+_INSERT_TABLE_PATTERN = re.compile(rf"\bINSERT\s++INTO\s++{_TABLE_NAME}")
+_UPDATE_TABLE_PATTERN = re.compile(rf"\bUPDATE\s++{_TABLE_NAME}")
+_DELETE_TABLE_PATTERN = re.compile(rf"\bDELETE\s++FROM\s++{_TABLE_NAME}")
+_MERGE_INTO_TABLE_PATTERN = re.compile(rf"\bMERGE\s++INTO\s++{_TABLE_NAME}")
+_MERGE_USING_TABLE_PATTERN = re.compile(rf"\bUSING\s++{_TABLE_NAME}")
+
+# SQL 종류별 테이블 추출 규칙: (패턴, 읽기/쓰기, 모든 매치 수집 여부)
+_TABLE_USAGE_RULES: dict[SqlKind, tuple[tuple[re.Pattern[str], RwType, bool], ...]] = {
+    "SELECT": ((_SELECT_TABLE_PATTERN, "READ", True),),
+    "INSERT": ((_INSERT_TABLE_PATTERN, "WRITE", False),),
+    "UPDATE": ((_UPDATE_TABLE_PATTERN, "WRITE", False),),
+    "DELETE": ((_DELETE_TABLE_PATTERN, "WRITE", False),),
+    "MERGE": (
+        (_MERGE_INTO_TABLE_PATTERN, "WRITE", False),
+        (_MERGE_USING_TABLE_PATTERN, "READ", False),
+    ),
+}
+
+_CALL_KEYWORDS = frozenset(
+    {
+        "if",
+        "for",
+        "while",
+        "choose",
+        "case",
+        "return",
+        "open",
+        "openwithparm",
+        "trigger",
+        "event",
+        "messagebox",
+        "super",
+        "parent",
+    }
+)
 
-_CALL_KEYWORDS = {
-    "if",
-    "for",
-    "while",
-    "choose",
-    "case",
-    "return",
-    "open",
-    "openwithparm",
-    "trigger",
-    "event",
-    "messagebox",
-    "super",
-    "parent",
+_PARALLEL_CHUNK_SIZE = 32
+_SQL_SCRIPT_CACHE_SIZE = 1024
+_TABLE_USAGE_CACHE_SIZE = 16384
+
+_RELATION_TYPE_IDS: dict[RelationType, int] = {
+    "calls": 0,
+    "opens": 1,
+    "uses_dw": 2,
+    "reads_table": 3,
+    "writes_table": 4,
+    "triggers_event": 5,
 }
 
+# 프로세스 풀 워커가 initializer로 받아 두는 분석 컨텍스트
+_worker_context: _AnalysisContext | None = None
+
 
 @dataclass(frozen=True)
 class _DetectedSql:
@@ -52,12 +103,36 @@ class _DetectedSql:
     text_norm: str
 
 
+@dataclass(frozen=True)
+class _AnalysisContext:
+    function_owner: dict[str, str]
+    object_name_lookup: dict[str, str]
+    data_window_lookup: dict[str, str]
+    data_window_order: dict[str, int]
+    data_window_patterns: dict[str, re.Pattern[str]]
+    excluded_tables: frozenset[str]
+
+
+@dataclass(frozen=True)
+class _ObjectAnalysis:
+    # (대상 이름, 관계 유형, 신뢰도) 후보. 레코드는 중복 제거 후에만 만든다.
+    relations: tuple[tuple[str, RelationType, float], ...]
+    sql_statements: tuple[SqlStatementRecord, ...]
+
+
 def analyze(
     parse_result: ParseResult,
     *,
     table_mapping: TableMappingConfig | None = None,
+    workers: int = 1,
 ) -> AnalysisResult:
-    """Builds IR records from parsed objects."""
+    """Builds IR records from parsed objects.
+
+    workers가 2 이상이면 객체별 스크립트 분석을 해당 개수의 프로세스로 나눠 실행한다.
+    """
+
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1: {workers}")
 
     excluded_tables: set[str] = set()
     if table_mapping is not None:
@@ -65,112 +140,115 @@ def analyze(
             rule.table_name.upper() for rule in table_mapping.exception_rules
         }
 
-    object_records = [
-        ObjectRecord(
-            object_type=item.object_type,
-            name=item.name,
-            module=item.module,
-            source_path=item.source_path,
-        )
-        for item in parse_result.objects
-    ]
-
-    events = [
-        EventRecord(
-            object_name=item.name,
-            event_name=event.event_name,
-            script_ref=event.script_ref,
-        )
-        for item in parse_result.objects
-        for event in item.events
-    ]
-
-    functions = [
-        FunctionRecord(
-            object_name=item.name,
-            function_name=fn.function_name,
-            signature=fn.signature,
+    object_records: list[ObjectRecord] = []
+    events: list[EventRecord] = []
+    functions: list[FunctionRecord] = []
+    function_owner: dict[str, str] = {}
+    object_name_lookup: dict[str, str] = {}
+    data_window_lookup: dict[str, str] = {}
+    data_window_order: dict[str, int] = {}
+    # 레코드와 이름 조회 테이블을 객체 목록 한 번 순회로 함께 만든다.
+    for item in parse_result.objects:
+        object_records.append(
+            ObjectRecord(
+                object_type=item.object_type,
+                name=item.name,
+                module=item.module,
+                source_path=item.source_path,
+            )
         )
-        for item in parse_result.objects
-        for fn in item.functions
-    ]
-
-    function_owner = _build_function_owner_map(functions)
-    object_name_lookup = {item.name.lower(): item.name for item in parse_result.objects}
-    data_window_lookup = {
-        item.name.lower(): item.name
-        for item in parse_result.objects
-        if item.object_type.lower() == "datawindow"
+        for event in item.events:
+            events.append(
+                EventRecord(
+                    object_name=item.name,
+                    event_name=event.event_name,
+                    script_ref=event.script_ref,
+                )
+            )
+        for fn in item.functions:
+            functions.append(
+                FunctionRecord(
+                    object_name=item.name,
+                    function_name=fn.function_name,
+                    signature=fn.signature,
+                )
+            )
+            function_owner.setdefault(_ascii_lower(fn.function_name), item.name)
+
+        name_lower = _ascii_lower(item.name)
+        object_name_lookup[name_lower] = item.name
+        if item.object_type.lower() == "datawindow":
+            data_window_order.setdefault(name_lower, len(data_window_order))
+            data_window_lookup[name_lower] = item.name
+
+    # 단어 문자로만 된 DataWindow 이름은 토큰 조회로 찾고, 그 외 이름만 개별 패턴으로 검사한다.
+    # 두 경우 모두 객체마다 한 번 ASCII 소문자로 바꾼 스크립트를 대상으로 한다.
+    data_window_patterns = {
+        dw_name_lower: re.compile(rf"\b{re.escape(dw_name_lower)}\b")
+        for dw_name_lower in data_window_lookup
+        if _WORD_PATTERN.fullmatch(dw_name_lower) is None
     }
 
-    relations: list[RelationRecord] = []
+    relations_raw: list[tuple[str, str, RelationType, float]] = []
     sql_statements: list[SqlStatementRecord] = []
     table_objects: dict[str, ObjectRecord] = {}
-    relation_keys: set[tuple[str, str, RelationType]] = set()
+    relation_keys: set[tuple[int, int, int]] = set()
+    # 관계 중복 키는 대소문자 무시 이름을 정수 id로 치환해 만든다. 원본 이름별 id도 캐시해 lower()를 반복하지 않는다.
+    name_ids: dict[str, int] = {}
+    lowered_name_ids: dict[str, int] = {}
+
+    def intern_name(name: str) -> int:
+        name_id = name_ids.get(name)
+        if name_id is None:
+            name_id = lowered_name_ids.setdefault(name.lower(), len(lowered_name_ids))
+            name_ids[name] = name_id
+        return name_id
 
     def add_relation(
         src_name: str, dst_name: str, relation_type: RelationType, confidence: float
     ) -> None:
-        key = (src_name.lower(), dst_name.lower(), relation_type)
+        key = (intern_name(src_name), intern_name(dst_name), _RELATION_TYPE_IDS[relation_type])
         if key in relation_keys:
             return
         relation_keys.add(key)
-        relations.append(
-            RelationRecord(
-                src_name=src_name,
-                dst_name=dst_name,
-                relation_type=relation_type,
-                confidence=confidence,
-            )
-        )
-
-    for parsed_object in parse_result.objects:
-        script_text = parsed_object.script_text
-
-        for matched in _CALL_PATTERN.finditer(script_text):
-            function_name = matched.group(1)
-            function_name_lower = function_name.lower()
-            if function_name_lower in _CALL_KEYWORDS:
-                continue
-            owner_name = function_owner.get(function_name_lower)
-            if owner_name is None:
-                continue
-            add_relation(parsed_object.name, owner_name, "calls", 0.85)
-
-        for matched in _OPEN_PATTERN.finditer(script_text):
-            target_name = object_name_lookup.get(matched.group(1).lower())
-            if target_name is None:
-                continue
-            add_relation(parsed_object.name, target_name, "opens", 0.95)
-
-        for dw_name_lower, dw_name in data_window_lookup.items():
-            pattern = re.compile(rf"\b{re.escape(dw_name_lower)}\b", re.IGNORECASE)
-            if pattern.search(script_text) is None:
-                continue
-            add_relation(parsed_object.name, dw_name, "uses_dw", 0.9)
-
-        object_event_names = {event.event_name.lower() for event in parsed_object.events}
-        for matched in _TRIGGER_EVENT_PATTERN.finditer(script_text):
-            event_name = matched.group(1).lower()
-            if event_name in object_event_names:
-                add_relation(parsed_object.name, parsed_object.name, "triggers_event", 0.7)
-
-        for sql_item in _extract_sql_statements(script_text):
-            usages = [
-                u for u in _extract_table_usages(sql_item.kind, sql_item.text_norm)
-                if u.table_name.upper() not in excluded_tables
-            ]
-            sql_statements.append(
-                SqlStatementRecord(
-                    owner_name=parsed_object.name,
-                    sql_text_norm=sql_item.text_norm,
-                    sql_kind=sql_item.kind,
-                    table_usages=tuple(usages),
+        relations_raw.append((src_name, dst_name, relation_type, confidence))
+
+    context = _AnalysisContext(
+        function_owner=function_owner,
+        object_name_lookup=object_name_lookup,
+        data_window_lookup=data_window_lookup,
+        data_window_order=data_window_order,
+        data_window_patterns=data_window_patterns,
+        excluded_tables=frozenset(excluded_tables),
+    )
+    # 객체별 분석은 조회 테이블만 읽으므로 프로세스 풀로 나눠 돌리고, 중복 제거는 원래 순서대로 합치며 한다.
+    # 조회 테이블은 작업 단위마다 직렬화하지 않고 initializer로 워커마다 한 번만 넘긴다.
+    if workers > 1 and len(parse_result.objects) > 1:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker_context,
+            initargs=(context,),
+        ) as pool:
+            object_analyses = list(
+                pool.map(
+                    _analyze_object_in_worker,
+                    parse_result.objects,
+                    chunksize=_PARALLEL_CHUNK_SIZE,
                 )
             )
-
-            for usage in usages:
-                table_name = usage.table_name.upper()
+    else:
+        object_analyses = [
+            _analyze_object(parsed_object, context) for parsed_object in parse_result.objects
+        ]
+
+    for parsed_object, object_analysis in zip(parse_result.objects, object_analyses):
+        for dst_name, relation_type, confidence in object_analysis.relations:
+            add_relation(parsed_object.name, dst_name, relation_type, confidence)
+
+        for statement in object_analysis.sql_statements:
+            sql_statements.append(statement)
+            for usage in statement.table_usages:
+                table_name = usage.table_name
                 if table_name not in table_objects:
                     table_objects[table_name] = ObjectRecord(
                         object_type="Table",
@@ -179,10 +257,8 @@ def analyze(
                         source_path=table_name,
                     )
 
-                rw_relation: RelationType = "reads_table" if usage.rw_type == "READ" else "writes_table"
-                add_relation(parsed_object.name, table_name, rw_relation, 0.9)
-
-    all_objects = tuple(object_records + sorted(table_objects.values(), key=lambda item: item.name))
+    # 테이블 객체의 키는 객체 이름과 같으므로 문자열 키만 정렬한다.
+    all_objects = (*object_records, *(table_objects[name] for name in sorted(table_objects)))
 
     data_windows: list[DataWindowRecord] = []
     for parsed_object in parse_result.objects:
@@ -205,39 +281,133 @@ def analyze(
         objects=all_objects,
         events=tuple(events),
         functions=tuple(functions),
-        relations=tuple(relations),
+        relations=tuple(RelationRecord(*relation) for relation in relations_raw),
         sql_statements=tuple(sql_statements),
         data_windows=tuple(data_windows),
         warnings=warnings,
     )
 
 
-def _build_function_owner_map(functions: list[FunctionRecord]) -> dict[str, str]:
-    owner_map: dict[str, str] = {}
-    for function_item in functions:
-        key = function_item.function_name.lower()
-        owner_map.setdefault(key, function_item.object_name)
-    return owner_map
+def _init_worker_context(context: _AnalysisContext) -> None:
+    global _worker_context
+    _worker_context = context
 
 
-def _extract_sql_statements(script_text: str) -> list[_DetectedSql]:
-    without_block_comments = _SQL_COMMENT_BLOCK.sub(" ", script_text)
-    without_comments = _SQL_COMMENT_LINE.sub(" ", without_block_comments)
+def _analyze_object_in_worker(parsed_object: ParsedObject) -> _ObjectAnalysis:
+    if _worker_context is None:
+        raise RuntimeError("analysis worker context is not initialized")
+    return _analyze_object(parsed_object, _worker_context)
 
-    statements: list[_DetectedSql] = []
-    seen: set[tuple[SqlKind, str]] = set()
 
-    for chunk in without_comments.split(";"):
-        candidate = chunk.strip()
-        if not candidate:
+def _analyze_object(parsed_object: ParsedObject, context: _AnalysisContext) -> _ObjectAnalysis:
+    """Detects relations and SQL statements of one object without cross-object dedup."""
+
+    relations: list[tuple[str, RelationType, float]] = []
+    sql_statements: list[SqlStatementRecord] = []
+
+    def add_relation(dst_name: str, relation_type: RelationType, confidence: float) -> None:
+        relations.append((dst_name, relation_type, confidence))
+
+    script_text = parsed_object.script_text
+    script_text_lower = _ascii_lower(script_text)
+
+    called_names: list[str] = []
+    opened_names: list[str] = []
+    triggered_names: list[str] = []
+    # open/trigger는 종류별로 따로 스캔할 때처럼 직전 매치가 소비한 대상 이름과 겹치면 건너뛴다.
+    open_scan_end = 0
+    trigger_scan_end = 0
+    for matched in _SCRIPT_REFERENCE_PATTERN.finditer(script_text_lower):
+        call_name, opened_name, triggered_name = matched.group("call", "open", "trigger")
+        if call_name is not None:
+            called_names.append(call_name)
+        elif opened_name is not None:
+            if matched.start() >= open_scan_end:
+                opened_names.append(opened_name)
+                open_scan_end = matched.end("open")
+        elif triggered_name is not None:
+            if matched.start() >= trigger_scan_end:
+                triggered_names.append(triggered_name)
+                trigger_scan_end = matched.end("trigger")
+
+    for function_name in called_names:
+        if function_name in _CALL_KEYWORDS:
+            continue
+        owner_name = context.function_owner.get(function_name)
+        if owner_name is None:
+            continue
+        add_relation(owner_name, "calls", 0.85)
+
+    for opened_name in opened_names:
+        target_name = context.object_name_lookup.get(opened_name)
+        if target_name is None:
             continue
+        add_relation(target_name, "opens", 0.95)
+
+    if context.data_window_lookup:
+        dw_hits = {
+            word
+            for word in _WORD_PATTERN.findall(script_text_lower)
+            if word in context.data_window_lookup
+        }
+        dw_hits.update(
+            dw_name_lower
+            for dw_name_lower, pattern in context.data_window_patterns.items()
+            if pattern.search(script_text_lower) is not None
+        )
+        for dw_name_lower in sorted(dw_hits, key=context.data_window_order.__getitem__):
+            add_relation(context.data_window_lookup[dw_name_lower], "uses_dw", 0.9)
+
+    if triggered_names:
+        object_event_names = {_ascii_lower(event.event_name) for event in parsed_object.events}
+        if any(name in object_event_names for name in triggered_names):
+            add_relation(parsed_object.name, "triggers_event", 0.7)
+
+    for sql_item in _extract_sql_statements(script_text):
+        usages = _extract_table_usages(sql_item.kind, sql_item.text_norm, context.excluded_tables)
+        sql_statements.append(
+            SqlStatementRecord(
+                owner_name=parsed_object.name,
+                sql_text_norm=sql_item.text_norm,
+                sql_kind=sql_item.kind,
+                table_usages=usages,
+            )
+        )
+
+        for usage in usages:
+            rw_relation: RelationType = "reads_table" if usage.rw_type == "READ" else "writes_table"
+            add_relation(usage.table_name, rw_relation, 0.9)
+
+    return _ObjectAnalysis(relations=tuple(relations), sql_statements=tuple(sql_statements))
+
 
-        kind_match = _SQL_KIND_PATTERN.search(candidate)
+def _ascii_lower(text: str) -> str:
+    # ASCII 전용 문자열은 lower()가 같은 결과를 더 빨리 낸다.
+    if text.isascii():
+        return text.lower()
+    return text.translate(_ASCII_LOWER_TABLE)
+
+
+def _extract_sql_statements(script_text: str) -> tuple[_DetectedSql, ...]:
+    # SQL 키워드가 없는 스크립트는 캐시를 거치지 않고 바로 제외해 캐시 슬롯을 SQL 스크립트에만 쓴다.
+    if _SQL_KEYWORD_HINT_PATTERN.search(script_text) is None:
+        return ()
+    return _detect_sql_statements(script_text)
+
+
+# 복사된 스크립트/SQL이 많은 프로젝트에서 같은 입력의 재토큰화를 피한다. 결과는 불변 튜플로 공유한다.
+@lru_cache(maxsize=_SQL_SCRIPT_CACHE_SIZE)
+def _detect_sql_statements(script_text: str) -> tuple[_DetectedSql, ...]:
+    statements: list[_DetectedSql] = []
+    seen: set[tuple[SqlKind, str]] = set()
+
+    for chunk in _split_sql_chunks(script_text):
+        kind_match = _SQL_KIND_PATTERN.search(chunk)
         if kind_match is None:
             continue
 
         sql_kind = _normalize_sql_kind(kind_match.group(1))
-        sql_body = candidate[kind_match.start() :]
+        sql_body = chunk[kind_match.start() :]
         sql_norm = _normalize_sql(sql_body)
         if not sql_norm:
             continue
@@ -249,12 +419,76 @@ def _extract_sql_statements(script_text: str) -> list[_DetectedSql]:
 
         statements.append(_DetectedSql(kind=sql_kind, text_norm=sql_norm))
 
-    return statements
+    return tuple(statements)
+
+
+def _split_sql_chunks(script_text: str) -> list[str]:
+    """주석을 공백으로 치환하면서 ';' 단위 구간으로 나누는 단일 스캔 토크나이저.
+
+    블록 주석을 먼저 제거한 뒤 라인 주석을 제거하던 기존 순서를 유지한다. 즉
+    '--' 주석 안에서 열린 블록 주석이 다음 줄에서 닫히면 라인 주석은 그 줄 끝까지 이어진다.
+    닫히지 않은 '/*'는 주석이 아닌 일반 텍스트로 남긴다.
+    """
+
+    chunks: list[str] = []
+    parts: list[str] = []
+    position = 0
+    block_may_close = True
+
+    def find_block_end(block_start: int) -> int:
+        nonlocal block_may_close
+        if not block_may_close:
+            return -1
+        block_end = script_text.find("*/", block_start + 2)
+        if block_end < 0:
+            block_may_close = False
+            return -1
+        return block_end + 2
+
+    scan_from = 0
+    while True:
+        matched = _SQL_TOKEN_PATTERN.search(script_text, scan_from)
+        if matched is None:
+            break
+
+        token_start = matched.start()
+        token = matched.group()
+        if token == ";":
+            parts.append(script_text[position:token_start])
+            chunks.append("".join(parts))
+            parts = []
+            position = scan_from = matched.end()
+            continue
+
+        if token == "/*":
+            comment_end = find_block_end(token_start)
+            if comment_end < 0:
+                scan_from = matched.end()
+                continue
+        else:
+            comment_end = matched.end()
+            while True:
+                line_end = script_text.find("\n", comment_end)
+                if line_end < 0:
+                    line_end = len(script_text)
+                block_start = script_text.find("/*", comment_end, line_end)
+                block_end = find_block_end(block_start) if block_start >= 0 else -1
+                if block_end < 0:
+                    comment_end = line_end
+                    break
+                comment_end = block_end
+
+        parts.append(script_text[position:token_start])
+        parts.append(" ")
+        position = scan_from = comment_end
+
+    parts.append(script_text[position:])
+    chunks.append("".join(parts))
+    return chunks
 
 
 def _normalize_sql(sql_text: str) -> str:
-    compact = re.sub(r"\s+", " ", sql_text).strip()
-    return compact.upper()
+    return " ".join(sql_text.split()).upper()
 
 
 def _normalize_sql_kind(raw_kind: str) -> SqlKind:
@@ -264,43 +498,34 @@ def _normalize_sql_kind(raw_kind: str) -> SqlKind:
     return "OTHER"
 
 
-def _extract_table_usages(sql_kind: SqlKind, sql_text_norm: str) -> list[TableUsage]:
+@lru_cache(maxsize=_TABLE_USAGE_CACHE_SIZE)
+def _extract_table_usages(
+    sql_kind: SqlKind,
+    sql_text_norm: str,
+    excluded_tables: frozenset[str] = frozenset(),
+) -> tuple[TableUsage, ...]:
     usages: list[TableUsage] = []
+    seen: set[tuple[str, RwType]] = set()
 
     def add_usage(table_name: str, rw_type: RwType) -> None:
         normalized_name = table_name.strip().strip(",)")
-        if not normalized_name:
+        # 정규화된 SQL은 대문자이므로 추출된 테이블 이름도 이미 대문자다.
+        if not normalized_name or normalized_name in excluded_tables:
+            return
+        key = (normalized_name, rw_type)
+        if key in seen:
             return
-        usage = TableUsage(table_name=normalized_name, rw_type=rw_type)
-        if usage not in usages:
-            usages.append(usage)
-
-    if sql_kind == "SELECT":
-        for select_match in re.finditer(r"\b(?:FROM|JOIN)\s+([A-Z_][A-Z0-9_$.#]*)", sql_text_norm):
-            add_usage(select_match.group(1), "READ")
-
-    elif sql_kind == "INSERT":
-        insert_match = re.search(r"\bINSERT\s+INTO\s+([A-Z_][A-Z0-9_$.#]*)", sql_text_norm)
-        if insert_match is not None:
-            add_usage(insert_match.group(1), "WRITE")
-
-    elif sql_kind == "UPDATE":
-        update_match = re.search(r"\bUPDATE\s+([A-Z_][A-Z0-9_$.#]*)", sql_text_norm)
-        if update_match is not None:
-            add_usage(update_match.group(1), "WRITE")
-
-    elif sql_kind == "DELETE":
-        delete_match = re.search(r"\bDELETE\s+FROM\s+([A-Z_][A-Z0-9_$.#]*)", sql_text_norm)
-        if delete_match is not None:
-            add_usage(delete_match.group(1), "WRITE")
-
-    elif sql_kind == "MERGE":
-        into_match = re.search(r"\bMERGE\s+INTO\s+([A-Z_][A-Z0-9_$.#]*)", sql_text_norm)
-        if into_match is not None:
-            add_usage(into_match.group(1), "WRITE")
-
-        using_match = re.search(r"\bUSING\s+([A-Z_][A-Z0-9_$.#]*)", sql_text_norm)
-        if using_match is not None:
-            add_usage(using_match.group(1), "READ")
-
-    return usages
+        seen.add(key)
+        usages.append(TableUsage(table_name=normalized_name, rw_type=rw_type))
+
+    for pattern, rw_type, collect_all in _TABLE_USAGE_RULES.get(sql_kind, ()):
+        if collect_all:
+            for table_match in pattern.finditer(sql_text_norm):
+                add_usage(table_match.group(1), rw_type)
+            continue
+
+        first_match = pattern.search(sql_text_norm)
+        if first_match is not None:
+            add_usage(first_match.group(1), rw_type)
+
+    return tuple(usages)
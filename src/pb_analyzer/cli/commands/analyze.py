@@ -14,6 +14,7 @@ def configure(subparsers: argparse._SubParsersAction[argparse.ArgumentParser]) -
     parser.add_argument("--db", required=True)
     parser.add_argument("--run-id", required=False)
     parser.add_argument("--source-version", required=False)
+    parser.add_argument("--workers", type=int, default=1)
     parser.set_defaults(handler=execute)
 
 
@@ -23,6 +24,7 @@ def execute(args: argparse.Namespace) -> int:
         db_path=Path(args.db),
         run_id=args.run_id,
         source_version=args.source_version,
+        workers=args.workers,
     )
 
     print(f"[OK] run_id={outcome.run_context.run_id}")
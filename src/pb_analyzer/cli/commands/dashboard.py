@@ -15,6 +15,7 @@ def configure(subparsers: argparse._SubParsersAction[argparse.ArgumentParser]) -
     parser.add_argument("--port", type=int, default=8787)
     parser.add_argument("--run-id", required=False)
     parser.add_argument("--limit", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=1)
     parser.set_defaults(handler=execute)
 
 
@@ -25,5 +26,6 @@ def execute(args: argparse.Namespace) -> int:
         port=args.port,
         run_id=args.run_id,
         limit=args.limit,
+        workers=args.workers,
     )
     return 0
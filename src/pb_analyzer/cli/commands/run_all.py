@@ -20,6 +20,7 @@ def configure(subparsers: argparse._SubParsersAction[argparse.ArgumentParser]) -
         required=False,
         help="ORCA command template. Use {input} and {output} placeholders.",
     )
+    parser.add_argument("--workers", type=int, default=1)
     parser.set_defaults(handler=execute)
 
 
@@ -31,6 +32,7 @@ def execute(args: argparse.Namespace) -> int:
         extractor_name=args.extractor,
         report_format=args.format,
         orca_cmd=args.orca_cmd,
+        workers=args.workers,
     )
 
     print(f"[OK] run_id={outcome.run_id}")
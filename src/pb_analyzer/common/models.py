@@ -19,13 +19,13 @@ SqlKind = Literal["SELECT", "INSERT", "UPDATE", "DELETE", "MERGE", "OTHER"]
 RwType = Literal["READ", "WRITE"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FailedObject:
     source_path: str
     reason: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ManifestObject:
     object_type: str
     name: str
@@ -34,7 +34,7 @@ class ManifestObject:
     extracted_path: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ManifestData:
     source_root: str
     generated_at: str
@@ -43,19 +43,19 @@ class ManifestData:
     failed_objects: tuple[FailedObject, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParsedEvent:
     event_name: str
     script_ref: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParsedFunction:
     function_name: str
     signature: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParseIssue:
     object_name: str
     source_path: str
@@ -63,14 +63,14 @@ class ParseIssue:
     line_no: int | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParsedDataWindow:
     dw_name: str
     base_table: str | None
     sql_select: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParsedObject:
     object_type: str
     name: str
@@ -83,13 +83,13 @@ class ParsedObject:
     data_windows: tuple[ParsedDataWindow, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParseResult:
     objects: tuple[ParsedObject, ...]
     issues: tuple[ParseIssue, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ObjectRecord:
     object_type: str
     name: str
@@ -97,21 +97,21 @@ class ObjectRecord:
     source_path: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventRecord:
     object_name: str
     event_name: str
     script_ref: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FunctionRecord:
     object_name: str
     function_name: str
     signature: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RelationRecord:
     src_name: str
     dst_name: str
@@ -119,13 +119,13 @@ class RelationRecord:
     confidence: float = 1.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TableUsage:
     table_name: str
     rw_type: RwType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SqlStatementRecord:
     owner_name: str
     sql_text_norm: str
@@ -133,7 +133,7 @@ class SqlStatementRecord:
     table_usages: tuple[TableUsage, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DataWindowRecord:
     object_name: str
     dw_name: str
@@ -141,7 +141,7 @@ class DataWindowRecord:
     sql_select: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnalysisResult:
     objects: tuple[ObjectRecord, ...]
     events: tuple[EventRecord, ...]
@@ -152,7 +152,7 @@ class AnalysisResult:
     warnings: tuple[str, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunContext:
     run_id: str
     started_at: str
@@ -161,7 +161,7 @@ class RunContext:
     source_version: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PersistResult:
     objects_count: int
     events_count: int
@@ -172,7 +172,7 @@ class PersistResult:
     data_windows_count: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnalyzeOutcome:
     run_context: RunContext
     persist_result: PersistResult
@@ -184,12 +184,12 @@ class AnalyzeOutcome:
         return bool(self.parse_issues or self.extraction_failures)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReportOutcome:
     generated_files: tuple[Path, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiffItem:
     category: str
     name: str
@@ -197,7 +197,7 @@ class DiffItem:
     detail: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiffResult:
     run_id_old: str
     run_id_new: str
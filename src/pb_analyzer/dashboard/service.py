@@ -2,23 +2,146 @@
 
 from __future__ import annotations
 
+import base64
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
+import gzip
+import hashlib
 from html import escape
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import json
+import multiprocessing
 from pathlib import Path
+import queue
+import re
+import socket
 import sqlite3
+import threading
+import time
 from typing import Any
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import parse_qs, quote, urlparse
 
 from pb_analyzer.common import UserInputError
+from pb_analyzer.storage import ensure_indexes
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson는 선택 설치(.[fast])
+    orjson = None  # type: ignore[assignment]
 
 RunItem = dict[str, Any]
 DashboardPayload = dict[str, Any]
+_PanelQuery = Callable[..., Any]
 
 _MAX_API_LIMIT = 2000
 _DEFAULT_API_LIMIT = 200
 
+DASHBOARD_PANELS = frozenset(
+    {
+        "summary",
+        "relation_counts",
+        "screen_inventory",
+        "event_function_map",
+        "table_impact",
+        "screen_call_graph",
+        "graph_data",
+        "unused_object_candidates",
+    }
+)
+
+# 한 번의 화면 로드에서 여러 /api/* 호출이 같은 쿼리 묶음을 재실행하지 않도록 짧게 캐시한다.
+_PAYLOAD_CACHE_TTL_SECONDS = 10.0
+_PAYLOAD_CACHE_MAX_ENTRIES = 64
+_payload_cache: OrderedDict[tuple[Any, ...], tuple[float, DashboardPayload]] = OrderedDict()
+_payload_cache_lock = threading.Lock()
+# 같은 키를 동시에 놓친 요청은 먼저 시작한 계산 하나를 기다려 결과를 나눠 받는다.
+_payload_inflight: dict[tuple[Any, ...], Future[DashboardPayload]] = {}
+
+# run_id 해석 결과는 DB 버전이 같으면 그대로이므로 필터가 달라 payload 캐시를 놓쳐도 재사용한다.
+_RUN_CACHE_MAX_ENTRIES = 16
+_run_cache: OrderedDict[tuple[Any, ...], dict[str, Any]] = OrderedDict()
+_run_cache_lock = threading.Lock()
+
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+_JSON_STREAM_THRESHOLD = 1024 * 1024
+_JSON_WRITE_CHUNK_SIZE = 64 * 1024
+# /api/all-stream 은 개요 탭이 먼저 그려지도록 이 순서로 섹션을 한 줄씩 내보낸다.
+_STREAM_PATH = "/api/all-stream"
+_STREAM_SECTION_ORDER = (
+    "run",
+    "limit",
+    "filters",
+    "summary",
+    "relation_counts",
+    "unused_object_candidates",
+    "graph_data",
+    "event_function_map",
+    "screen_call_graph",
+    "table_impact",
+    "screen_inventory",
+    "next_cursor",
+    "filtered_counts",
+)
+# 큰 그래프는 노드/간선을 묶음 단위 줄로 나눠 보내 한 줄의 JSON.parse 가 길어지지 않게 한다.
+_STREAM_BATCHED_SECTIONS = frozenset({"graph_data"})
+_STREAM_BATCH_SIZE = 500
+
+_GLOB_SPECIAL_PATTERN = re.compile(r"[*?\[]")
+# LIKE 검색어의 와일드카드(%, _)와 이스케이프 문자는 글자 그대로 찾도록 '\'로 이스케이프한다.
+_LIKE_SPECIAL_PATTERN = re.compile(r"[\\%_]")
+# 문자열은 그대로 두고, 주석/구분자 주변 공백/연속 공백만 골라낸다.
+_CSS_TOKEN_PATTERN = re.compile(
+    r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|/\*.*?\*/|\s*([{};,>])\s*|(:)\s+|\s+""",
+    re.DOTALL,
+)
+
+_DEFERRED_CSS_PATH = "/dashboard/deferred.css"
+_SHELL_PLACEHOLDER_PATTERN = re.compile(
+    r"__(TITLE|STYLE|DEFERRED_CSS_URL|D3_SCRIPT_URL|D3_FORCE_SCRIPT_URL)__"
+)
+# 그래프에 쓰는 select/force/drag/zoom과 그 의존 모듈만 UMD 빌드로 묶어 받는다(전체 d3 번들 대비 약 1/3).
+_D3_MODULES = (
+    "d3-dispatch",
+    "d3-selection",
+    "d3-timer",
+    "d3-quadtree",
+    "d3-force",
+    "d3-drag",
+    "d3-color",
+    "d3-interpolate",
+    "d3-ease",
+    "d3-transition",
+    "d3-zoom",
+)
+_D3_SCRIPT_URL = "https://cdn.jsdelivr.net/combine/" + ",".join(
+    f"npm/{module}@3" for module in _D3_MODULES
+)
+# 전체 그래프 레이아웃 워커는 DOM 없이 force 시뮬레이션만 돌리므로 그 의존 모듈만 받는다.
+_D3_FORCE_MODULES = ("d3-dispatch", "d3-timer", "d3-quadtree", "d3-force")
+_D3_FORCE_SCRIPT_URL = "https://cdn.jsdelivr.net/combine/" + ",".join(
+    f"npm/{module}@3" for module in _D3_FORCE_MODULES
+)
+# 셸은 매번 ETag로 재검증(304)하게 해 서버가 바뀌면 바로 새 셸을 받는다.
+_SHELL_CACHE_CONTROL = "public, max-age=0, must-revalidate"
+_ASSET_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+_READ_POOL_SIZE = 8
+_PANEL_QUERY_WORKERS = 7
+_panel_executor: ThreadPoolExecutor | None = None
+_panel_executor_lock = threading.Lock()
+# 패널 SQL은 필터 조합마다 텍스트가 고정되므로, 조합 수만큼 컴파일된 문장을 재사용할 수 있게 캐시를 넉넉히 둔다.
+_CACHED_STATEMENTS = 256
+_READ_CONNECTION_PRAGMAS = (
+    "PRAGMA query_only = 1",
+    "PRAGMA cache_size = -65536",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",
+)
+
 _VALID_RELATION_TYPES = {
     "calls",
     "opens",
@@ -35,6 +158,60 @@ class DashboardFilters:
     object_name: str | None = None
     table_name: str | None = None
     relation_type: str | None = None
+    # 패널별 (type, name) 페이지 커서. 한 패널을 넘겨도 다른 패널의 페이지는 그대로다.
+    inventory_after: tuple[str, str] | None = None
+    unused_after: tuple[str, str] | None = None
+
+
+
+class _ReadConnectionPool:
+    """Reuses read-only SQLite connections across dashboard request threads."""
+
+    def __init__(self, db_path: Path, size: int = _READ_POOL_SIZE) -> None:
+        self._db_uri = f"file:{quote(db_path.resolve().as_posix())}?mode=ro"
+        self._size = size
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+
+        try:
+            yield conn
+        finally:
+            # 풀 크기를 넘는 동시 요청용 연결은 반납하지 않고 닫는다.
+            if self._idle.qsize() < self._size:
+                self._idle.put(conn)
+            else:
+                conn.close()
+
+    def prefill(self) -> None:
+        """Opens the pooled connections up front so the first page load skips connect costs."""
+
+        while self._idle.qsize() < self._size:
+            self._idle.put(self._connect())
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self._db_uri,
+            uri=True,
+            check_same_thread=False,
+            cached_statements=_CACHED_STATEMENTS,
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in _READ_CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
 
 
 
@@ -44,28 +221,110 @@ def run_dashboard(
     port: int = 8787,
     run_id: str | None = None,
     limit: int = _DEFAULT_API_LIMIT,
+    workers: int = 1,
 ) -> None:
-    """Starts the dashboard web server."""
+    """Starts the dashboard web server.
+
+    workers가 2 이상이면 SO_REUSEPORT로 같은 포트를 여는 프로세스를 그 수만큼 띄워
+    커널이 연결을 나눠 주게 한다.
+    """
 
     _ensure_db_path(db_path)
     normalized_limit = _sanitize_limit(limit, _DEFAULT_API_LIMIT)
+    if workers < 1:
+        raise UserInputError(f"workers must be at least 1: {workers}")
+    if workers > 1 and not hasattr(socket, "SO_REUSEPORT"):
+        raise UserInputError("Multiple dashboard workers require SO_REUSEPORT support.")
+
+    # 이전 버전으로 만든 DB에도 패널 쿼리용 인덱스를 한 번 보강한다. 읽기 전용 DB면 그대로 둔다.
+    try:
+        ensure_indexes(db_path)
+    except sqlite3.Error:
+        pass
+
+    # 워커를 먼저 띄운 뒤 부모의 연결 풀과 리슨 소켓을 연다. 순서가 반대면 포크된 워커가
+    # 부모의 SQLite 연결과 소켓을 물려받아, 부모가 죽어도 그 소켓 큐로 연결이 배정된다.
+    worker_processes = [
+        multiprocessing.Process(
+            target=_run_dashboard_worker,
+            args=(db_path, host, port, run_id, normalized_limit),
+            daemon=True,
+        )
+        for _ in range(workers - 1)
+    ]
+    for process in worker_processes:
+        process.start()
+
+    try:
+        server, connection_pool = _open_dashboard_server(
+            db_path, host, port, run_id, normalized_limit, reuse_port=workers > 1
+        )
+        print(f"[OK] dashboard_url=http://{host}:{port}")
+        print("[OK] press Ctrl+C to stop")
+        _serve_dashboard(server, connection_pool)
+    finally:
+        for process in worker_processes:
+            process.terminate()
+            process.join()
+
 
+
+class _ReusePortHTTPServer(ThreadingHTTPServer):
+    allow_reuse_port = True
+
+
+
+def _open_dashboard_server(
+    db_path: Path,
+    host: str,
+    port: int,
+    run_id: str | None,
+    limit: int,
+    reuse_port: bool = False,
+) -> tuple[ThreadingHTTPServer, _ReadConnectionPool]:
+    # 연결 풀은 프로세스마다 따로 연다(포크된 SQLite 연결은 공유할 수 없다).
+    connection_pool = _ReadConnectionPool(db_path)
     handler_class = _build_handler(
         db_path=db_path,
         default_run_id=run_id,
-        default_limit=normalized_limit,
+        default_limit=limit,
+        connection_pool=connection_pool,
     )
 
-    server = ThreadingHTTPServer((host, port), handler_class)
-    print(f"[OK] dashboard_url=http://{host}:{port}")
-    print("[OK] press Ctrl+C to stop")
+    server_class = _ReusePortHTTPServer if reuse_port else ThreadingHTTPServer
+    try:
+        # 첫 화면 로드는 패널 쿼리를 동시에 돌리므로 풀 크기만큼 미리 열어 둔다.
+        connection_pool.prefill()
+        server = server_class((host, port), handler_class)
+    except BaseException:
+        connection_pool.close()
+        raise
+    return server, connection_pool
+
+
 
+def _serve_dashboard(server: ThreadingHTTPServer, connection_pool: _ReadConnectionPool) -> None:
     try:
         server.serve_forever()
     except KeyboardInterrupt:
         pass
     finally:
         server.server_close()
+        connection_pool.close()
+
+
+
+def _run_dashboard_worker(
+    db_path: Path,
+    host: str,
+    port: int,
+    run_id: str | None,
+    limit: int,
+) -> None:
+    server, connection_pool = _open_dashboard_server(
+        db_path, host, port, run_id, limit, reuse_port=True
+    )
+    _serve_dashboard(server, connection_pool)
 
 
 
@@ -77,17 +336,30 @@ def list_runs(db_path: Path, limit: int = 20) -> list[RunItem]:
 
     with sqlite3.connect(str(db_path)) as conn:
         conn.row_factory = sqlite3.Row
-        rows = conn.execute(
-            """
-            SELECT run_id, started_at, finished_at, status, source_version
-            FROM runs
-            ORDER BY started_at DESC, rowid DESC
-            LIMIT ?
-            """,
-            (normalized_limit,),
-        ).fetchall()
+        return _query_runs(conn, normalized_limit)
 
-    return [dict(row) for row in rows]
+
+
+def _query_runs(conn: sqlite3.Connection, limit: int) -> list[RunItem]:
+    return _fetch_dicts(
+        conn,
+        """
+        SELECT run_id, started_at, finished_at, status, source_version
+        FROM runs
+        ORDER BY started_at DESC, rowid DESC
+        LIMIT ?
+        """,
+        [limit],
+    )
+
+
+
+def _fetch_dicts(conn: sqlite3.Connection, sql: str, params: list[Any]) -> list[dict[str, Any]]:
+    cursor = conn.execute(sql, params)
+    # sqlite3.Row를 거쳐 dict를 만들지 않고, 튜플 행을 컬럼 이름과 바로 묶는다.
+    cursor.row_factory = None
+    columns = [column[0] for column in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor]
 
 
 
@@ -96,90 +368,219 @@ def get_dashboard_payload(
     run_id: str | None = None,
     limit: int = _DEFAULT_API_LIMIT,
     filters: DashboardFilters | None = None,
+    include: set[str] | frozenset[str] | None = None,
 ) -> DashboardPayload:
-    """Returns dashboard data for one run."""
+    """Returns dashboard data for one run, limited to the panels in ``include``."""
 
     _ensure_db_path(db_path)
     normalized_limit = _sanitize_limit(limit, _DEFAULT_API_LIMIT)
     normalized_filters = _normalize_filters(filters)
+    normalized_include = _normalize_include(include)
 
-    with sqlite3.connect(str(db_path)) as conn:
+    with sqlite3.connect(str(db_path), cached_statements=_CACHED_STATEMENTS) as conn:
         conn.row_factory = sqlite3.Row
-        resolved_run_id = _resolve_run_id(conn, run_id)
-
-        run_row = conn.execute(
-            """
-            SELECT run_id, started_at, finished_at, status, source_version
-            FROM runs
-            WHERE run_id = ?
-            LIMIT 1
-            """,
-            (resolved_run_id,),
-        ).fetchone()
-
-        if run_row is None:
-            raise UserInputError(f"Run not found: {resolved_run_id}")
-
-        summary = _query_summary(conn, resolved_run_id)
-        relation_counts = _query_relation_counts(conn, resolved_run_id, normalized_filters)
-        screen_inventory = _query_screen_inventory(
-            conn,
-            resolved_run_id,
-            normalized_limit,
-            normalized_filters,
-        )
-        event_function_map = _query_event_function_map(
-            conn,
-            resolved_run_id,
-            normalized_limit,
-            normalized_filters,
-        )
-        table_impact = _query_table_impact(
-            conn,
-            resolved_run_id,
-            normalized_limit,
-            normalized_filters,
-        )
-        screen_call_graph = _query_screen_call_graph(
+        return _build_dashboard_payload(
             conn,
-            resolved_run_id,
-            normalized_limit,
-            normalized_filters,
-        )
-        unused_candidates = _query_unused_candidates(
-            conn,
-            resolved_run_id,
+            run_id,
             normalized_limit,
             normalized_filters,
+            normalized_include,
+            db_version=_db_cache_key(db_path),
         )
 
-    graph_data = _build_graph_data(screen_call_graph)
 
-    return {
-        "run": dict(run_row),
-        "summary": summary,
-        "relation_counts": relation_counts,
-        "screen_inventory": screen_inventory,
-        "event_function_map": event_function_map,
-        "table_impact": table_impact,
-        "screen_call_graph": screen_call_graph,
-        "graph_data": graph_data,
-        "unused_object_candidates": unused_candidates,
-        "limit": normalized_limit,
-        "filters": {
-            "search": normalized_filters.search,
-            "object_name": normalized_filters.object_name,
-            "table_name": normalized_filters.table_name,
-            "relation_type": normalized_filters.relation_type,
-        },
-        "filtered_counts": {
-            "screen_inventory": len(screen_inventory),
-            "event_function_map": len(event_function_map),
-            "table_impact": len(table_impact),
-            "screen_call_graph": len(screen_call_graph),
-            "unused_object_candidates": len(unused_candidates),
-        },
+
+def _build_dashboard_payload(
+    conn: sqlite3.Connection,
+    run_id: str | None,
+    normalized_limit: int,
+    normalized_filters: DashboardFilters,
+    include: frozenset[str] = DASHBOARD_PANELS,
+    connection_pool: _ReadConnectionPool | None = None,
+    db_version: tuple[Any, ...] | None = None,
+) -> DashboardPayload:
+    run_row = _resolve_run(conn, run_id, db_version)
+    resolved_run_id = str(run_row["run_id"])
+
+    panel_queries: dict[str, tuple[_PanelQuery, tuple[Any, ...]]] = {
+        "summary": (_query_summary, ()),
+        "relation_counts": (_query_relation_counts, (normalized_filters,)),
+        "screen_inventory": (_query_screen_inventory, (normalized_limit, normalized_filters)),
+        "event_function_map": (_query_event_function_map, (normalized_limit, normalized_filters)),
+        "table_impact": (_query_table_impact, (normalized_limit, normalized_filters)),
+        "screen_call_graph": (_query_screen_call_graph, (normalized_limit, normalized_filters)),
+        "unused_object_candidates": (
+            _query_unused_candidates,
+            (normalized_limit, normalized_filters),
+        ),
+    }
+    # graph_data는 호출 그래프 간선에서 만들어진다.
+    required = include | {"screen_call_graph"} if "graph_data" in include else include
+    panels = _run_panel_queries(
+        conn,
+        connection_pool,
+        resolved_run_id,
+        {key: panel_query for key, panel_query in panel_queries.items() if key in required},
+    )
+
+    payload: DashboardPayload = {"run": run_row}
+    payload.update((key, panels[key]) for key in panel_queries if key in include)
+    # 그래프를 요청한 경우에만 간선/노드를 그래프 구조로 조립한다.
+    if "graph_data" in include:
+        payload["graph_data"] = _build_graph_data(panels["screen_call_graph"])
+    payload.update(
+        {
+            "limit": normalized_limit,
+            "filters": {
+                "search": normalized_filters.search,
+                "object_name": normalized_filters.object_name,
+                "table_name": normalized_filters.table_name,
+                "relation_type": normalized_filters.relation_type,
+                "inventory_after": _filters_cursor(normalized_filters.inventory_after),
+                "unused_after": _filters_cursor(normalized_filters.unused_after),
+            },
+            "next_cursor": {
+                key: _next_cursor(panels[key], normalized_limit)
+                for key in ("screen_inventory", "unused_object_candidates")
+                if key in include
+            },
+            "filtered_counts": {
+                key: len(panels[key])
+                for key in (
+                    "screen_inventory",
+                    "event_function_map",
+                    "table_impact",
+                    "screen_call_graph",
+                    "unused_object_candidates",
+                )
+                if key in include
+            },
+        }
+    )
+    return payload
+
+
+
+def _run_panel_queries(
+    conn: sqlite3.Connection,
+    connection_pool: _ReadConnectionPool | None,
+    run_id: str,
+    panel_queries: dict[str, tuple[_PanelQuery, tuple[Any, ...]]],
+) -> dict[str, Any]:
+    if connection_pool is None:
+        return {key: query(conn, run_id, *args) for key, (query, args) in panel_queries.items()}
+
+    # 패널 쿼리는 서로 독립이므로 풀의 연결을 하나씩 빌려 동시에 실행한다.
+    def run_query(query: _PanelQuery, args: tuple[Any, ...]) -> Any:
+        with connection_pool.connection() as panel_conn:
+            return query(panel_conn, run_id, *args)
+
+    executor = _get_panel_executor()
+    futures = {
+        key: executor.submit(run_query, query, args)
+        for key, (query, args) in panel_queries.items()
     }
+    return {key: future.result() for key, future in futures.items()}
+
+
+
+def _get_panel_executor() -> ThreadPoolExecutor:
+    global _panel_executor
+    with _panel_executor_lock:
+        if _panel_executor is None:
+            _panel_executor = ThreadPoolExecutor(
+                max_workers=_PANEL_QUERY_WORKERS,
+                thread_name_prefix="dashboard-query",
+            )
+        return _panel_executor
+
+
+
+def _get_cached_dashboard_payload(
+    db_path: Path,
+    run_id: str | None,
+    limit: int,
+    filters: DashboardFilters | None,
+    connection_pool: _ReadConnectionPool | None = None,
+    include: set[str] | frozenset[str] | None = None,
+) -> DashboardPayload:
+    """Returns a shared dashboard payload, reusing it while the DB is unchanged and fresh."""
+
+    _ensure_db_path(db_path)
+    normalized_limit = _sanitize_limit(limit, _DEFAULT_API_LIMIT)
+    normalized_filters = _normalize_filters(filters)
+    normalized_include = _normalize_include(include)
+    # DB 파일(및 WAL) 수정 시각을 키에 넣어 새 분석 실행이 바로 보이게 한다.
+    db_version = _db_cache_key(db_path)
+    cache_key = (
+        *db_version,
+        run_id,
+        normalized_limit,
+        normalized_filters,
+        normalized_include,
+    )
+
+    now = time.monotonic()
+    with _payload_cache_lock:
+        cached = _payload_cache.get(cache_key)
+        if cached is not None and cached[0] > now:
+            _payload_cache.move_to_end(cache_key)
+            return cached[1]
+        inflight = _payload_inflight.get(cache_key)
+        if inflight is None:
+            future: Future[DashboardPayload] = Future()
+            _payload_inflight[cache_key] = future
+
+    if inflight is not None:
+        return inflight.result()
+
+    try:
+        if connection_pool is None:
+            payload = get_dashboard_payload(
+                db_path=db_path,
+                run_id=run_id,
+                limit=normalized_limit,
+                filters=normalized_filters,
+                include=normalized_include,
+            )
+        else:
+            with connection_pool.connection() as conn:
+                payload = _build_dashboard_payload(
+                    conn,
+                    run_id,
+                    normalized_limit,
+                    normalized_filters,
+                    normalized_include,
+                    connection_pool,
+                    db_version,
+                )
+    except BaseException as exc:
+        with _payload_cache_lock:
+            del _payload_inflight[cache_key]
+        future.set_exception(exc)
+        raise
+
+    with _payload_cache_lock:
+        _payload_cache[cache_key] = (now + _PAYLOAD_CACHE_TTL_SECONDS, payload)
+        _payload_cache.move_to_end(cache_key)
+        while len(_payload_cache) > _PAYLOAD_CACHE_MAX_ENTRIES:
+            _payload_cache.popitem(last=False)
+        del _payload_inflight[cache_key]
+    future.set_result(payload)
+
+    return payload
+
+
+
+def _db_cache_key(db_path: Path) -> tuple[str, tuple[int, int]]:
+    return str(db_path.resolve()), _db_version(db_path)
+
+
+
+def _db_version(db_path: Path) -> tuple[int, int]:
+    wal_path = db_path.with_name(f"{db_path.name}-wal")
+    wal_mtime_ns = wal_path.stat().st_mtime_ns if wal_path.exists() else 0
+    return db_path.stat().st_mtime_ns, wal_mtime_ns
 
 
 
@@ -204,6 +605,17 @@ def _normalize_filter_value(value: str | None) -> str | None:
 
 
 
+def _normalize_include(include: set[str] | frozenset[str] | None) -> frozenset[str]:
+    if include is None:
+        return DASHBOARD_PANELS
+
+    unknown = set(include) - DASHBOARD_PANELS
+    if unknown:
+        raise ValueError(f"Unknown dashboard panels: {', '.join(sorted(unknown))}")
+    return frozenset(include)
+
+
+
 def _normalize_filters(filters: DashboardFilters | None) -> DashboardFilters:
     if filters is None:
         return DashboardFilters()
@@ -219,24 +631,57 @@ def _normalize_filters(filters: DashboardFilters | None) -> DashboardFilters:
         object_name=_normalize_filter_value(filters.object_name),
         table_name=_normalize_filter_value(filters.table_name),
         relation_type=relation_type,
+        inventory_after=filters.inventory_after,
+        unused_after=filters.unused_after,
     )
 
 
 
-def _resolve_run_id(conn: sqlite3.Connection, run_id: str | None) -> str:
+def _resolve_run(
+    conn: sqlite3.Connection,
+    run_id: str | None,
+    db_version: tuple[Any, ...] | None = None,
+) -> dict[str, Any]:
+    cache_key = None if db_version is None else (*db_version, run_id)
+    if cache_key is not None:
+        with _run_cache_lock:
+            cached = _run_cache.get(cache_key)
+            if cached is not None:
+                _run_cache.move_to_end(cache_key)
+                return dict(cached)
+
+    run_row = _query_run_row(conn, run_id)
+    if cache_key is not None:
+        with _run_cache_lock:
+            _run_cache[cache_key] = run_row
+            _run_cache.move_to_end(cache_key)
+            while len(_run_cache) > _RUN_CACHE_MAX_ENTRIES:
+                _run_cache.popitem(last=False)
+
+    return dict(run_row)
+
+
+
+def _query_run_row(conn: sqlite3.Connection, run_id: str | None) -> dict[str, Any]:
+    # run 해석과 행 조회를 한 쿼리로 한다. 최신 run은 idx_runs_started_at을 역순으로 훑어 첫 행에서 멈춘다.
     if run_id is not None and run_id.strip():
         candidate = run_id.strip()
         row = conn.execute(
-            "SELECT run_id FROM runs WHERE run_id = ? LIMIT 1",
+            """
+            SELECT run_id, started_at, finished_at, status, source_version
+            FROM runs
+            WHERE run_id = ?
+            LIMIT 1
+            """,
             (candidate,),
         ).fetchone()
         if row is None:
             raise UserInputError(f"Run not found: {candidate}")
-        return str(row["run_id"])
+        return dict(row)
 
     row = conn.execute(
         """
-        SELECT run_id
+        SELECT run_id, started_at, finished_at, status, source_version
         FROM runs
         ORDER BY started_at DESC, rowid DESC
         LIMIT 1
@@ -246,45 +691,48 @@ def _resolve_run_id(conn: sqlite3.Connection, run_id: str | None) -> str:
     if row is None:
         raise UserInputError("No analysis run found in DB. Run analyze or run-all first.")
 
-    return str(row["run_id"])
+    return dict(row)
 
 
 
 def _query_summary(conn: sqlite3.Connection, run_id: str) -> dict[str, int]:
+    # 저장 시 집계해 둔 run_summary를 먼저 보고, 그 테이블이 없던 이전 DB면 직접 센다.
+    try:
+        row = conn.execute(
+            """
+            SELECT total_objects, table_objects, app_objects, relations, sql_statements, sql_tables
+            FROM run_summary
+            WHERE run_id = ?
+            """,
+            (run_id,),
+        ).fetchone()
+    except sqlite3.OperationalError:
+        row = None
+    if row is not None:
+        return {key: int(row[key]) for key in row.keys()}
+
+    # 집계 SELECT는 객체가 없어도 한 행을 돌려주므로(NULL 합계) 행 유무를 따로 볼 필요가 없다.
     row = conn.execute(
         """
+        WITH type_counts AS (
+            SELECT type, COUNT(*) AS count
+            FROM objects
+            WHERE run_id = ?1
+            GROUP BY type
+        )
         SELECT
-            COUNT(*) AS total_objects,
-            SUM(CASE WHEN type = 'Table' THEN 1 ELSE 0 END) AS table_objects,
-            SUM(CASE WHEN type <> 'Table' THEN 1 ELSE 0 END) AS app_objects
-        FROM objects
-        WHERE run_id = ?
+            SUM(count) AS total_objects,
+            SUM(CASE WHEN type = 'Table' THEN count ELSE 0 END) AS table_objects,
+            SUM(CASE WHEN type <> 'Table' THEN count ELSE 0 END) AS app_objects,
+            (SELECT COUNT(*) FROM relations WHERE run_id = ?1) AS relations,
+            (SELECT COUNT(*) FROM sql_statements WHERE run_id = ?1) AS sql_statements,
+            (SELECT COUNT(*) FROM sql_tables WHERE run_id = ?1) AS sql_tables
+        FROM type_counts
         """,
         (run_id,),
     ).fetchone()
 
-    if row is None:
-        return {
-            "total_objects": 0,
-            "table_objects": 0,
-            "app_objects": 0,
-            "relations": 0,
-            "sql_statements": 0,
-            "sql_tables": 0,
-        }
-
-    relations = _count(conn, "SELECT COUNT(*) FROM relations WHERE run_id = ?", run_id)
-    sql_statements = _count(conn, "SELECT COUNT(*) FROM sql_statements WHERE run_id = ?", run_id)
-    sql_tables = _count(conn, "SELECT COUNT(*) FROM sql_tables WHERE run_id = ?", run_id)
-
-    return {
-        "total_objects": int(row["total_objects"] or 0),
-        "table_objects": int(row["table_objects"] or 0),
-        "app_objects": int(row["app_objects"] or 0),
-        "relations": relations,
-        "sql_statements": sql_statements,
-        "sql_tables": sql_tables,
-    }
+    return {key: int(row[key] or 0) for key in row.keys()}
 
 
 
@@ -293,6 +741,11 @@ def _query_relation_counts(
     run_id: str,
     filters: DashboardFilters,
 ) -> list[dict[str, Any]]:
+    if filters.object_name is None and filters.search is None:
+        materialized = _query_materialized_relation_counts(conn, run_id, filters.relation_type)
+        if materialized is not None:
+            return materialized
+
     clauses = ["r.run_id = ?"]
     params: list[Any] = [run_id]
 
@@ -301,31 +754,69 @@ def _query_relation_counts(
         params.append(filters.relation_type)
 
     if filters.object_name is not None:
-        like_value = _like(filters.object_name)
-        clauses.append("(src.name LIKE ? OR dst.name LIKE ?)")
-        params.extend([like_value, like_value])
+        clause, clause_params = _match_clause(("src.name", "dst.name"), filters.object_name)
+        clauses.append(clause)
+        params.extend(clause_params)
 
     if filters.search is not None:
-        like_value = _like(filters.search)
-        clauses.append("(src.name LIKE ? OR dst.name LIKE ? OR r.relation_type LIKE ?)")
-        params.extend([like_value, like_value, like_value])
+        clause, clause_params = _match_clause(
+            ("src.name", "dst.name", "r.relation_type"),
+            filters.search,
+        )
+        clauses.append(clause)
+        params.extend(clause_params)
 
-    sql = f"""
-        SELECT r.relation_type, COUNT(*) AS count
-        FROM relations r
+    # 이름 필터가 없으면 objects 조인이 결과에 영향을 주지 않으므로 relations만 집계한다.
+    joins = ""
+    if filters.object_name is not None or filters.search is not None:
+        joins = """
         JOIN objects src
           ON src.run_id = r.run_id
          AND src.id = r.src_id
         JOIN objects dst
           ON dst.run_id = r.run_id
-         AND dst.id = r.dst_id
+         AND dst.id = r.dst_id"""
+
+    sql = f"""
+        SELECT r.relation_type, COUNT(*) AS count
+        FROM relations r{joins}
         WHERE {' AND '.join(clauses)}
         GROUP BY r.relation_type
         ORDER BY count DESC, r.relation_type
     """
 
-    rows = conn.execute(sql, params).fetchall()
-    return [dict(row) for row in rows]
+    return _fetch_dicts(conn, sql, params)
+
+
+
+def _query_materialized_relation_counts(
+    conn: sqlite3.Connection,
+    run_id: str,
+    relation_type: str | None,
+) -> list[dict[str, Any]] | None:
+    # run_summary 행이 있으면 집계가 끝난 run이므로, 관계가 없어도 (NULL 한 행으로) 구분된다.
+    type_clause = "" if relation_type is None else "AND rc.relation_type = ?"
+    params: list[Any] = [run_id] if relation_type is None else [relation_type, run_id]
+    try:
+        rows = _fetch_dicts(
+            conn,
+            f"""
+            SELECT rc.relation_type, rc.count
+            FROM run_summary s
+            LEFT JOIN run_relation_counts rc
+              ON rc.run_id = s.run_id
+             {type_clause}
+            WHERE s.run_id = ?
+            ORDER BY rc.count DESC, rc.relation_type
+            """,
+            params,
+        )
+    except sqlite3.OperationalError:
+        return None
+
+    if not rows:
+        return None
+    return [row for row in rows if row["relation_type"] is not None]
 
 
 
@@ -339,13 +830,18 @@ def _query_screen_inventory(
     params: list[Any] = [run_id]
 
     if filters.object_name is not None:
-        clauses.append("o.name LIKE ?")
-        params.append(_like(filters.object_name))
+        clause, clause_params = _match_clause(("o.name",), filters.object_name)
+        clauses.append(clause)
+        params.extend(clause_params)
 
     if filters.search is not None:
-        like_value = _like(filters.search)
-        clauses.append("(o.type LIKE ? OR o.name LIKE ? OR o.module LIKE ? OR o.source_path LIKE ?)")
-        params.extend([like_value, like_value, like_value, like_value])
+        clause, clause_params = _object_search_clause(conn, filters.search)
+        clauses.append(clause)
+        params.extend(clause_params)
+
+    if filters.inventory_after is not None:
+        clauses.append("(o.type, o.name) > (?, ?)")
+        params.extend(filters.inventory_after)
 
     sql = f"""
         SELECT o.type, o.name, o.module, o.source_path
@@ -356,8 +852,7 @@ def _query_screen_inventory(
     """
     params.append(limit)
 
-    rows = conn.execute(sql, params).fetchall()
-    return [dict(row) for row in rows]
+    return _fetch_dicts(conn, sql, params)
 
 
 
@@ -374,40 +869,58 @@ def _query_event_function_map(
     params: list[Any] = [run_id]
 
     if filters.object_name is not None:
-        clauses.append("o.name LIKE ?")
-        params.append(_like(filters.object_name))
+        clause, clause_params = _match_clause(("o.name",), filters.object_name)
+        clauses.append(clause)
+        params.extend(clause_params)
 
     if filters.search is not None:
-        like_value = _like(filters.search)
-        clauses.append("(o.name LIKE ? OR e.event_name LIKE ? OR e.script_ref LIKE ?)")
-        params.extend([like_value, like_value, like_value])
+        clause, clause_params = _match_clause(
+            ("o.name", "e.event_name", "e.script_ref"),
+            filters.search,
+        )
+        clauses.append(clause)
+        params.extend(clause_params)
 
+    # 호출 대상 목록은 LIMIT으로 남은 이벤트 행에 대해서만 상관 서브쿼리로 모은다.
+    # 이벤트 소유 객체 id로 relations를 바로 찾아 objects를 이름으로 다시 조회하지 않는다.
     sql = f"""
         SELECT
-            o.name AS object_name,
-            e.event_name,
-            e.script_ref,
-            COALESCE(GROUP_CONCAT(DISTINCT dst.name), '') AS called_objects
-        FROM events e
-        JOIN objects o
-          ON o.run_id = e.run_id
-         AND o.id = e.object_id
-        LEFT JOIN relations r
-          ON r.run_id = e.run_id
-         AND r.src_id = o.id
-         AND r.relation_type = 'calls'
-        LEFT JOIN objects dst
-          ON dst.run_id = o.run_id
-         AND dst.id = r.dst_id
-        WHERE {' AND '.join(clauses)}
-        GROUP BY o.name, e.event_name, e.script_ref
-        ORDER BY o.name, e.event_name
-        LIMIT ?
+            ev.object_name,
+            ev.event_name,
+            ev.script_ref,
+            COALESCE(
+                (
+                    SELECT GROUP_CONCAT(called.name)
+                    FROM (
+                        SELECT dst.name, MIN(dst.id) AS first_dst_id
+                        FROM relations r
+                        JOIN objects dst
+                          ON dst.run_id = r.run_id
+                         AND dst.id = r.dst_id
+                        WHERE r.run_id = ?
+                          AND r.src_id = ev.object_id
+                          AND r.relation_type = 'calls'
+                        GROUP BY dst.name
+                        ORDER BY first_dst_id
+                    ) called
+                ),
+                ''
+            ) AS called_objects
+        FROM (
+            SELECT DISTINCT o.id AS object_id, o.name AS object_name, e.event_name, e.script_ref
+            FROM events e
+            JOIN objects o
+              ON o.run_id = e.run_id
+             AND o.id = e.object_id
+            WHERE {' AND '.join(clauses)}
+            ORDER BY o.name, e.event_name, o.id
+            LIMIT ?
+        ) ev
+        ORDER BY ev.object_name, ev.event_name, ev.object_id
     """
-    params.append(limit)
+    params = [run_id, *params, limit]
 
-    rows = conn.execute(sql, params).fetchall()
-    return [dict(row) for row in rows]
+    return _fetch_dicts(conn, sql, params)
 
 
 
@@ -427,12 +940,14 @@ def _query_table_impact(
     params: list[Any] = [run_id]
 
     if filters.table_name is not None:
-        clauses.append("st.table_name LIKE ?")
-        params.append(_like(filters.table_name))
+        clause, clause_params = _match_clause(("st.table_name",), filters.table_name)
+        clauses.append(clause)
+        params.extend(clause_params)
 
     if filters.object_name is not None:
-        clauses.append("owner.name LIKE ?")
-        params.append(_like(filters.object_name))
+        clause, clause_params = _match_clause(("owner.name",), filters.object_name)
+        clauses.append(clause)
+        params.extend(clause_params)
 
     if filters.relation_type == "reads_table":
         clauses.append("st.rw_type = 'READ'")
@@ -440,9 +955,12 @@ def _query_table_impact(
         clauses.append("st.rw_type = 'WRITE'")
 
     if filters.search is not None:
-        like_value = _like(filters.search)
-        clauses.append("(st.table_name LIKE ? OR owner.name LIKE ? OR ss.sql_kind LIKE ?)")
-        params.extend([like_value, like_value, like_value])
+        clause, clause_params = _match_clause(
+            ("st.table_name", "owner.name", "ss.sql_kind"),
+            filters.search,
+        )
+        clauses.append(clause)
+        params.extend(clause_params)
 
     sql = f"""
         SELECT
@@ -463,8 +981,7 @@ def _query_table_impact(
     """
     params.append(limit)
 
-    rows = conn.execute(sql, params).fetchall()
-    return [dict(row) for row in rows]
+    return _fetch_dicts(conn, sql, params)
 
 
 
@@ -474,24 +991,41 @@ def _query_screen_call_graph(
     limit: int,
     filters: DashboardFilters,
 ) -> list[dict[str, Any]]:
+    edge_query = _screen_call_graph_sql(run_id, limit, filters)
+    if edge_query is None:
+        return []
+
+    sql, params = edge_query
+    return _fetch_dicts(conn, sql, params)
+
+
+
+def _screen_call_graph_sql(
+    run_id: str,
+    limit: int,
+    filters: DashboardFilters,
+) -> tuple[str, list[Any]] | None:
     clauses = ["r.run_id = ?", "r.relation_type IN ('opens', 'calls')"]
     params: list[Any] = [run_id]
 
     if filters.relation_type is not None:
         if filters.relation_type not in {"opens", "calls"}:
-            return []
+            return None
         clauses.append("r.relation_type = ?")
         params.append(filters.relation_type)
 
     if filters.object_name is not None:
-        like_value = _like(filters.object_name)
-        clauses.append("(src.name LIKE ? OR dst.name LIKE ?)")
-        params.extend([like_value, like_value])
+        clause, clause_params = _match_clause(("src.name", "dst.name"), filters.object_name)
+        clauses.append(clause)
+        params.extend(clause_params)
 
     if filters.search is not None:
-        like_value = _like(filters.search)
-        clauses.append("(src.name LIKE ? OR dst.name LIKE ? OR r.relation_type LIKE ?)")
-        params.extend([like_value, like_value, like_value])
+        clause, clause_params = _match_clause(
+            ("src.name", "dst.name", "r.relation_type"),
+            filters.search,
+        )
+        clauses.append(clause)
+        params.extend(clause_params)
 
     sql = f"""
         SELECT
@@ -511,9 +1045,18 @@ def _query_screen_call_graph(
         LIMIT ?
     """
     params.append(limit)
+    return sql, params
 
-    rows = conn.execute(sql, params).fetchall()
-    return [dict(row) for row in rows]
+
+
+# 대부분의 객체는 관계가 있으므로 relations 검사를 앞에 두어 행마다 첫 인덱스 조회에서 끝나게 한다.
+# 각 NOT EXISTS는 (run_id, 객체 id)로 시작하는 인덱스 하나만 찾아본다.
+_UNUSED_OBJECT_CLAUSES = (
+    "NOT EXISTS (SELECT 1 FROM relations r WHERE r.run_id = o.run_id AND r.src_id = o.id)",
+    "NOT EXISTS (SELECT 1 FROM relations r WHERE r.run_id = o.run_id AND r.dst_id = o.id)",
+    "NOT EXISTS (SELECT 1 FROM events e WHERE e.run_id = o.run_id AND e.object_id = o.id)",
+    "NOT EXISTS (SELECT 1 FROM functions f WHERE f.run_id = o.run_id AND f.object_id = o.id)",
+)
 
 
 
@@ -523,24 +1066,22 @@ def _query_unused_candidates(
     limit: int,
     filters: DashboardFilters,
 ) -> list[dict[str, Any]]:
-    clauses = [
-        "o.run_id = ?",
-        "rel_src.id IS NULL",
-        "rel_dst.id IS NULL",
-        "e.id IS NULL",
-        "f.id IS NULL",
-        "o.type <> 'Table'",
-    ]
+    clauses = ["o.run_id = ?", "o.type <> 'Table'", *_UNUSED_OBJECT_CLAUSES]
     params: list[Any] = [run_id]
 
     if filters.object_name is not None:
-        clauses.append("o.name LIKE ?")
-        params.append(_like(filters.object_name))
+        clause, clause_params = _match_clause(("o.name",), filters.object_name)
+        clauses.append(clause)
+        params.extend(clause_params)
 
     if filters.search is not None:
-        like_value = _like(filters.search)
-        clauses.append("(o.type LIKE ? OR o.name LIKE ? OR o.module LIKE ? OR o.source_path LIKE ?)")
-        params.extend([like_value, like_value, like_value, like_value])
+        clause, clause_params = _object_search_clause(conn, filters.search)
+        clauses.append(clause)
+        params.extend(clause_params)
+
+    if filters.unused_after is not None:
+        clauses.append("(o.type, o.name) > (?, ?)")
+        params.extend(filters.unused_after)
 
     sql = f"""
         SELECT
@@ -549,79 +1090,51 @@ def _query_unused_candidates(
             o.module,
             o.source_path
         FROM objects o
-        LEFT JOIN relations rel_src
-          ON rel_src.run_id = o.run_id
-         AND rel_src.src_id = o.id
-        LEFT JOIN relations rel_dst
-          ON rel_dst.run_id = o.run_id
-         AND rel_dst.dst_id = o.id
-        LEFT JOIN events e
-          ON e.run_id = o.run_id
-         AND e.object_id = o.id
-        LEFT JOIN functions f
-          ON f.run_id = o.run_id
-         AND f.object_id = o.id
         WHERE {' AND '.join(clauses)}
-        GROUP BY o.id, o.type, o.name, o.module, o.source_path
         ORDER BY o.type, o.name
         LIMIT ?
     """
     params.append(limit)
 
-    rows = conn.execute(sql, params).fetchall()
-    return [dict(row) for row in rows]
+    return _fetch_dicts(conn, sql, params)
 
 
 
 def _build_graph_data(edges: list[dict[str, Any]]) -> dict[str, Any]:
-    node_map: dict[str, dict[str, Any]] = {}
-    graph_edges: list[dict[str, Any]] = []
-
-    for edge in edges:
-        src_name = str(edge.get("src_name", ""))
-        dst_name = str(edge.get("dst_name", ""))
-        relation_type = str(edge.get("relation_type", ""))
-        confidence = float(edge.get("confidence", 0.0) or 0.0)
-
-        if not src_name or not dst_name:
-            continue
-
-        src_node = node_map.setdefault(
-            src_name,
-            {
-                "id": src_name,
-                "name": src_name,
-                "in_degree": 0,
-                "out_degree": 0,
-                "degree": 0,
-            },
-        )
-        dst_node = node_map.setdefault(
-            dst_name,
-            {
-                "id": dst_name,
-                "name": dst_name,
-                "in_degree": 0,
-                "out_degree": 0,
-                "degree": 0,
-            },
-        )
-
-        src_node["out_degree"] += 1
-        dst_node["in_degree"] += 1
+    # 행 값은 SQLite 컬럼 타입 그대로(name은 NOT NULL TEXT, confidence는 REAL)라
+    # 행마다 str()/float()로 바꾸지 않고 NULL confidence만 0.0으로 채운다.
+    graph_edges: list[dict[str, Any]] = [
+        {
+            "src": src_name,
+            "dst": dst_name,
+            "relation_type": edge["relation_type"],
+            "confidence": edge["confidence"] or 0.0,
+        }
+        for edge in edges
+        if (src_name := edge["src_name"]) and (dst_name := edge["dst_name"])
+    ]
 
-        graph_edges.append(
-            {
-                "src": src_name,
-                "dst": dst_name,
-                "relation_type": relation_type,
-                "confidence": confidence,
-            }
+    # 차수는 LIMIT이 적용된 같은 간선 집합에서 센다. 딕셔너리는 처음 등장한 순서(출발 → 도착)를 유지한다.
+    degrees: dict[str, list[int]] = {}
+    for edge in graph_edges:
+        src_degree = degrees.setdefault(edge["src"], [0, 0])
+        src_degree[0] += 1
+        dst_degree = degrees.setdefault(edge["dst"], [0, 0])
+        dst_degree[1] += 1
+
+    # 안정 정렬이라 대소문자만 다른 이름은 처음 등장한 순서를 유지한다.
+    nodes: list[dict[str, Any]] = [
+        {
+            "id": name,
+            "name": name,
+            "in_degree": in_degree,
+            "out_degree": out_degree,
+            "degree": in_degree + out_degree,
+        }
+        for name, (out_degree, in_degree) in sorted(
+            degrees.items(), key=lambda item: item[0].lower()
         )
-
-    nodes = sorted(node_map.values(), key=lambda item: str(item["name"]).lower())
-    for node in nodes:
-        node["degree"] = int(node["in_degree"]) + int(node["out_degree"])
+    ]
 
     return {
         "nodes": nodes,
@@ -632,16 +1145,150 @@ def _build_graph_data(edges: list[dict[str, Any]]) -> dict[str, Any]:
 
 
 
-def _count(conn: sqlite3.Connection, sql: str, run_id: str) -> int:
-    row = conn.execute(sql, (run_id,)).fetchone()
-    if row is None:
-        return 0
-    return int(row[0])
+def _match_clause(columns: tuple[str, ...], value: str) -> tuple[str, list[str]]:
+    operator, pattern = _text_match(value)
+    return _match_clause_sql(columns, operator), [pattern] * len(columns)
+
+
+
+# 절 텍스트는 (컬럼, 연산자) 조합마다 같으므로 한 번만 만들고, 같은 SQL 텍스트로 문장 캐시도 맞춘다.
+@lru_cache(maxsize=64)
+def _match_clause_sql(columns: tuple[str, ...], operator: str) -> str:
+    suffix = " ESCAPE '\\'" if operator == "LIKE" else ""
+    clause = " OR ".join(f"{column} {operator} ?{suffix}" for column in columns)
+    return f"({clause})"
+
+
+
+def _object_search_clause(conn: sqlite3.Connection, value: str) -> tuple[str, list[str]]:
+    # 부분 문자열 검색은 trigram FTS 색인이 있으면 그 색인으로 후보 id를 좁힌다.
+    # trigram은 3글자부터 색인을 탄다. %, _도 LIKE 경로와 같이 글자 그대로 찾으므로 색인을 쓴다.
+    operator, _ = _text_match(value)
+    if operator == "LIKE" and len(value) >= 3 and _has_object_search(conn):
+        phrase = '"' + value.replace('"', '""') + '"'
+        return "o.id IN (SELECT rowid FROM objects_search WHERE objects_search MATCH ?)", [phrase]
+    return _match_clause(("o.type", "o.name", "o.module", "o.source_path"), value)
+
 
 
+def _has_object_search(conn: sqlite3.Connection) -> bool:
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'objects_search'"
+    ).fetchone()
+    return row is not None
+
+
+
+def _text_match(value: str) -> tuple[str, str]:
+    # 끝이 '*'인 값은 대소문자를 구분하는 접두 검색으로 보고 인덱스를 탈 수 있는 GLOB을 쓴다.
+    prefix = value.rstrip("*")
+    if prefix and prefix != value:
+        escaped_prefix = _GLOB_SPECIAL_PATTERN.sub(r"[\g<0>]", prefix)
+        return "GLOB", f"{escaped_prefix}*"
+    escaped_value = _LIKE_SPECIAL_PATTERN.sub(r"\\\g<0>", value)
+    return "LIKE", f"%{escaped_value}%"
+
+
+
+def _select_keys(*keys: str) -> Callable[[DashboardPayload], dict[str, Any]]:
+    return lambda payload: {key: payload[key] for key in keys}
+
+
+
+def _select_items(panel: str) -> Callable[[DashboardPayload], dict[str, Any]]:
+    return lambda payload: {"items": payload[panel]}
+
+
+
+# 엔드포인트별로 필요한 패널과 응답 모양을 정해 두어 do_GET이 사전 조회 한 번으로 분기한다.
+_PAYLOAD_ROUTES: dict[str, tuple[frozenset[str], Callable[[DashboardPayload], dict[str, Any]]]] = {
+    "/api/all": (DASHBOARD_PANELS, dict),
+    "/api/summary": (
+        frozenset({"summary", "relation_counts"}),
+        _select_keys("run", "summary", "relation_counts", "filters"),
+    ),
+    "/api/graph": (frozenset({"graph_data"}), _select_keys("run", "graph_data", "filters")),
+    "/api/screen-inventory": (frozenset({"screen_inventory"}), _select_items("screen_inventory")),
+    "/api/event-function-map": (
+        frozenset({"event_function_map"}),
+        _select_items("event_function_map"),
+    ),
+    "/api/table-impact": (frozenset({"table_impact"}), _select_items("table_impact")),
+    "/api/screen-call-graph": (
+        frozenset({"screen_call_graph"}),
+        _select_items("screen_call_graph"),
+    ),
+    "/api/unused-object-candidates": (
+        frozenset({"unused_object_candidates"}),
+        _select_items("unused_object_candidates"),
+    ),
+}
+
+
+
+def _iter_ndjson_sections(payload: DashboardPayload) -> Iterator[bytes]:
+    """Yield the payload as newline-delimited ``{key: value}`` JSON sections.
 
-def _like(value: str) -> str:
-    return f"%{value}%"
+    ``graph_data`` is split into ``{"graph_data.<field>": value}`` lines, with list fields
+    sent in batches that the client appends in order.
+    """
+    ordered = [key for key in _STREAM_SECTION_ORDER if key in payload]
+    ordered.extend(key for key in payload if key not in _STREAM_SECTION_ORDER)
+    for key in ordered:
+        value = payload[key]
+        if key in _STREAM_BATCHED_SECTIONS and isinstance(value, dict):
+            yield from _iter_batched_section(key, value)
+            continue
+        yield _encode_json({key: value}) + b"\n"
+
+
+
+def _iter_batched_section(key: str, section: dict[str, Any]) -> Iterator[bytes]:
+    for field, value in section.items():
+        path = f"{key}.{field}"
+        if not isinstance(value, list) or not value:
+            yield _encode_json({path: value}) + b"\n"
+            continue
+        for start in range(0, len(value), _STREAM_BATCH_SIZE):
+            batch = value[start : start + _STREAM_BATCH_SIZE]
+            yield _encode_json({path: batch}) + b"\n"
+
+
+
+def _iter_json_chunks(payload: dict[str, Any]) -> Iterator[bytes]:
+    """Yield the JSON encoding of ``payload`` in pieces for incremental writes.
+
+    With orjson each top-level section is encoded on its own; otherwise the stdlib
+    ``iterencode`` tokens are joined into pieces of about ``_JSON_WRITE_CHUNK_SIZE``.
+    """
+    if orjson is not None:
+        separator = b"{"
+        for key, value in payload.items():
+            yield separator + orjson.dumps(str(key)) + b":" + _encode_json(value)
+            separator = b","
+        yield b"}" if separator == b"," else b"{}"
+        return
+
+    # iterencode 조각은 토큰 단위로 잘게 나오므로 문자열로 모았다가 한 번에 인코딩한다.
+    buffer: list[str] = []
+    buffered = 0
+    for chunk in _JSON_ENCODER.iterencode(payload):
+        buffer.append(chunk)
+        buffered += len(chunk)
+        if buffered >= _JSON_WRITE_CHUNK_SIZE:
+            yield "".join(buffer).encode("utf-8")
+            buffer.clear()
+            buffered = 0
+    if buffer:
+        yield "".join(buffer).encode("utf-8")
+
+
+
+def _encode_json(value: Any) -> bytes:
+    # orjson이 있으면 C 구현으로 바로 UTF-8 바이트를 만든다 (출력은 같은 compact JSON).
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return _JSON_ENCODER.encode(value).encode("utf-8")
 
 
 
@@ -649,144 +1296,156 @@ def _build_handler(
     db_path: Path,
     default_run_id: str | None,
     default_limit: int,
+    connection_pool: _ReadConnectionPool | None = None,
 ) -> type[BaseHTTPRequestHandler]:
     class DashboardHandler(BaseHTTPRequestHandler):
         server_version = "PBAnalyzerDashboard/0.2"
+        # 길이 없이 흘려보내는 응답의 헤더를 이미 보냈는지. 보낸 뒤에는 오류 응답을 덧붙일 수 없다.
+        _stream_started = False
 
         def do_GET(self) -> None:  # noqa: N802
+            self._stream_started = False
             parsed = urlparse(self.path)
             endpoint = parsed.path or "/"
             params = parse_qs(parsed.query)
 
             try:
                 if endpoint == "/":
-                    self._send_html(_render_dashboard_html())
+                    self._send_dashboard_html()
                     return
 
-                if endpoint == "/health":
-                    self._send_json({"status": "ok"})
-                    return
-
-                run_id = _get_query_param(params, "run_id") or default_run_id
-                limit = _parse_limit_param(params, default_limit)
-                filters = _parse_filters(params)
-
-                if endpoint == "/api/runs":
-                    self._send_json({"runs": list_runs(db_path, limit=min(limit, 100))})
-                    return
-
-                if endpoint == "/api/all":
-                    payload = get_dashboard_payload(
-                        db_path=db_path,
-                        run_id=run_id,
-                        limit=limit,
-                        filters=filters,
-                    )
-                    self._send_json(payload)
-                    return
-
-                if endpoint == "/api/summary":
-                    payload = get_dashboard_payload(
-                        db_path=db_path,
-                        run_id=run_id,
-                        limit=limit,
-                        filters=filters,
-                    )
-                    self._send_json(
-                        {
-                            "run": payload["run"],
-                            "summary": payload["summary"],
-                            "relation_counts": payload["relation_counts"],
-                            "filters": payload["filters"],
-                        }
-                    )
-                    return
-
-                if endpoint == "/api/graph":
-                    payload = get_dashboard_payload(
-                        db_path=db_path,
-                        run_id=run_id,
-                        limit=limit,
-                        filters=filters,
-                    )
-                    self._send_json(
-                        {
-                            "run": payload["run"],
-                            "graph_data": payload["graph_data"],
-                            "filters": payload["filters"],
-                        }
-                    )
-                    return
-
-                if endpoint == "/api/screen-inventory":
-                    payload = get_dashboard_payload(
-                        db_path=db_path,
-                        run_id=run_id,
-                        limit=limit,
-                        filters=filters,
+                if endpoint == _DEFERRED_CSS_PATH:
+                    self._send_asset(
+                        _deferred_css_bytes(),
+                        "text/css; charset=utf-8",
+                        _ASSET_CACHE_CONTROL,
                     )
-                    self._send_json({"items": payload["screen_inventory"]})
                     return
 
-                if endpoint == "/api/event-function-map":
-                    payload = get_dashboard_payload(
-                        db_path=db_path,
-                        run_id=run_id,
-                        limit=limit,
-                        filters=filters,
-                    )
-                    self._send_json({"items": payload["event_function_map"]})
+                if endpoint == "/health":
+                    self._send_json({"status": "ok"})
                     return
 
-                if endpoint == "/api/table-impact":
-                    payload = get_dashboard_payload(
-                        db_path=db_path,
-                        run_id=run_id,
-                        limit=limit,
-                        filters=filters,
-                    )
-                    self._send_json({"items": payload["table_impact"]})
+                run_id = _get_query_param(params, "run_id") or default_run_id
+                limit = _parse_limit_param(params, default_limit)
+                filters = _parse_filters(params)
+
+                if endpoint == "/api/runs":
+                    if connection_pool is None:
+                        runs = list_runs(db_path, limit=min(limit, 100))
+                    else:
+                        _ensure_db_path(db_path)
+                        with connection_pool.connection() as conn:
+                            runs = _query_runs(conn, min(limit, 100))
+                    self._send_json({"runs": runs})
                     return
 
-                if endpoint == "/api/screen-call-graph":
-                    payload = get_dashboard_payload(
+                if endpoint == _STREAM_PATH:
+                    payload = _get_cached_dashboard_payload(
                         db_path=db_path,
                         run_id=run_id,
                         limit=limit,
                         filters=filters,
+                        connection_pool=connection_pool,
                     )
-                    self._send_json({"items": payload["screen_call_graph"]})
+                    self._send_ndjson(payload)
                     return
 
-                if endpoint == "/api/unused-object-candidates":
-                    payload = get_dashboard_payload(
+                route = _PAYLOAD_ROUTES.get(endpoint)
+                if route is not None:
+                    include, shape_response = route
+                    payload = _get_cached_dashboard_payload(
                         db_path=db_path,
                         run_id=run_id,
                         limit=limit,
                         filters=filters,
+                        include=include,
+                        connection_pool=connection_pool,
                     )
-                    self._send_json({"items": payload["unused_object_candidates"]})
+                    self._send_json(shape_response(payload))
                     return
 
                 self._send_json({"error": f"Not found: {endpoint}"}, status=404)
             except UserInputError as exc:
-                self._send_json({"error": str(exc)}, status=400)
+                self._send_error_json(str(exc), 400)
             except Exception as exc:  # pragma: no cover
-                self._send_json({"error": f"dashboard error: {exc}"}, status=500)
+                self._send_error_json(f"dashboard error: {exc}", 500)
+
+        def _send_error_json(self, message: str, status: int) -> None:
+            # 스트리밍 도중 실패하면 본문 중간에 상태 줄을 쓰지 않고 연결을 끊어 잘린 응답임을 알린다.
+            if self._stream_started:
+                self.close_connection = True
+                return
+            self._send_json({"error": message}, status=status)
 
         def log_message(self, fmt: str, *args: object) -> None:
             return
 
-        def _send_html(self, payload: str, status: int = 200) -> None:
-            data = payload.encode("utf-8")
-            self.send_response(status)
-            self.send_header("Content-Type", "text/html; charset=utf-8")
-            self.send_header("Content-Length", str(len(data)))
+        def _send_dashboard_html(self) -> None:
+            self._send_asset(
+                _dashboard_html_bytes(),
+                "text/html; charset=utf-8",
+                _SHELL_CACHE_CONTROL,
+            )
+
+        def _send_asset(
+            self,
+            asset: tuple[bytes, bytes, str],
+            content_type: str,
+            cache_control: str,
+        ) -> None:
+            data, compressed, etag = asset
+            # gzip 본문과 원본은 다른 표현이므로 강한 ETag도 따로 둔다.
+            use_gzip = _accepts_gzip(self.headers.get("Accept-Encoding"))
+            if use_gzip:
+                etag = _gzip_etag(etag)
+            if _etag_matches(self.headers.get("If-None-Match"), etag):
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", cache_control)
+                self.send_header("Vary", "Accept-Encoding")
+                self.end_headers()
+                return
+
+            body = compressed if use_gzip else data
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            if use_gzip:
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", cache_control)
+            self.send_header("Vary", "Accept-Encoding")
             self.end_headers()
-            self.wfile.write(data)
+            self.wfile.write(body)
 
         def _send_json(self, payload: dict[str, Any], status: int = 200) -> None:
-            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            # 임계값(바이트)까지 모아 보고 끝나면 길이를 붙여 한 번에 보낸다.
+            chunks = _iter_json_chunks(payload)
+            head: list[bytes] = []
+            head_size = 0
+            for chunk in chunks:
+                head.append(chunk)
+                head_size += len(chunk)
+                if head_size > _JSON_STREAM_THRESHOLD:
+                    break
+            else:
+                self._send_json_body(b"".join(head), status)
+                return
+
+            # 큰 응답은 길이 없이 보내고 연결 종료로 끝을 알려 직렬화와 전송을 겹친다.
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Cache-Control", "no-store")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.close_connection = True
+            self._stream_started = True
+            self.wfile.write(b"".join(head))
+            for chunk in chunks:
+                self.wfile.write(chunk)
+
+        def _send_json_body(self, body: bytes, status: int) -> None:
             self.send_response(status)
             self.send_header("Content-Type", "application/json; charset=utf-8")
             self.send_header("Cache-Control", "no-store")
@@ -794,6 +1453,19 @@ def _build_handler(
             self.end_headers()
             self.wfile.write(body)
 
+        def _send_ndjson(self, payload: DashboardPayload) -> None:
+            # 섹션마다 바로 flush해 브라우저가 앞쪽 섹션부터 파싱/렌더링하게 한다.
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson; charset=utf-8")
+            self.send_header("Cache-Control", "no-store")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.close_connection = True
+            self._stream_started = True
+            for line in _iter_ndjson_sections(payload):
+                self.wfile.write(line)
+                self.wfile.flush()
+
     return DashboardHandler
 
 
@@ -825,19 +1497,137 @@ def _parse_filters(params: dict[str, list[str]]) -> DashboardFilters:
         object_name=_get_query_param(params, "object_name"),
         table_name=_get_query_param(params, "table_name"),
         relation_type=_get_query_param(params, "relation_type"),
+        inventory_after=_parse_cursor_param(params, "inventory_after"),
+        unused_after=_parse_cursor_param(params, "unused_after"),
     )
 
 
 
-def _render_dashboard_html() -> str:
-    html = """<!doctype html>
-<html lang="ko">
-<head>
-  <meta charset="utf-8" />
-  <meta name="viewport" content="width=device-width, initial-scale=1" />
-  <title>__TITLE__</title>
-  <style>
-    :root {
+def _parse_cursor_param(params: dict[str, list[str]], key: str) -> tuple[str, str] | None:
+    raw_cursor = _get_query_param(params, key)
+    if raw_cursor is None:
+        return None
+    return _decode_cursor(raw_cursor)
+
+
+
+def _encode_cursor(object_type: str, object_name: str) -> str:
+    raw = json.dumps([object_type, object_name], ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+
+def _decode_cursor(cursor: str) -> tuple[str, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        decoded = json.loads(raw.decode("utf-8"))
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise UserInputError(f"Invalid cursor: {cursor}") from exc
+
+    if (
+        not isinstance(decoded, list)
+        or len(decoded) != 2
+        or not all(isinstance(item, str) for item in decoded)
+    ):
+        raise UserInputError(f"Invalid cursor: {cursor}")
+    return decoded[0], decoded[1]
+
+
+
+def _filters_cursor(cursor: tuple[str, str] | None) -> str | None:
+    if cursor is None:
+        return None
+    return _encode_cursor(*cursor)
+
+
+
+def _next_cursor(rows: list[dict[str, Any]], limit: int) -> str | None:
+    # (type, name) 순으로 정렬된 패널이 limit만큼 찼을 때만 다음 페이지 커서를 준다.
+    if len(rows) < limit:
+        return None
+    last_row = rows[-1]
+    return _encode_cursor(str(last_row["type"]), str(last_row["name"]))
+
+
+
+@lru_cache(maxsize=1)
+def _dashboard_html_bytes() -> tuple[bytes, bytes, str]:
+    return _precompressed_asset(_render_dashboard_html())
+
+
+
+@lru_cache(maxsize=1)
+def _deferred_css_bytes() -> tuple[bytes, bytes, str]:
+    return _precompressed_asset(_DEFERRED_CSS)
+
+
+
+def _precompressed_asset(text: str) -> tuple[bytes, bytes, str]:
+    # 셸 자원은 상수이므로 한 번만 인코딩/압축하고 내용 해시를 ETag로 쓴다.
+    data = text.encode("utf-8")
+    compressed = gzip.compress(data, compresslevel=9, mtime=0)
+    return data, compressed, f'"{hashlib.blake2b(data, digest_size=16).hexdigest()}"'
+
+
+
+def _gzip_etag(etag: str) -> str:
+    return f'{etag[:-1]}-gz"'
+
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    # If-None-Match는 약한 비교를 하므로 W/ 접두어는 떼고 본다.
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+
+def _accepts_gzip(accept_encoding: str | None) -> bool:
+    if not accept_encoding:
+        return False
+
+    # 명시한 gzip 항목(q=0 포함)이 순서와 관계없이 '*'보다 우선한다.
+    gzip_quality: float | None = None
+    wildcard_quality: float | None = None
+    for item in accept_encoding.split(","):
+        coding, *params = item.split(";")
+        coding = coding.strip().lower()
+        if coding not in {"gzip", "*"}:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value.strip())
+                except ValueError:
+                    quality = 0.0
+        if coding == "gzip":
+            gzip_quality = quality
+        else:
+            wildcard_quality = quality
+
+    quality_value = gzip_quality if gzip_quality is not None else wildcard_quality
+    return quality_value is not None and quality_value > 0
+
+
+
+def _minify_css(css: str) -> str:
+    def replace_token(match: re.Match[str]) -> str:
+        token = match.group(1) or match.group(2) or match.group(3)
+        if token:
+            return token
+        return "" if match.group(0).startswith("/*") else " "
+
+    return _CSS_TOKEN_PATTERN.sub(replace_token, css).replace(";}", "}").strip()
+
+
+
+# 첫 화면(헤더, 필터, 탭, 지표 카드)에 필요한 규칙만 HTML에 넣고 나머지는 별도 CSS로 늦게 받는다.
+# 두 스타일시트 모두 import 시 한 번 압축(minify)해 둔다.
+_CRITICAL_CSS = _minify_css("""    :root {
       --bg: #f8fafc;
       --surface: #ffffff;
       --surface-hover: #f1f5f9;
@@ -1070,8 +1860,14 @@ def _render_dashboard_html() -> str:
       width: 50px; font-size: 12px; font-weight: 600;
       color: var(--text); flex-shrink: 0;
     }
+    /* Mini graph (개요 탭에 바로 보이므로 critical 에 둔다) */
+    #miniGraphSvg .edge { stroke: var(--calls); stroke-width: 1.5; stroke-opacity: 0.5; }
+    #miniGraphSvg .edge.opens { stroke: var(--opens); }
+    #miniGraphSvg .node circle { fill: #0d9488; fill-opacity: 0.85; stroke: #115e59; stroke-width: 1; }
+    #miniGraphSvg .node text { text-anchor: middle; font-size: 9px; fill: #475569; }
+""")
 
-    /* Tables */
+_DEFERRED_CSS = _minify_css("""    /* Tables */
     .table-wrap { overflow-x: auto; max-height: 450px; overflow-y: auto; }
     table { width: 100%; border-collapse: collapse; font-size: 13px; }
     thead th {
@@ -1091,6 +1887,8 @@ def _render_dashboard_html() -> str:
     }
     tbody tr:nth-child(even) { background: #fafbfc; }
     tbody tr:hover { background: #f0f9ff; }
+    tbody.spacer tr, tbody.spacer tr:hover { background: none; }
+    tbody.spacer td { padding: 0; border: 0; }
 
     /* Badges */
     .badge {
@@ -1122,13 +1920,13 @@ def _render_dashboard_html() -> str:
       border: 1px solid var(--border); border-radius: var(--radius-sm);
       background: #fcfeff; overflow: hidden; position: relative;
     }
-    .graph-container svg { width: 100%; display: block; }
+    .graph-container svg, .graph-container canvas { width: 100%; display: block; }
     .graph-container.mini svg { height: 280px; }
-    .graph-container.full svg { height: 550px; }
-    @media (max-width: 960px) { .graph-container.full svg { height: 450px; } }
+    .graph-container.full canvas { height: 550px; touch-action: none; }
+    @media (max-width: 960px) { .graph-container.full canvas { height: 450px; } }
     @media (max-width: 640px) {
       .graph-container.mini svg { height: 200px; }
-      .graph-container.full svg { height: 300px; }
+      .graph-container.full canvas { height: 300px; }
     }
     .graph-legend {
       display: flex; gap: 16px; font-size: 12px;
@@ -1143,6 +1941,9 @@ def _render_dashboard_html() -> str:
     .legend-line {
       width: 20px; height: 3px; border-radius: 2px; display: inline-block;
     }
+    .legend-line.calls { background: var(--calls); }
+    .legend-line.opens { background: var(--opens); }
+    .legend-dot.node { background: var(--accent); }
     .graph-tooltip {
       position: absolute; background: var(--surface);
       border: 1px solid var(--border); border-radius: var(--radius-xs);
@@ -1157,6 +1958,7 @@ def _render_dashboard_html() -> str:
       display: inline-flex; border: 1px solid var(--border);
       border-radius: var(--radius-xs); overflow: hidden;
     }
+    .toggle-group[hidden] { display: none; }
     .toggle-btn {
       padding: 5px 12px; font-size: 12px; font-weight: 500;
       border: none; border-right: 1px solid var(--border);
@@ -1197,7 +1999,22 @@ def _render_dashboard_html() -> str:
       background: var(--accent-light); color: var(--accent-dark);
       padding: 1px 6px; border-radius: 999px; font-size: 12px; font-weight: 600;
     }
+""")
+
+
+
+def _render_dashboard_html() -> str:
+    html = """<!doctype html>
+<html lang="ko">
+<head>
+  <meta charset="utf-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1" />
+  <title>__TITLE__</title>
+  <style>
+__STYLE__
   </style>
+  <link rel="preload" href="__DEFERRED_CSS_URL__" as="style" onload="this.onload=null;this.rel='stylesheet'" />
+  <noscript><link rel="stylesheet" href="__DEFERRED_CSS_URL__" /></noscript>
 </head>
 <body>
   <div class="container">
@@ -1271,6 +2088,7 @@ def _render_dashboard_html() -> str:
     <!-- Tab: 개요 -->
     <div class="tab-content active" id="tab-overview">
       <div class="metric-grid" id="metricGrid"></div>
+      <template id="metricCardTpl"><div class="metric-card"><div class="metric-label"></div><div class="metric-value"></div><div class="metric-sub"></div></div></template>
       <div class="two-col">
         <div class="panel">
           <div class="panel-header"><h2 class="panel-title">관계 분포</h2></div>
@@ -1287,8 +2105,8 @@ def _render_dashboard_html() -> str:
           <button class="btn-subtle btn-icon" id="goFullGraphBtn">전체 보기 &#8594;</button>
         </div>
         <div class="graph-legend">
-          <span class="legend-item"><span class="legend-line" style="background:var(--calls)"></span>calls</span>
-          <span class="legend-item"><span class="legend-line" style="background:var(--opens)"></span>opens</span>
+          <span class="legend-item"><span class="legend-line calls"></span>calls</span>
+          <span class="legend-item"><span class="legend-line opens"></span>opens</span>
         </div>
         <div class="graph-container mini" id="miniGraphContainer">
           <svg id="miniGraphSvg"></svg>
@@ -1307,15 +2125,19 @@ def _render_dashboard_html() -> str:
               <button class="toggle-btn" data-filter="calls">calls</button>
               <button class="toggle-btn" data-filter="opens">opens</button>
             </div>
+            <div class="toggle-group" id="graphDetail" hidden>
+              <button class="toggle-btn active" data-detail="top">연결 상위</button>
+              <button class="toggle-btn" data-detail="all">전체 보기</button>
+            </div>
           </div>
         </div>
         <div class="graph-legend">
-          <span class="legend-item"><span class="legend-line" style="background:var(--calls)"></span>calls</span>
-          <span class="legend-item"><span class="legend-line" style="background:var(--opens)"></span>opens</span>
-          <span class="legend-item"><span class="legend-dot" style="background:var(--accent)"></span>노드 (크기=연결수)</span>
+          <span class="legend-item"><span class="legend-line calls"></span>calls</span>
+          <span class="legend-item"><span class="legend-line opens"></span>opens</span>
+          <span class="legend-item"><span class="legend-dot node"></span>노드 (크기=연결수)</span>
         </div>
         <div class="graph-container full" id="fullGraphContainer">
-          <svg id="fullGraphSvg"></svg>
+          <canvas id="fullGraphCanvas"></canvas>
           <div class="graph-tooltip" id="graphTooltip"></div>
         </div>
       </div>
@@ -1354,6 +2176,7 @@ def _render_dashboard_html() -> str:
       <div class="panel">
         <div class="panel-header"><h2 class="panel-title">객체 타입별 분포</h2></div>
         <div id="typeDist" class="type-dist"></div>
+        <template id="typeChipTpl"><div class="type-chip"><span class="badge badge-type"></span> <span class="count"></span></div></template>
       </div>
       <div class="panel">
         <div class="panel-header"><h2 class="panel-title">화면 인벤토리</h2></div>
@@ -1369,13 +2192,32 @@ def _render_dashboard_html() -> str:
     </div>
   </div>
 
-  <script src="https://cdn.jsdelivr.net/npm/d3@7"></script>
+  <script src="__D3_SCRIPT_URL__"></script>
   <script>
     /* ===== State ===== */
     var currentData = null;
     var currentGraphFilter = 'all';
     var currentRwFilter = 'all';
     var fullSimulation = null;
+    var fullGraphFrame = 0;
+    var FULL_GRAPH_LABEL_ZOOM = 0.8;
+    var FULL_LAYOUT_CACHE_MAX = 8;
+    var FULL_GRAPH_NODE_LIMIT = 500;
+    var showAllGraphNodes = false;
+    var fullLayoutCache = new Map();
+    /* 직전에 그린 전체 그래프 노드(위치 포함) — 필터만 바꿔 다시 그릴 때 같은 노드를 그 자리에서 이어 배치한다 */
+    var lastFullLayout = {scope: null, nodes: null};
+    var FULL_LAYOUT_REHEAT = 0.3;
+    var fullGraphSeq = 0;
+    var fullGraphWorker = null;
+    var pendingFullLayout = null;
+    var miniGraphSeq = 0;
+    var graphWorker = null;
+    var pendingMiniLayout = null;
+    /* 마지막으로 그린 그래프 데이터/필터/폭 — 같은 입력이면 탭 전환 시 다시 그리지 않는다 */
+    var lastRenderedGraph = {mini: null, miniWidth: 0, full: null, fullFilter: null, fullWidth: 0};
+    var graphRenderSeq = 0;
+    var activeTab = 'overview';
 
     /* ===== DOM Refs ===== */
     var statusEl = document.getElementById('status');
@@ -1385,12 +2227,40 @@ def _render_dashboard_html() -> str:
     var objectInputEl = document.getElementById('objectInput');
     var tableInputEl = document.getElementById('tableInput');
     var relationSelectEl = document.getElementById('relationSelect');
+    // 렌더 때마다 쓰는 요소도 한 번만 찾아 둔다.
+    var activeFiltersEl = document.getElementById('activeFilters');
+    var metricGridEl = document.getElementById('metricGrid');
+    var metricCardTpl = document.getElementById('metricCardTpl').content;
+    var relationBarEl = document.getElementById('relationBar');
+    var runInfoEl = document.getElementById('runInfo');
+    var miniGraphContainerEl = document.getElementById('miniGraphContainer');
+    var fullGraphContainerEl = document.getElementById('fullGraphContainer');
+    var fullGraphCanvasEl = document.getElementById('fullGraphCanvas');
+    var graphTooltipEl = document.getElementById('graphTooltip');
+    var graphDetailEl = document.getElementById('graphDetail');
+    var tableImpactSummaryEl = document.getElementById('tableImpactSummary');
+    var typeDistEl = document.getElementById('typeDist');
+    var typeChipTpl = document.getElementById('typeChipTpl').content;
+    var unusedCountEl = document.getElementById('unusedCount');
 
     /* ===== Utilities ===== */
+    // 문자열을 한 번만 훑도록 이스케이프 대상 문자를 한 정규식으로 찾아 표에서 바꾼다.
+    var ESC_MAP = {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'};
+    var ESC_TEST = /[&<>"]/;
+    var ESC_PATTERN = /[&<>"]/g;
+    function escChar(ch) { return ESC_MAP[ch]; }
+    // 치환이 필요한 문자열만 결과를 기억한다 (특수문자 없는 이름은 test 한 번이 더 싸다).
+    var ESC_CACHE_MAX = 5000;
+    var escCache = new Map();
     function esc(v) {
-      return String(v == null ? '' : v)
-        .replace(/&/g, '&amp;').replace(/</g, '&lt;')
-        .replace(/>/g, '&gt;').replace(/"/g, '&quot;');
+      var s = String(v == null ? '' : v);
+      if (!ESC_TEST.test(s)) return s;
+      var hit = escCache.get(s);
+      if (hit !== undefined) return hit;
+      if (escCache.size >= ESC_CACHE_MAX) escCache.clear();
+      hit = s.replace(ESC_PATTERN, escChar);
+      escCache.set(s, hit);
+      return hit;
     }
     function fmt(n) { return Number(n || 0).toLocaleString(); }
 
@@ -1411,7 +2281,11 @@ def _render_dashboard_html() -> str:
       renderActiveFilters({});
     }
 
-    function handleErr(e) { statusEl.textContent = 'error: ' + e.message; }
+    function handleErr(e) {
+      // 새 요청이 이전 요청을 취소한 것은 오류가 아니다.
+      if (e && e.name === 'AbortError') return;
+      statusEl.textContent = 'error: ' + e.message;
+    }
 
     async function fetchJson(url) {
       var r = await fetch(url);
@@ -1423,6 +2297,63 @@ def _render_dashboard_html() -> str:
       return r.json();
     }
 
+    /* NDJSON 응답을 받는 대로 줄 단위로 파싱해 섹션마다 onSection(key, payload)를 부른다. */
+    async function fetchSections(url, onSection, signal) {
+      var r = await fetch(url, {signal: signal});
+      if (!r.ok) {
+        var body = null;
+        try { body = await r.json(); } catch(_) {}
+        throw new Error((body && body.error) || 'request failed (' + r.status + ')');
+      }
+      var payload = {};
+      var reader = r.body.getReader();
+      var decoder = new TextDecoder();
+      var pending = '';
+      // 'graph_data.nodes' 같은 점 표기 줄은 묶음이다. 배열은 이어 붙이고,
+      // 다른 섹션 줄이 오거나 응답이 끝나면 그 섹션이 완성된 것으로 보고 onSection 을 부른다.
+      // 묶음은 별도 객체에 모았다가 완성될 때 payload 에 넣는다 (미완성 그래프가 그려지지 않게).
+      var openSection = null, staging = null;
+      function closeSection() {
+        if (openSection === null) return;
+        var done = openSection;
+        payload[done] = staging;
+        openSection = null;
+        staging = null;
+        onSection(done, payload);
+      }
+      function take(line) {
+        if (!line) return;
+        var section = JSON.parse(line);
+        for (var key in section) {
+          var dot = key.indexOf('.');
+          if (dot < 0) {
+            closeSection();
+            payload[key] = section[key];
+            onSection(key, payload);
+            continue;
+          }
+          var name = key.slice(0, dot), field = key.slice(dot + 1), value = section[key];
+          if (openSection !== name) { closeSection(); openSection = name; staging = {}; }
+          var target = staging;
+          if (Array.isArray(target[field]) && Array.isArray(value)) {
+            for (var i = 0; i < value.length; i++) target[field].push(value[i]);
+          } else {
+            target[field] = value;
+          }
+        }
+      }
+      for (;;) {
+        var step = await reader.read();
+        if (step.done) break;
+        var lines = (pending + decoder.decode(step.value, {stream: true})).split('\\n');
+        pending = lines.pop();
+        lines.forEach(take);
+      }
+      take(pending + decoder.decode());
+      closeSection();
+      return payload;
+    }
+
     function badgeHtml(type, label) {
       return '<span class="badge badge-' + esc(type).replace(/ +/g,'_') + '">' + esc(label || type) + '</span>';
     }
@@ -1436,8 +2367,15 @@ def _render_dashboard_html() -> str:
       filterArrow.classList.toggle('open');
     });
 
+    var lastFilterKey = null;
+
     function renderActiveFilters(filters) {
-      var c = document.getElementById('activeFilters');
+      // 같은 필터 조합으로 다시 불러오면 태그 HTML을 새로 만들지 않는다.
+      var key = JSON.stringify(Object.keys(filters).sort().filter(function(k) { return filters[k]; })
+        .map(function(k) { return [k, filters[k]]; }));
+      if (key === lastFilterKey) return;
+      lastFilterKey = key;
+      var c = activeFiltersEl;
       var tags = [];
       for (var k in filters) {
         if (filters[k]) {
@@ -1448,14 +2386,14 @@ def _render_dashboard_html() -> str:
       c.innerHTML = tags.join('');
     }
 
-    document.getElementById('activeFilters').addEventListener('click', function(e) {
+    activeFiltersEl.addEventListener('click', function(e) {
       var rm = e.target.closest('.remove');
       if (!rm) return;
       var key = rm.getAttribute('data-fkey');
       var map = {search: searchInputEl, object_name: objectInputEl,
                  table_name: tableInputEl, relation_type: relationSelectEl};
       if (map[key]) map[key].value = '';
-      loadDashboard().catch(handleErr);
+      scheduleLoadDashboard();
     });
 
     /* ===== Tab Navigation ===== */
@@ -1466,8 +2404,29 @@ def _render_dashboard_html() -> str:
       document.querySelectorAll('.tab-content').forEach(function(c) {
         c.classList.toggle('active', c.id === 'tab-' + tabId);
       });
-      if (tabId === 'dependencies' && currentData) renderFullGraph(currentData.graph_data);
-      if (tabId === 'overview' && currentData) renderMiniGraph(currentData.graph_data);
+      activeTab = tabId;
+      renderTabSections(tabId);
+      scheduleGraphRender(tabId);
+    }
+
+    /* 빠른 탭 전환은 한 프레임으로 합치고, 마지막 요청만 그린다 */
+    function scheduleGraphRender(tabId) {
+      if (tabId !== 'dependencies' && tabId !== 'overview') return;
+      var seq = ++graphRenderSeq;
+      requestAnimationFrame(function() {
+        if (seq !== graphRenderSeq || !currentData) return;
+        var graphData = currentData.graph_data;
+        if (tabId === 'dependencies') {
+          var fullWidth = fullGraphContainerEl.clientWidth;
+          if (lastRenderedGraph.full === graphData && lastRenderedGraph.fullFilter === currentGraphFilter &&
+              lastRenderedGraph.fullWidth === fullWidth) return;
+          renderFullGraph(graphData);
+        } else {
+          var width = miniGraphContainerEl.clientWidth;
+          if (lastRenderedGraph.mini === graphData && lastRenderedGraph.miniWidth === width) return;
+          renderMiniGraph(graphData);
+        }
+      });
     }
 
     document.getElementById('tabBar').addEventListener('click', function(e) {
@@ -1485,13 +2444,24 @@ def _render_dashboard_html() -> str:
       loadDashboard().then(function() { switchTab('dependencies'); }).catch(handleErr);
     }
 
-    /* Event delegation for clickable elements */
-    document.addEventListener('click', function(e) {
+    /* Event delegation for clickable elements — data-nav 는 renderSortableTable 이 그리는 표에만 있으므로
+       표 컨테이너(.table-wrap)마다 한 번씩 건다. innerHTML 교체 후에도 컨테이너 요소는 그대로 남고,
+       새 표를 추가해도 따로 등록할 필요가 없다. */
+    function onNavClick(e) {
       var el = e.target.closest('[data-nav]');
-      if (el) navToObject(el.getAttribute('data-nav'));
+      if (el && this.contains(el)) navToObject(el.getAttribute('data-nav'));
+    }
+    document.querySelectorAll('.table-wrap').forEach(function(wrap) {
+      wrap.addEventListener('click', onNavClick, {passive: true});
     });
 
     /* ===== Sortable Table Renderer ===== */
+    var SORT_COLLATOR = new Intl.Collator(undefined, {numeric: true});
+    /* 셀이 nowrap 이라 행 높이가 고정 — 큰 표는 스크롤 영역에 보이는 행과 앞뒤 여유분만 DOM 에 둔다 */
+    var TABLE_WINDOW_MIN = 200;
+    var TABLE_WINDOW_BUFFER = 20;
+    var TABLE_ROW_HEIGHT = 33;
+
     function renderSortableTable(containerId, rows, columns) {
       var container = document.getElementById(containerId);
       if (!rows || !rows.length) {
@@ -1499,17 +2469,70 @@ def _render_dashboard_html() -> str:
         return;
       }
       var sortCol = null, sortAsc = true;
+      // 셀 이스케이프/렌더링은 행마다 한 번만 하고, 정렬 클릭 때는 행 순서(인덱스)만 바꾼다.
+      var rowHtml = rows.map(function(row) {
+        var tds = columns.map(function(c) {
+          var val = row[c.key];
+          if (c.render) return '<td>' + c.render(val, row) + '</td>';
+          return '<td>' + esc(val) + '</td>';
+        }).join('');
+        return '<tr>' + tds + '</tr>';
+      });
+
+      var order = [];
+      var thead = null, body = null, topSpacer = null, bottomSpacer = null;
+      var rowHeight = 0, winStart = -1, winEnd = -1, scrollFrame = 0;
+
+      function sliceRows(start, end) {
+        var html = '';
+        for (var i = start; i < end; i++) html += rowHtml[order[i]];
+        return html;
+      }
+
+      function updateWindow() {
+        var rowH = rowHeight || TABLE_ROW_HEIGHT;
+        var top = Math.max(0, container.scrollTop - thead.offsetHeight);
+        var start = Math.max(0, Math.floor(top / rowH) - TABLE_WINDOW_BUFFER);
+        start -= start % 2;  // 짝수에서 시작해야 줄무늬(nth-child)가 스크롤해도 유지된다
+        var visible = Math.ceil((container.clientHeight || 450) / rowH);
+        var end = Math.min(order.length, start + visible + 2 * TABLE_WINDOW_BUFFER);
+        if (start === winStart && end === winEnd) return;
+        winStart = start; winEnd = end;
+        topSpacer.style.height = (start * rowH) + 'px';
+        bottomSpacer.style.height = ((order.length - end) * rowH) + 'px';
+        body.innerHTML = sliceRows(start, end);
+        // 실제 행 높이는 처음 보이는 상태에서 한 번 재고, 추정값과 다르면 창을 다시 잡는다.
+        if (!rowHeight && body.firstElementChild) {
+          rowHeight = body.firstElementChild.offsetHeight;
+          if (rowHeight && rowHeight !== rowH) { winStart = -1; updateWindow(); }
+        }
+      }
+
+      function onScroll() {
+        if (scrollFrame) return;
+        scrollFrame = requestAnimationFrame(function() { scrollFrame = 0; updateWindow(); });
+      }
 
       function render() {
-        var sorted = rows.slice();
+        var n = rows.length;
+        order = new Array(n);
+        for (var i = 0; i < n; i++) order[i] = i;
         if (sortCol !== null) {
-          sorted.sort(function(a, b) {
-            var va = a[sortCol], vb = b[sortCol];
-            if (va == null) va = '';
-            if (vb == null) vb = '';
-            var cmp = typeof va === 'number' ? va - vb : String(va).localeCompare(String(vb));
-            return sortAsc ? cmp : -cmp;
-          });
+          // 정렬 키는 행마다 한 번만 뽑고, 비교 함수는 키 배열만 본다.
+          var keys = new Array(n), isNum = true;
+          for (i = 0; i < n; i++) {
+            var v = rows[i][sortCol];
+            if (v == null) v = '';
+            if (typeof v !== 'number') isNum = false;
+            keys[i] = v;
+          }
+          var dir = sortAsc ? 1 : -1;
+          if (isNum) {
+            order.sort(function(a, b) { return dir * (keys[a] - keys[b]); });
+          } else {
+            for (i = 0; i < n; i++) keys[i] = String(keys[i]);
+            order.sort(function(a, b) { return dir * SORT_COLLATOR.compare(keys[a], keys[b]); });
+          }
         }
         var ths = columns.map(function(c) {
           var icon = sortCol === c.key ? (sortAsc ? '&#9650;' : '&#9660;') : '&#8597;';
@@ -1517,15 +2540,24 @@ def _render_dashboard_html() -> str:
           return '<th class="' + cls + '" data-col="' + esc(c.key) + '">' +
                  esc(c.label) + ' <span class="sort-icon">' + icon + '</span></th>';
         }).join('');
-        var trs = sorted.map(function(row) {
-          var tds = columns.map(function(c) {
-            var val = row[c.key];
-            if (c.render) return '<td>' + c.render(val, row) + '</td>';
-            return '<td>' + esc(val) + '</td>';
-          }).join('');
-          return '<tr>' + tds + '</tr>';
-        }).join('');
-        container.innerHTML = '<table><thead><tr>' + ths + '</tr></thead><tbody>' + trs + '</tbody></table>';
+        // 컨테이너는 다시 그려도 그대로 남으므로 스크롤 핸들러는 속성으로 덮어써 중복 등록을 막는다.
+        if (order.length <= TABLE_WINDOW_MIN) {
+          container.onscroll = null;
+          container.innerHTML = '<table><thead><tr>' + ths + '</tr></thead><tbody>' +
+            sliceRows(0, order.length) + '</tbody></table>';
+        } else {
+          var spacer = '<tbody class="spacer"><tr><td colspan="' + columns.length + '"></td></tr></tbody>';
+          container.innerHTML = '<table><thead><tr>' + ths + '</tr></thead>' +
+            spacer + '<tbody></tbody>' + spacer + '</table>';
+          var bodies = container.querySelectorAll('tbody');
+          thead = container.querySelector('thead');
+          topSpacer = bodies[0].firstChild.firstChild;
+          body = bodies[1];
+          bottomSpacer = bodies[2].firstChild.firstChild;
+          winStart = winEnd = -1;
+          container.onscroll = onScroll;
+          updateWindow();
+        }
         container.querySelectorAll('th').forEach(function(th) {
           th.addEventListener('click', function() {
             var col = th.getAttribute('data-col');
@@ -1548,16 +2580,24 @@ def _render_dashboard_html() -> str:
         {label:'SQL Tables', value:summary.sql_tables, color:'amber', sub:'참조 테이블'},
         {label:'Unused', value:unusedCount, color:'gray', sub:'미사용 후보'}
       ];
-      document.getElementById('metricGrid').innerHTML = cards.map(function(c) {
-        return '<div class="metric-card ' + c.color + '">' +
-          '<div class="metric-label">' + esc(c.label) + '</div>' +
-          '<div class="metric-value">' + fmt(c.value) + '</div>' +
-          '<div class="metric-sub">' + esc(c.sub) + '</div></div>';
-      }).join('');
+      // 카드 구조는 고정이므로 템플릿을 복제해 텍스트 노드만 채운다 (HTML 파싱/이스케이프 없음).
+      var tpl = metricCardTpl;
+      var grid = metricGridEl;
+      var frag = document.createDocumentFragment();
+      cards.forEach(function(c) {
+        var card = tpl.firstElementChild.cloneNode(true);
+        if (c.color) card.classList.add(c.color);
+        card.children[0].textContent = c.label;
+        card.children[1].textContent = fmt(c.value);
+        card.children[2].textContent = c.sub;
+        frag.appendChild(card);
+      });
+      grid.textContent = '';
+      grid.appendChild(frag);
     }
 
     function renderRelationBar(counts) {
-      var el = document.getElementById('relationBar');
+      var el = relationBarEl;
       if (!counts || !counts.length) {
         el.innerHTML = '<div class="empty-state"><div class="msg">데이터 없음</div></div>';
         return;
@@ -1573,7 +2613,7 @@ def _render_dashboard_html() -> str:
     }
 
     function renderRunInfo(run) {
-      var el = document.getElementById('runInfo');
+      var el = runInfoEl;
       if (!run) { el.innerHTML = '<div class="empty-state"><div class="msg">데이터 없음</div></div>'; return; }
       el.innerHTML =
         '<dt>Run ID</dt><dd class="mono">' + esc(run.run_id) + '</dd>' +
@@ -1587,6 +2627,8 @@ def _render_dashboard_html() -> str:
     function renderMiniGraph(graphData) {
       var svg = d3.select('#miniGraphSvg');
       svg.selectAll('*').remove();
+      lastRenderedGraph.mini = graphData;
+      lastRenderedGraph.miniWidth = miniGraphContainerEl.clientWidth;
       if (!graphData || !graphData.nodes || !graphData.nodes.length) {
         svg.append('text').attr('x',20).attr('y',30).attr('fill','#94a3b8').attr('font-size',13).text('그래프 데이터 없음');
         return;
@@ -1596,7 +2638,7 @@ def _render_dashboard_html() -> str:
       topNodes.forEach(function(n) { nodeSet[n.id] = true; });
       var edges = graphData.edges.filter(function(e) { return nodeSet[e.src] && nodeSet[e.dst]; });
 
-      var container = document.getElementById('miniGraphContainer');
+      var container = miniGraphContainerEl;
       var width = container.clientWidth || 600;
       var height = 280;
       svg.attr('viewBox', '0 0 ' + width + ' ' + height);
@@ -1610,54 +2652,375 @@ def _render_dashboard_html() -> str:
           .attr('fill', t === 'calls' ? '#3b82f6' : '#f59e0b');
       });
 
-      var nodes = topNodes.map(function(n) { return Object.assign({}, n); });
-      var links = edges.map(function(e) { return {source:e.src, target:e.dst, type:e.relation_type}; });
+      var seq = ++miniGraphSeq;
+      runMiniLayout({
+        seq: seq, width: width, height: height,
+        nodes: topNodes.map(function(n) { return {id: n.id, degree: n.degree || 0}; }),
+        links: edges.map(function(e) { return {source: e.src, target: e.dst}; })
+      }, function(layout) {
+        if (layout.seq !== miniGraphSeq) return;
+        var byId = {};
+        var nodes = topNodes.map(function(n, i) {
+          var node = {id: n.id, name: n.name, degree: n.degree, x: layout.xs[i], y: layout.ys[i]};
+          byId[n.id] = node;
+          return node;
+        });
+        var links = edges.map(function(e) {
+          return {source: byId[e.src], target: byId[e.dst], type: e.relation_type};
+        });
+        drawMiniGraph(svg, nodes, links);
+      });
+    }
+
+    function drawMiniGraph(svg, nodes, links) {
+      // 정적인 배치이므로 요소를 하나씩 만들지 않고 마크업 문자열로 한 번에 넣는다.
+      // 색/굵기/투명도는 요소마다 속성으로 쓰지 않고 CSS 클래스(#miniGraphSvg .edge/.node)가 맡는다.
+      var parts = [];
+      links.forEach(function(d) {
+        parts.push('<line class="edge' + (d.type === 'opens' ? ' opens' : '') +
+          '" x1="' + d.source.x + '" y1="' + d.source.y +
+          '" x2="' + d.target.x + '" y2="' + d.target.y +
+          '" marker-end="url(#mini-arrow-' + esc(d.type) + ')"></line>');
+      });
+      nodes.forEach(function(d) {
+        var r = 4 + Math.min(8, (d.degree || 0) * 0.8);
+        parts.push('<g class="node" transform="translate(' + d.x + ',' + d.y + ')">' +
+          '<circle r="' + r + '"></circle>' +
+          '<text y="' + -(6 + Math.min(8, (d.degree || 0) * 0.8)) + '">' + esc(d.name) + '</text></g>');
+      });
+      svg.node().insertAdjacentHTML('beforeend', parts.join(''));
+    }
+
+    /* 미니 그래프 배치(150 tick)는 워커에서 돌리고 좌표만 Float32Array로 넘겨받는다.
+       노드가 20개 이하라 d3-force와 같은 힘(link, charge, center, collide)을 typed array(SoA) 위에서
+       쌍별로 직접 계산하며, 그래서 워커는 d3 없이 동작한다. */
+    function miniLayout(msg) {
+      var n = msg.nodes.length, m = msg.links.length, i, j, k;
+      var xs = new Float32Array(n), ys = new Float32Array(n);
+      var vxs = new Float32Array(n), vys = new Float32Array(n);
+      var radii = new Float32Array(n), counts = new Float32Array(n), index = {};
+      var src = new Int32Array(m), dst = new Int32Array(m);
+      var bias = new Float32Array(m), strength = new Float32Array(m);
+      for (i = 0; i < n; i++) {
+        var r0 = 10 * Math.sqrt(0.5 + i), a0 = i * Math.PI * (3 - Math.sqrt(5));
+        xs[i] = r0 * Math.cos(a0);
+        ys[i] = r0 * Math.sin(a0);
+        radii[i] = 8 + Math.min(10, msg.nodes[i].degree || 0) + 5;
+        index[msg.nodes[i].id] = i;
+      }
+      for (k = 0; k < m; k++) {
+        src[k] = index[msg.links[k].source];
+        dst[k] = index[msg.links[k].target];
+        counts[src[k]]++;
+        counts[dst[k]]++;
+      }
+      for (k = 0; k < m; k++) {
+        bias[k] = counts[src[k]] / (counts[src[k]] + counts[dst[k]]);
+        strength[k] = 1 / Math.min(counts[src[k]], counts[dst[k]]);
+      }
+
+      var alpha = 1, alphaDecay = 1 - Math.pow(0.001, 1 / 300);
+      var cx = msg.width / 2, cy = msg.height / 2;
+      for (var tick = 0; tick < 150; tick++) {
+        alpha -= alpha * alphaDecay;
+        for (k = 0; k < m; k++) {
+          var s = src[k], t = dst[k];
+          var lx = xs[t] + vxs[t] - xs[s] - vxs[s] || 1e-6;
+          var ly = ys[t] + vys[t] - ys[s] - vys[s] || 1e-6;
+          var l = Math.sqrt(lx * lx + ly * ly);
+          l = (l - 60) / l * alpha * strength[k];
+          lx *= l; ly *= l;
+          vxs[t] -= lx * bias[k]; vys[t] -= ly * bias[k];
+          vxs[s] += lx * (1 - bias[k]); vys[s] += ly * (1 - bias[k]);
+        }
+        for (i = 0; i < n; i++) {
+          for (j = 0; j < n; j++) {
+            if (i === j) continue;
+            var qx = xs[j] - xs[i] || 1e-6, qy = ys[j] - ys[i] || 1e-6;
+            var q2 = qx * qx + qy * qy;
+            if (q2 < 1) q2 = Math.sqrt(q2);
+            vxs[i] += qx * -120 * alpha / q2;
+            vys[i] += qy * -120 * alpha / q2;
+          }
+        }
+        var sx = 0, sy = 0;
+        for (i = 0; i < n; i++) { sx += xs[i]; sy += ys[i]; }
+        sx = sx / n - cx; sy = sy / n - cy;
+        for (i = 0; i < n; i++) { xs[i] -= sx; ys[i] -= sy; }
+        for (i = 0; i < n; i++) {
+          var xi = xs[i] + vxs[i], yi = ys[i] + vys[i], ri2 = radii[i] * radii[i];
+          for (j = i + 1; j < n; j++) {
+            var ox = xi - xs[j] - vxs[j] || 1e-6, oy = yi - ys[j] - vys[j] || 1e-6;
+            var rr = radii[i] + radii[j], o2 = ox * ox + oy * oy;
+            if (o2 >= rr * rr) continue;
+            var ol = Math.sqrt(o2);
+            ol = (rr - ol) / ol;
+            ox *= ol; oy *= ol;
+            var share = radii[j] * radii[j] / (ri2 + radii[j] * radii[j]);
+            vxs[i] += ox * share; vys[i] += oy * share;
+            vxs[j] -= ox * (1 - share); vys[j] -= oy * (1 - share);
+          }
+        }
+        for (i = 0; i < n; i++) {
+          vxs[i] *= 0.6; vys[i] *= 0.6;
+          xs[i] += vxs[i]; ys[i] += vys[i];
+        }
+      }
+
+      for (i = 0; i < n; i++) {
+        xs[i] = Math.max(30, Math.min(msg.width - 30, xs[i]));
+        ys[i] = Math.max(30, Math.min(msg.height - 30, ys[i]));
+      }
+      return {seq: msg.seq, xs: xs, ys: ys};
+    }
+
+    function getGraphWorker() {
+      if (graphWorker !== null) return graphWorker;
+      try {
+        var source = 'var miniLayout = ' + miniLayout.toString() + ';' +
+          'onmessage = function(ev) { var r = miniLayout(ev.data); postMessage(r, [r.xs.buffer, r.ys.buffer]); };';
+        graphWorker = new Worker(URL.createObjectURL(new Blob([source], {type: 'text/javascript'})));
+        graphWorker.onmessage = function(ev) {
+          var pending = pendingMiniLayout;
+          if (!pending || pending.msg.seq !== ev.data.seq) return;
+          pendingMiniLayout = null;
+          pending.done(ev.data);
+        };
+        graphWorker.onerror = function(ev) {
+          // 워커를 못 쓰는 환경(CSP 등)이면 이후로는 메인 스레드에서 계산한다.
+          if (ev && ev.preventDefault) ev.preventDefault();
+          graphWorker.terminate();
+          graphWorker = false;
+          var pending = pendingMiniLayout;
+          pendingMiniLayout = null;
+          if (pending) pending.done(miniLayout(pending.msg));
+        };
+      } catch (err) {
+        graphWorker = false;
+      }
+      return graphWorker;
+    }
 
-      var sim = d3.forceSimulation(nodes)
-        .force('link', d3.forceLink(links).id(function(d){return d.id;}).distance(60))
-        .force('charge', d3.forceManyBody().strength(-120))
-        .force('center', d3.forceCenter(width/2, height/2))
-        .force('collision', d3.forceCollide().radius(function(d){return 8+Math.min(10,d.degree||0)+5;}))
+    function runMiniLayout(msg, done) {
+      var worker = getGraphWorker();
+      if (!worker) {
+        done(miniLayout(msg));
+        return;
+      }
+      pendingMiniLayout = {msg: msg, done: done};
+      worker.postMessage(msg);
+    }
+
+    /* 전체 그래프 force 레이아웃. 워커와 메인 스레드가 같은 함수를 쓴다 (워커에는 toString 으로 보낸다).
+       msg = {n, width, height, radii, src, dst}. 위치가 바뀔 때마다 post(Float32Array[x0,y0,x1,y1,...]). */
+    function fullForceLayout(msg, post) {
+      var n = msg.n, nodes = new Array(n), links = new Array(msg.src.length);
+      // msg.positions 가 있으면(이전 배치 캐시) 그 자리에서 시작하고 미리 계산을 건너뛴다.
+      // msg.warm 은 직전 배치에 있던 노드 위치(새 노드는 NaN) — 그 자리에서 낮은 alpha 로 조금만 다시 식힌다.
+      var seeded = msg.positions || null, start = seeded || msg.warm || null;
+      for (var i = 0; i < n; i++) {
+        nodes[i] = {
+          index: i, x: start ? start[2 * i] : NaN, y: start ? start[2 * i + 1] : NaN,
+          vx: 0, vy: 0, fx: null, fy: null, r: msg.radii[i]
+        };
+      }
+      for (var k = 0; k < links.length; k++) links[k] = {source: msg.src[k], target: msg.dst[k]};
+      if (msg.warm) {
+        // 새로 나타난 노드는 이미 자리가 있는 이웃 옆에 둔다 (없으면 d3 기본 배치).
+        for (k = 0; k < links.length; k++) {
+          var a = nodes[msg.src[k]], b = nodes[msg.dst[k]];
+          if (isNaN(a.x) && !isNaN(b.x)) { a.x = b.x + Math.random() * 20 - 10; a.y = b.y + Math.random() * 20 - 10; }
+          else if (isNaN(b.x) && !isNaN(a.x)) { b.x = a.x + Math.random() * 20 - 10; b.y = a.y + Math.random() * 20 - 10; }
+        }
+      }
+      function emit() {
+        var positions = new Float32Array(n * 2);
+        for (var j = 0; j < n; j++) { positions[2 * j] = nodes[j].x; positions[2 * j + 1] = nodes[j].y; }
+        post(positions);
+      }
+      var simulation = d3.forceSimulation(nodes)
+        .force('link', d3.forceLink(links).distance(70))
+        // Barnes-Hut 근사를 조금 느슨하게(theta 0.9 -> 1.2) 하고 300px 밖의 반발력은 무시한다.
+        .force('charge', d3.forceManyBody().strength(-150).theta(1.2).distanceMax(300))
+        .force('center', d3.forceCenter(msg.width / 2, msg.height / 2))
+        .force('collision', d3.forceCollide().radius(function(d) { return d.r + 6; }).iterations(1))
+        // 대시보드 규모(수백 노드)에서는 기본값(약 300 tick)까지 식힐 필요가 없다. 작은 그래프는 더 빨리 식힌다.
+        .alphaDecay(n < 50 ? 0.08 : 0.04)
+        .velocityDecay(0.3)
+        .alphaMin(0.01)
+        .on('tick', emit)
         .stop();
-      for (var i=0; i<150; i++) sim.tick();
-      nodes.forEach(function(n) {
-        n.x = Math.max(30, Math.min(width-30, n.x));
-        n.y = Math.max(30, Math.min(height-30, n.y));
-      });
+      // 수렴 과정을 애니메이션하지 않고 미리 계산해 최종 배치만 보낸다 (약 110 tick, 작은 그래프는 약 60).
+      // tick 이벤트는 드래그로 다시 시작할 때만 쓰인다.
+      if (seeded) {
+        simulation.alpha(0);
+      } else {
+        if (msg.warm) simulation.alpha(msg.reheat);
+        var ticks = Math.ceil(Math.log(simulation.alphaMin() / simulation.alpha()) / Math.log(1 - simulation.alphaDecay()));
+        for (var t = 0; t < ticks; t++) simulation.tick();
+        emit();
+      }
+      var dragging = 0;
+      return {
+        grab: function(index, x, y) {
+          if (!dragging++) simulation.alphaTarget(0.3).restart();
+          nodes[index].fx = x; nodes[index].fy = y;
+        },
+        drag: function(index, x, y) { nodes[index].fx = x; nodes[index].fy = y; },
+        release: function(index) {
+          if (!--dragging) simulation.alphaTarget(0);
+          nodes[index].fx = null; nodes[index].fy = null;
+        },
+        stop: function() { simulation.stop(); }
+      };
+    }
+
+    function getFullGraphWorker() {
+      if (fullGraphWorker !== null) return fullGraphWorker;
+      try {
+        var source = "importScripts('__D3_FORCE_SCRIPT_URL__');" +
+          'var fullForceLayout = ' + fullForceLayout.toString() + ';' +
+          'var layout = null;' +
+          'onmessage = function(ev) { var m = ev.data;' +
+          ' if (m.type === "start") { if (layout) layout.stop(); var seq = m.seq;' +
+          '  layout = fullForceLayout(m, function(p) { postMessage({seq: seq, positions: p}, [p.buffer]); }); }' +
+          ' else if (layout) layout[m.type](m.index, m.x, m.y); };';
+        fullGraphWorker = new Worker(URL.createObjectURL(new Blob([source], {type: 'text/javascript'})));
+        fullGraphWorker.onmessage = function(ev) {
+          var pending = pendingFullLayout;
+          if (pending && pending.seq === ev.data.seq) pending.onPositions(ev.data.positions);
+        };
+        fullGraphWorker.onerror = function(ev) {
+          // 워커나 importScripts 를 못 쓰는 환경이면 이후로는 메인 스레드에서 계산한다.
+          if (ev && ev.preventDefault) ev.preventDefault();
+          fullGraphWorker.terminate();
+          fullGraphWorker = false;
+          var pending = pendingFullLayout;
+          if (pending) pending.fallback();
+        };
+      } catch (err) {
+        fullGraphWorker = false;
+      }
+      return fullGraphWorker;
+    }
+
+    /* 레이아웃을 워커(가능하면) 또는 메인 스레드에서 시작하고 grab/drag/release/stop 을 돌려준다. */
+    function startFullLayout(msg, onPositions) {
+      var seq = ++fullGraphSeq;
+      var local = null, stopped = false;
+      function runLocal() {
+        // 메인 스레드에서도 탭 전환이 먼저 그려지도록 다음 태스크에서 계산한다.
+        setTimeout(function() {
+          if (!stopped) local = fullForceLayout(msg, onPositions);
+        }, 0);
+      }
+      var worker = getFullGraphWorker();
+      pendingFullLayout = {seq: seq, onPositions: onPositions, fallback: runLocal};
+      if (worker) {
+        msg.type = 'start';
+        msg.seq = seq;
+        worker.postMessage(msg);
+      } else {
+        runLocal();
+      }
+      function send(type, index, x, y) {
+        if (local) local[type](index, x, y);
+        else if (fullGraphWorker) fullGraphWorker.postMessage({type: type, index: index, x: x, y: y});
+      }
+      return {
+        grab: function(index, x, y) { send('grab', index, x, y); },
+        drag: function(index, x, y) { send('drag', index, x, y); },
+        release: function(index) { send('release', index); },
+        stop: function() {
+          stopped = true;
+          if (local) local.stop();
+          else if (fullGraphWorker) fullGraphWorker.postMessage({type: 'stop'});
+          if (pendingFullLayout && pendingFullLayout.seq === seq) pendingFullLayout = null;
+        }
+      };
+    }
 
-      svg.selectAll('line.edge').data(links).join('line').attr('class','edge')
-        .attr('x1',function(d){return d.source.x;}).attr('y1',function(d){return d.source.y;})
-        .attr('x2',function(d){return d.target.x;}).attr('y2',function(d){return d.target.y;})
-        .attr('stroke',function(d){return d.type==='opens'?'#f59e0b':'#3b82f6';})
-        .attr('stroke-width',1.5).attr('stroke-opacity',0.5)
-        .attr('marker-end',function(d){return 'url(#mini-arrow-'+d.type+')';});
+    /* 연결 수 상위 limit 개만 남기고, 나머지 노드는 붙어 있던 상위 노드(허브)별로 '+N' 묶음 노드 하나로 접는다.
+       상위 노드와 닿지 않는 나머지는 '기타' 묶음 하나로 모은다. 접힌 노드 사이의 간선은 버린다. */
+    function reduceFullGraph(nodes, edges, limit) {
+      var ranked = nodes.slice().sort(function(a, b) { return (b.degree || 0) - (a.degree || 0); });
+      var kept = {}, degreeOf = {};
+      ranked.forEach(function(d, i) { if (i < limit) kept[d.id] = true; degreeOf[d.id] = d.degree || 0; });
+      // 접히는 노드마다 가장 연결이 많은 상위 이웃을 허브로 고른다.
+      var hubOf = {};
+      edges.forEach(function(e) {
+        var pairs = [[e.src, e.dst], [e.dst, e.src]];
+        for (var i = 0; i < 2; i++) {
+          var folded = pairs[i][0], hub = pairs[i][1];
+          if (kept[folded] || !kept[hub]) continue;
+          if (hubOf[folded] === undefined || degreeOf[hub] > degreeOf[hubOf[folded]]) hubOf[folded] = hub;
+        }
+      });
+      var groups = {}, groupOrder = [];
+      ranked.slice(limit).forEach(function(d) {
+        var hub = hubOf[d.id] === undefined ? null : hubOf[d.id];
+        var key = hub === null ? '' : hub;
+        if (!groups[key]) { groups[key] = {hub: hub, count: 0}; groupOrder.push(key); }
+        groups[key].count++;
+      });
+      var outNodes = ranked.slice(0, limit);
+      var outEdges = edges.filter(function(e) { return kept[e.src] && kept[e.dst]; });
+      groupOrder.forEach(function(key, i) {
+        var g = groups[key], id = '\\u0000folded:' + i;
+        outNodes.push({
+          id: id, name: (g.hub === null ? '기타 +' : '+') + g.count,
+          in_degree: 0, out_degree: 0, degree: Math.min(20, g.count), folded: g.count
+        });
+        if (g.hub !== null) outEdges.push({src: g.hub, dst: id, relation_type: 'calls', confidence: 0});
+      });
+      return {nodes: outNodes, edges: outEdges};
+    }
 
-      var g = svg.selectAll('g.node').data(nodes).join('g').attr('class','node')
-        .attr('transform',function(d){return 'translate('+d.x+','+d.y+')';});
-      g.append('circle')
-        .attr('r',function(d){return 4+Math.min(8,(d.degree||0)*0.8);})
-        .attr('fill','#0d9488').attr('fill-opacity',0.85).attr('stroke','#115e59').attr('stroke-width',1);
-      g.append('text').text(function(d){return d.name;})
-        .attr('y',function(d){return -(6+Math.min(8,(d.degree||0)*0.8));})
-        .attr('text-anchor','middle').attr('font-size',9).attr('fill','#475569');
+    function setShowAllGraphNodes(showAll) {
+      showAllGraphNodes = showAll;
+      graphDetailEl.querySelectorAll('.toggle-btn').forEach(function(b) {
+        b.classList.toggle('active', (b.getAttribute('data-detail') === 'all') === showAll);
+      });
+      if (currentData) renderFullGraph(currentData.graph_data);
     }
 
     /* ===== Full Interactive Graph (Dependencies) ===== */
     function renderFullGraph(graphData) {
-      var svgEl = document.getElementById('fullGraphSvg');
-      var svg = d3.select(svgEl);
-      svg.selectAll('*').remove();
+      var canvas = fullGraphCanvasEl;
+      var container = fullGraphContainerEl;
+      var tooltip = graphTooltipEl;
       if (fullSimulation) { fullSimulation.stop(); fullSimulation = null; }
+      if (fullGraphFrame) { cancelAnimationFrame(fullGraphFrame); fullGraphFrame = 0; }
+      d3.select(canvas).on('.zoom', null).on('.drag', null)
+        .on('pointermove', null).on('pointerleave', null).on('click', null);
+      tooltip.classList.remove('visible');
+      lastRenderedGraph.full = graphData;
+      lastRenderedGraph.fullFilter = currentGraphFilter;
+      lastRenderedGraph.fullWidth = container.clientWidth;
+
+      // 캔버스 픽셀 크기는 CSS 크기 x devicePixelRatio 로 맞춘다.
+      var width = container.clientWidth || 900;
+      var height = canvas.clientHeight || 550;
+      var dpr = window.devicePixelRatio || 1;
+      canvas.width = Math.round(width * dpr);
+      canvas.height = Math.round(height * dpr);
+      var ctx = canvas.getContext('2d');
+      ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+      ctx.clearRect(0, 0, width, height);
+      var font = getComputedStyle(canvas).fontFamily;
+
+      function drawMessage(text) {
+        ctx.fillStyle = '#94a3b8';
+        ctx.font = '13px ' + font;
+        ctx.textAlign = 'left';
+        ctx.fillText(text, 20, 30);
+      }
 
       if (!graphData || !graphData.nodes || !graphData.nodes.length) {
-        svg.append('text').attr('x',20).attr('y',30).attr('fill','#94a3b8').attr('font-size',13).text('그래프 데이터 없음');
+        drawMessage('그래프 데이터 없음');
         return;
       }
 
-      var container = document.getElementById('fullGraphContainer');
-      var width = container.clientWidth || 900;
-      var height = parseInt(getComputedStyle(svgEl).height) || 550;
-
       var filteredEdges = graphData.edges;
       if (currentGraphFilter !== 'all') {
         filteredEdges = graphData.edges.filter(function(e) { return e.relation_type === currentGraphFilter; });
@@ -1667,101 +3030,265 @@ def _render_dashboard_html() -> str:
       var filteredNodes = graphData.nodes.filter(function(n) { return nodeIds[n.id]; });
 
       if (!filteredNodes.length) {
-        svg.append('text').attr('x',20).attr('y',30).attr('fill','#94a3b8').attr('font-size',13).text('선택된 관계 타입의 데이터 없음');
+        drawMessage('선택된 관계 타입의 데이터 없음');
         return;
       }
 
-      svg.attr('viewBox', '0 0 ' + width + ' ' + height);
+      // 노드가 많으면 연결 수 상위만 그리고 나머지는 묶음 노드로 접는다 ('전체 보기'로 해제).
+      var tooMany = filteredNodes.length > FULL_GRAPH_NODE_LIMIT;
+      graphDetailEl.hidden = !tooMany;
+      if (tooMany && !showAllGraphNodes) {
+        var reduced = reduceFullGraph(filteredNodes, filteredEdges, FULL_GRAPH_NODE_LIMIT);
+        filteredNodes = reduced.nodes;
+        filteredEdges = reduced.edges;
+      }
 
-      var defs = svg.append('defs');
-      ['calls','opens'].forEach(function(t) {
-        defs.append('marker').attr('id','full-arrow-'+t)
-          .attr('viewBox','0 0 10 10').attr('refX',20).attr('refY',5)
-          .attr('markerWidth',6).attr('markerHeight',6).attr('orient','auto')
-          .append('path').attr('d','M 0 0 L 10 5 L 0 10 z')
-          .attr('fill', t==='calls'?'#3b82f6':'#f59e0b');
-      });
+      // 노드는 고정된 필드로 한 번에 만든다. 위치(x/y)는 레이아웃이 보내 주는 값으로 채운다.
+      var n = filteredNodes.length;
+      var nodes = new Array(n), nodeById = {}, radii = new Float32Array(n);
+      for (var ni = 0; ni < n; ni++) {
+        var src = filteredNodes[ni];
+        var r = 6 + Math.min(14, (src.degree || 0) * 0.7);
+        nodes[ni] = {
+          id: src.id, name: src.name,
+          in_degree: src.in_degree || 0, out_degree: src.out_degree || 0, degree: src.degree || 0,
+          index: ni, x: NaN, y: NaN, r: r, folded: src.folded || 0
+        };
+        nodeById[src.id] = nodes[ni];
+        radii[ni] = r;
+      }
+      // 축소 상태에서도 라벨을 유지할 허브 기준: 연결 수 상위 10% (최소 1).
+      var degrees = nodes.map(function(d) { return d.degree; }).sort(function(a, b) { return b - a; });
+      var hubDegree = Math.max(1, degrees[Math.floor(n * 0.1)] || 0);
+      var links = new Array(filteredEdges.length);
+      // 호버 때 간선 전체를 훑지 않도록 노드 인덱스별 이웃 목록을 한 번 만든다.
+      var neighbors = new Array(n);
+      for (ni = 0; ni < n; ni++) neighbors[ni] = [];
+      var linkSrc = new Int32Array(filteredEdges.length), linkDst = new Int32Array(filteredEdges.length);
+      for (var li = 0; li < filteredEdges.length; li++) {
+        var e = filteredEdges[li];
+        links[li] = {
+          source: nodeById[e.src], target: nodeById[e.dst], type: e.relation_type, confidence: e.confidence,
+          color: e.relation_type === 'opens' ? '#f59e0b' : '#3b82f6'
+        };
+        linkSrc[li] = links[li].source.index;
+        linkDst[li] = links[li].target.index;
+        neighbors[linkSrc[li]].push(linkDst[li]);
+        neighbors[linkDst[li]].push(linkSrc[li]);
+      }
 
-      var nodes = filteredNodes.map(function(n) { return Object.assign({}, n); });
-      var links = filteredEdges.map(function(e) {
-        return {source:e.src, target:e.dst, type:e.relation_type, confidence:e.confidence};
-      });
+      /* SVG 요소 대신 캔버스 한 장에 매 프레임 전체를 다시 그린다 (DOM 속성 쓰기 없음). */
+      var transform = d3.zoomTransform(canvas);
+      var hovered = null;
+      var connectedMark = new Int32Array(n), connectedStamp = 0;
+      var quadtree = null;
+
+      function draw() {
+        ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+        ctx.clearRect(0, 0, width, height);
+        ctx.translate(transform.x, transform.y);
+        ctx.scale(transform.k, transform.k);
+
+        // 화면(시뮬레이션 좌표) 밖의 노드/간선은 그리지 않는다. 여백은 라벨/반지름 몫.
+        var k = transform.k, pad = 40;
+        var x0 = -transform.x / k - pad, y0 = -transform.y / k - pad;
+        var x1 = (width - transform.x) / k + pad, y1 = (height - transform.y) / k + pad;
+        // 축소해서 보면 라벨이 겹치기만 하므로 연결이 많은 노드(와 호버 이웃)만 라벨을 단다.
+        var minLabelDegree = k >= FULL_GRAPH_LABEL_ZOOM ? 0 : hubDegree;
+
+        ctx.lineWidth = 1.5;
+        var lastAlpha = -1, lastColor = null;
+        for (var i = 0; i < links.length; i++) {
+          var l = links[i], s = l.source, t = l.target;
+          if ((s.x < x0 && t.x < x0) || (s.x > x1 && t.x > x1) ||
+              (s.y < y0 && t.y < y0) || (s.y > y1 && t.y > y1)) continue;
+          var dx = t.x - s.x, dy = t.y - s.y, len = Math.sqrt(dx * dx + dy * dy) || 1;
+          var ux = dx / len, uy = dy / len;
+          // 화살촉 끝은 대상 노드 테두리에 맞춘다.
+          var tipX = t.x - ux * (t.r + 2), tipY = t.y - uy * (t.r + 2);
+          var alpha = hovered ? (s === hovered || t === hovered ? 0.8 : 0.05) : 0.4;
+          // 캔버스 상태(색 문자열 파싱 포함)는 값이 바뀔 때만 설정한다.
+          if (alpha !== lastAlpha) { ctx.globalAlpha = lastAlpha = alpha; }
+          if (l.color !== lastColor) { ctx.strokeStyle = ctx.fillStyle = lastColor = l.color; }
+          ctx.beginPath();
+          ctx.moveTo(s.x, s.y);
+          ctx.lineTo(tipX, tipY);
+          ctx.stroke();
+          ctx.beginPath();
+          ctx.moveTo(tipX, tipY);
+          ctx.lineTo(tipX - ux * 8 - uy * 4, tipY - uy * 8 + ux * 4);
+          ctx.lineTo(tipX - ux * 8 + uy * 4, tipY - uy * 8 - ux * 4);
+          ctx.closePath();
+          ctx.fill();
+        }
 
-      var gRoot = svg.append('g');
-      var zoom = d3.zoom().scaleExtent([0.3, 5]).on('zoom', function(event) {
-        gRoot.attr('transform', event.transform);
-      });
-      svg.call(zoom);
-
-      var linkSel = gRoot.selectAll('line.edge').data(links).join('line').attr('class','edge')
-        .attr('stroke',function(d){return d.type==='opens'?'#f59e0b':'#3b82f6';})
-        .attr('stroke-width',1.5).attr('stroke-opacity',0.4)
-        .attr('marker-end',function(d){return 'url(#full-arrow-'+d.type+')';});
-
-      var nodeSel = gRoot.selectAll('g.node').data(nodes).join('g').attr('class','node').style('cursor','pointer');
-      var circles = nodeSel.append('circle')
-        .attr('r',function(d){return 6+Math.min(14,(d.degree||0)*0.7);})
-        .attr('fill','#0d9488').attr('fill-opacity',0.85).attr('stroke','#115e59').attr('stroke-width',1.5);
-      var labels = nodeSel.append('text').text(function(d){return d.name;})
-        .attr('dy',function(d){return -(8+Math.min(14,(d.degree||0)*0.7));})
-        .attr('text-anchor','middle').attr('font-size',10).attr('fill','#475569').attr('pointer-events','none');
-
-      var tooltip = document.getElementById('graphTooltip');
-
-      nodeSel.on('mouseenter', function(event, d) {
-        tooltip.innerHTML = '<strong>' + esc(d.name) + '</strong><br>In: ' + d.in_degree + ' / Out: ' + d.out_degree + ' / Total: ' + d.degree;
-        tooltip.classList.add('visible');
+        ctx.font = '10px ' + font;
+        ctx.textAlign = 'center';
+        for (var j = 0; j < nodes.length; j++) {
+          var n = nodes[j];
+          if (n.x < x0 || n.x > x1 || n.y < y0 || n.y > y1) continue;
+          var dim = hovered && connectedMark[j] !== connectedStamp;
+          ctx.globalAlpha = dim ? 0.15 : (hovered ? 1 : 0.85);
+          ctx.beginPath();
+          ctx.arc(n.x, n.y, n.r, 0, 2 * Math.PI);
+          ctx.fillStyle = n.folded ? '#94a3b8' : '#0d9488';
+          ctx.fill();
+          ctx.globalAlpha = 1;
+          ctx.strokeStyle = '#115e59';
+          ctx.stroke();
+          if (n.degree < minLabelDegree && !(hovered && !dim)) continue;
+          ctx.globalAlpha = dim ? 0.15 : 1;
+          ctx.fillStyle = '#475569';
+          ctx.fillText(n.name, n.x, n.y - n.r - 2);
+        }
+        ctx.globalAlpha = 1;
+      }
+
+      /* tick/zoom/hover 가 한 프레임에 여러 번 와도 그리기는 다음 프레임에 한 번만 한다. */
+      function scheduleDraw() {
+        if (!fullGraphFrame) {
+          fullGraphFrame = requestAnimationFrame(function() { fullGraphFrame = 0; draw(); });
+        }
+      }
+
+      /* 포인터 위치의 노드는 quadtree 로 찾는다. 위치가 바뀌면(tick) 다시 만든다. */
+      function nodeAt(event) {
+        var p = transform.invert(d3.pointer(event, canvas));
+        if (!quadtree) quadtree = d3.quadtree(nodes, function(d) { return d.x; }, function(d) { return d.y; });
+        var n = quadtree.find(p[0], p[1], 20);
+        if (!n) return null;
+        var dx = n.x - p[0], dy = n.y - p[1];
+        return dx * dx + dy * dy <= n.r * n.r ? n : null;
+      }
+
+      function setHovered(n) {
+        if (n === hovered) return;
+        hovered = n;
+        if (n) {
+          // 이웃 표시는 인접 목록만 훑는다 (O(차수)). 스탬프 값을 올려 이전 표시를 지우지 않아도 된다.
+          connectedStamp++;
+          connectedMark[n.index] = connectedStamp;
+          var around = neighbors[n.index];
+          for (var k = 0; k < around.length; k++) connectedMark[around[k]] = connectedStamp;
+        }
+        canvas.style.cursor = n ? 'pointer' : '';
+        scheduleDraw();
+      }
+
+      var canvasSel = d3.select(canvas);
+      canvasSel.on('pointermove', function(event) {
+        var n = nodeAt(event);
+        // 같은 노드 위에서 움직이는 동안은 강조/툴팁 내용을 다시 만들지 않고 위치만 옮긴다.
+        if (n !== hovered) {
+          setHovered(n);
+          if (!n) { tooltip.classList.remove('visible'); return; }
+          tooltip.innerHTML = n.folded
+            ? '<strong>' + fmt(n.folded) + '개 노드 묶음</strong><br>클릭하면 전체 보기'
+            : '<strong>' + esc(n.name) + '</strong><br>In: ' + n.in_degree + ' / Out: ' + n.out_degree + ' / Total: ' + n.degree;
+          tooltip.classList.add('visible');
+        }
+        if (!n) return;
         var rect = container.getBoundingClientRect();
         tooltip.style.left = (event.clientX - rect.left + 12) + 'px';
         tooltip.style.top = (event.clientY - rect.top - 10) + 'px';
-        var connected = {};
-        connected[d.id] = true;
-        links.forEach(function(l) {
-          var sId = typeof l.source === 'object' ? l.source.id : l.source;
-          var tId = typeof l.target === 'object' ? l.target.id : l.target;
-          if (sId === d.id) connected[tId] = true;
-          if (tId === d.id) connected[sId] = true;
-        });
-        circles.attr('fill-opacity', function(n) { return connected[n.id] ? 1 : 0.15; });
-        linkSel.attr('stroke-opacity', function(l) {
-          var sId = typeof l.source === 'object' ? l.source.id : l.source;
-          var tId = typeof l.target === 'object' ? l.target.id : l.target;
-          return (sId === d.id || tId === d.id) ? 0.8 : 0.05;
-        });
-        labels.attr('fill-opacity', function(n) { return connected[n.id] ? 1 : 0.15; });
-      }).on('mouseleave', function() {
+      }).on('pointerleave', function() {
         tooltip.classList.remove('visible');
-        circles.attr('fill-opacity', 0.85);
-        linkSel.attr('stroke-opacity', 0.4);
-        labels.attr('fill-opacity', 1);
-      }).on('click', function(event, d) {
-        navToObject(d.name);
+        setHovered(null);
+      }).on('click', function(event) {
+        var n = nodeAt(event);
+        if (n && n.folded) setShowAllGraphNodes(true);
+        else if (n) navToObject(n.name);
       });
 
-      nodeSel.call(d3.drag()
-        .on('start', function(event, d) {
-          if (!event.active) fullSimulation.alphaTarget(0.3).restart();
-          d.fx = d.x; d.fy = d.y;
+      // 노드 위에서 시작한 제스처는 drag, 빈 곳은 zoom/pan 이 받는다.
+      canvasSel.call(d3.drag()
+        .container(canvas)
+        .subject(function(event) { return nodeAt(event) || undefined; })
+        .on('start', function(event) {
+          fullSimulation.grab(event.subject.index, event.subject.x, event.subject.y);
         })
-        .on('drag', function(event, d) { d.fx = event.x; d.fy = event.y; })
-        .on('end', function(event, d) {
-          if (!event.active) fullSimulation.alphaTarget(0);
-          d.fx = null; d.fy = null;
+        .on('drag', function(event) {
+          var p = transform.invert(d3.pointer(event, canvas));
+          // 레이아웃 응답을 기다리지 않고 끌고 있는 노드는 바로 옮겨 그린다.
+          event.subject.x = p[0]; event.subject.y = p[1];
+          quadtree = null;
+          scheduleDraw();
+          fullSimulation.drag(event.subject.index, p[0], p[1]);
         })
-      );
-
-      fullSimulation = d3.forceSimulation(nodes)
-        .force('link', d3.forceLink(links).id(function(d){return d.id;}).distance(70))
-        .force('charge', d3.forceManyBody().strength(-150))
-        .force('center', d3.forceCenter(width/2, height/2))
-        .force('collision', d3.forceCollide().radius(function(d){return 8+Math.min(14,(d.degree||0)*0.7)+4;}))
-        .on('tick', function() {
-          linkSel.attr('x1',function(d){return d.source.x;}).attr('y1',function(d){return d.source.y;})
-                 .attr('x2',function(d){return d.target.x;}).attr('y2',function(d){return d.target.y;});
-          nodeSel.attr('transform',function(d){return 'translate('+d.x+','+d.y+')';});
-        });
+        .on('end', function(event) {
+          fullSimulation.release(event.subject.index);
+        })
+      ).call(d3.zoom().scaleExtent([0.3, 5]).on('zoom', function(event) {
+        transform = event.transform;
+        scheduleDraw();
+      }));
+
+      // 같은 run/필터/크기로 다시 그리면 저장해 둔 배치를 바로 그리고 물리 계산은 드래그할 때만 한다.
+      var layoutKey = fullLayoutKey(n, links.length, width, height);
+      var cached = fullLayoutCache.get(layoutKey);
+      function applyPositions(positions) {
+        for (var k = 0; k < n; k++) { nodes[k].x = positions[2 * k]; nodes[k].y = positions[2 * k + 1]; }
+        quadtree = null;
+        scheduleDraw();
+      }
+      var layoutMsg = {n: n, width: width, height: height, radii: radii, src: linkSrc, dst: linkDst};
+      var scope = fullLayoutScope(width, height);
+      if (cached) {
+        applyPositions(cached);
+        layoutMsg.positions = cached.slice();
+      } else if (lastFullLayout.scope === scope) {
+        layoutMsg.warm = warmFullPositions(nodes, lastFullLayout.nodes);
+        if (layoutMsg.warm) layoutMsg.reheat = FULL_LAYOUT_REHEAT;
+      }
+      lastFullLayout.scope = scope;
+      lastFullLayout.nodes = nodes;
+      fullSimulation = startFullLayout(layoutMsg, function(positions) {
+        rememberFullLayout(layoutKey, positions);
+        applyPositions(positions);
+      });
+    }
+
+    function fullLayoutKey(nodeCount, linkCount, width, height) {
+      var data = currentData || {};
+      return JSON.stringify([
+        data.run && data.run.run_id, data.filters, data.limit, currentGraphFilter, showAllGraphNodes,
+        nodeCount, linkCount, width, height
+      ]);
+    }
+
+    /* 같은 run/조회 조건/크기 안에서만 직전 배치를 이어 쓴다 (그래프 필터와 전체 보기 토글은 제외) */
+    function fullLayoutScope(width, height) {
+      var data = currentData || {};
+      return JSON.stringify([data.run && data.run.run_id, data.filters, data.limit, width, height]);
     }
 
+    /* 직전 노드 위치를 id 로 맞춰 옮긴다. 겹치는 노드가 하나도 없으면 null. */
+    function warmFullPositions(nodes, prevNodes) {
+      if (!prevNodes) return null;
+      var prevById = new Map();
+      prevNodes.forEach(function(d) { if (!isNaN(d.x)) prevById.set(d.id, d); });
+      var positions = new Float32Array(nodes.length * 2), hits = 0;
+      nodes.forEach(function(d, i) {
+        var prev = prevById.get(d.id);
+        positions[2 * i] = prev ? prev.x : NaN;
+        positions[2 * i + 1] = prev ? prev.y : NaN;
+        if (prev) hits++;
+      });
+      return hits ? positions : null;
+    }
+
+    function rememberFullLayout(key, positions) {
+      // Map 은 삽입 순서를 지키므로 다시 넣어 최근 것으로 만들고, 가장 오래된 것부터 버린다.
+      fullLayoutCache.delete(key);
+      fullLayoutCache.set(key, positions);
+      if (fullLayoutCache.size > FULL_LAYOUT_CACHE_MAX) fullLayoutCache.delete(fullLayoutCache.keys().next().value);
+    }
+
+    graphDetailEl.addEventListener('click', function(e) {
+      var btn = e.target.closest('.toggle-btn');
+      if (btn) setShowAllGraphNodes(btn.getAttribute('data-detail') === 'all');
+    });
+
     /* Graph filter toggle */
     document.getElementById('graphFilter').addEventListener('click', function(e) {
       var btn = e.target.closest('.toggle-btn');
@@ -1810,20 +3337,31 @@ def _render_dashboard_html() -> str:
     }
 
     /* ===== Table Impact Tab ===== */
+    /* table_impact 배열 하나당 한 번만 훑어 R/W별 행 목록과 테이블 수를 만든다.
+       요약 카드와 R/W 필터 토글은 이 색인을 다시 쓴다. */
+    var tableImpactIndexes = new WeakMap();
+    function tableImpactIndex(data) {
+      var idx = tableImpactIndexes.get(data);
+      if (idx) return idx;
+      var byRw = {}, tableSet = new Set();
+      for (var i = 0; i < data.length; i++) {
+        var d = data[i];
+        (byRw[d.rw_type] || (byRw[d.rw_type] = [])).push(d);
+        tableSet.add(d.table_name);
+      }
+      idx = {byRw: byRw, tables: tableSet.size};
+      tableImpactIndexes.set(data, idx);
+      return idx;
+    }
+
     function renderTableImpactSummary(data) {
-      var reads = 0, writes = 0, tableSet = {};
-      (data||[]).forEach(function(d) {
-        if (d.rw_type === 'READ') reads++;
-        if (d.rw_type === 'WRITE') writes++;
-        tableSet[d.table_name] = true;
-      });
-      var tables = Object.keys(tableSet).length;
+      var idx = tableImpactIndex(data || []);
       var cards = [
-        {label:'READ', value:reads, color:'green'},
-        {label:'WRITE', value:writes, color:'red'},
-        {label:'Tables', value:tables, color:'amber'}
+        {label:'READ', value:(idx.byRw.READ || []).length, color:'green'},
+        {label:'WRITE', value:(idx.byRw.WRITE || []).length, color:'red'},
+        {label:'Tables', value:idx.tables, color:'amber'}
       ];
-      document.getElementById('tableImpactSummary').innerHTML = cards.map(function(c) {
+      tableImpactSummaryEl.innerHTML = cards.map(function(c) {
         return '<div class="metric-card '+c.color+'">' +
           '<div class="metric-label">'+esc(c.label)+'</div>' +
           '<div class="metric-value">'+fmt(c.value)+'</div></div>';
@@ -1832,9 +3370,7 @@ def _render_dashboard_html() -> str:
 
     function renderTableImpactDetail(data) {
       var filtered = data;
-      if (currentRwFilter !== 'all') {
-        filtered = data.filter(function(d) { return d.rw_type === currentRwFilter; });
-      }
+      if (currentRwFilter !== 'all') filtered = tableImpactIndex(data).byRw[currentRwFilter] || [];
       renderSortableTable('tableImpactDetail', filtered, [
         {key:'table_name', label:'테이블', render: function(v) {
           return '<span class="mono" style="font-weight:600">'+esc(v)+'</span>';
@@ -1865,16 +3401,22 @@ def _render_dashboard_html() -> str:
     function renderTypeDist(data) {
       var counts = {};
       (data||[]).forEach(function(d) { counts[d.type] = (counts[d.type]||0) + 1; });
-      var el = document.getElementById('typeDist');
+      var el = typeDistEl;
       var sorted = Object.entries(counts).sort(function(a,b) { return b[1]-a[1]; });
       if (!sorted.length) {
         el.innerHTML = '<div class="empty-state"><div class="msg">데이터 없음</div></div>';
         return;
       }
-      el.innerHTML = sorted.map(function(e) {
-        return '<div class="type-chip">' + badgeHtml('type', e[0]) +
-          ' <span class="count">' + fmt(e[1]) + '</span></div>';
-      }).join('');
+      // 칩은 템플릿을 복제해 텍스트만 채운다 (HTML 파싱/이스케이프 없음).
+      var tpl = typeChipTpl;
+      var frag = document.createDocumentFragment();
+      sorted.forEach(function(e) {
+        var chip = tpl.firstElementChild.cloneNode(true);
+        chip.children[0].textContent = e[0];
+        chip.children[1].textContent = fmt(e[1]);
+        frag.appendChild(chip);
+      });
+      el.replaceChildren(frag);
     }
 
     function renderInventory(data) {
@@ -1893,7 +3435,7 @@ def _render_dashboard_html() -> str:
     }
 
     function renderUnused(data) {
-      document.getElementById('unusedCount').textContent = fmt(data.length);
+      unusedCountEl.textContent = fmt(data.length);
       renderSortableTable('unusedTable', data, [
         {key:'type', label:'타입', render: function(v) { return badgeHtml('type', v); }},
         {key:'name', label:'객체명', render: function(v) {
@@ -1912,13 +3454,69 @@ def _render_dashboard_html() -> str:
     async function loadRuns() {
       var data = await fetchJson('/api/runs');
       var runs = data.runs || [];
-      runSelectEl.innerHTML = runs.map(function(r) {
-        return '<option value="'+esc(r.run_id)+'">'+esc(r.run_id)+' ('+esc(r.status)+')</option>';
-      }).join('');
+      var frag = document.createDocumentFragment();
+      runs.forEach(function(r) { frag.appendChild(new Option(r.run_id + ' (' + (r.status == null ? '' : r.status) + ')', r.run_id)); });
+      runSelectEl.replaceChildren(frag);
       return runs;
     }
 
+    /* 탭별로 어떤 섹션을 어떻게 그리는지. 그래프는 scheduleGraphRender 가 따로 맡는다. */
+    var tabSections = {
+      overview: {
+        run: function(p) { renderRunInfo(p.run || null); },
+        relation_counts: function(p) { renderRelationBar(p.relation_counts || []); },
+        unused_object_candidates: function(p) {
+          renderMetrics(p.summary || {}, (p.unused_object_candidates || []).length);
+        }
+      },
+      dependencies: {
+        event_function_map: function(p) { renderEventMap(p.event_function_map || []); },
+        screen_call_graph: function(p) { renderGraphEdges(p.screen_call_graph || []); }
+      },
+      'table-impact': {
+        table_impact: function(p) {
+          renderTableImpactSummary(p.table_impact || []);
+          renderTableImpactDetail(p.table_impact || []);
+        }
+      },
+      inventory: {
+        screen_inventory: function(p) {
+          renderTypeDist(p.screen_inventory || []);
+          renderInventory(p.screen_inventory || []);
+        },
+        unused_object_candidates: function(p) { renderUnused(p.unused_object_candidates || []); }
+      }
+    };
+    /* 'tab:section' -> true. 새 데이터의 첫 섹션이 오면 비우고, 탭이 처음 보일 때 채운다. */
+    var renderedSections = {};
+
+    /* 보이는 탭에서 아직 그리지 않은 섹션만 그린다 — 숨은 탭은 처음 열 때까지 미룬다. */
+    function renderTabSections(tabId) {
+      var renderers = tabSections[tabId];
+      if (!renderers || !currentData) return;
+      for (var key in renderers) {
+        var mark = tabId + ':' + key;
+        if (renderedSections[mark] || !(key in currentData)) continue;
+        renderedSections[mark] = true;
+        renderers[key](currentData);
+      }
+    }
+
+    /* 진행 중인 /api/all-stream 요청. 새로 불러오면 이전 요청은 취소해 늦게 온 응답이 화면을 덮지 않게 한다. */
+    var loadController = null;
+    var loadDebounceTimer = 0;
+    var LOAD_DEBOUNCE_MS = 120;
+
+    /* 필터 입력/버튼처럼 연달아 올 수 있는 요청은 마지막 것만 보낸다. */
+    function scheduleLoadDashboard() {
+      clearTimeout(loadDebounceTimer);
+      loadDebounceTimer = setTimeout(function() { loadDashboard().catch(handleErr); }, LOAD_DEBOUNCE_MS);
+    }
+
     async function loadDashboard() {
+      clearTimeout(loadDebounceTimer);
+      if (loadController) loadController.abort();
+      var controller = loadController = new AbortController();
       var selectedRun = runSelectEl.value;
       var limit = Number(limitInputEl.value || 200);
       var filters = readFilters();
@@ -1928,34 +3526,21 @@ def _render_dashboard_html() -> str:
       for (var k in filters) { if (filters[k]) params.set(k, filters[k]); }
 
       statusEl.textContent = 'loading...';
-      var payload = await fetchJson('/api/all?' + params.toString());
+      // 첫 섹션이 올 때까지는 이전 payload 가 currentData 로 남아 그 사이 탭 전환이 옛 데이터를 그릴 수 있다.
+      // 그려 둔 표시는 새 데이터의 첫 섹션을 받을 때 비워 새 데이터로 다시 그리게 한다.
+      var firstSection = true;
+      var payload = await fetchSections('/api/all-stream?' + params.toString(), function(key, data) {
+        if (controller !== loadController) return;
+        if (firstSection) { firstSection = false; renderedSections = {}; }
+        currentData = data;
+        if (key === 'filters') renderActiveFilters(data.filters || {});
+        else if (key === 'graph_data') scheduleGraphRender(activeTab);
+        else renderTabSections(activeTab);
+      }, controller.signal);
+      if (controller !== loadController) return;
+      loadController = null;
       currentData = payload;
 
-      renderActiveFilters(payload.filters || {});
-
-      /* Overview */
-      renderMetrics(payload.summary || {}, (payload.unused_object_candidates || []).length);
-      renderRelationBar(payload.relation_counts || []);
-      renderRunInfo(payload.run || null);
-      renderMiniGraph(payload.graph_data);
-
-      /* Dependencies */
-      renderEventMap(payload.event_function_map || []);
-      renderGraphEdges(payload.screen_call_graph || []);
-
-      /* Table Impact */
-      renderTableImpactSummary(payload.table_impact || []);
-      renderTableImpactDetail(payload.table_impact || []);
-
-      /* Inventory */
-      renderTypeDist(payload.screen_inventory || []);
-      renderInventory(payload.screen_inventory || []);
-      renderUnused(payload.unused_object_candidates || []);
-
-      /* Render full graph only if dependencies tab is active */
-      var depTab = document.getElementById('tab-dependencies');
-      if (depTab.classList.contains('active')) renderFullGraph(payload.graph_data);
-
       /* Status */
       var parts = [];
       var f = payload.filters || {};
@@ -1974,13 +3559,13 @@ def _render_dashboard_html() -> str:
 
     /* ===== Event Handlers ===== */
     document.getElementById('reloadBtn').addEventListener('click', function() { loadDashboard().catch(handleErr); });
-    document.getElementById('applyFilterBtn').addEventListener('click', function() { loadDashboard().catch(handleErr); });
-    document.getElementById('clearFilterBtn').addEventListener('click', function() { clearFilters(); loadDashboard().catch(handleErr); });
+    document.getElementById('applyFilterBtn').addEventListener('click', scheduleLoadDashboard);
+    document.getElementById('clearFilterBtn').addEventListener('click', function() { clearFilters(); scheduleLoadDashboard(); });
     runSelectEl.addEventListener('change', function() { loadDashboard().catch(handleErr); });
 
     [searchInputEl, objectInputEl, tableInputEl].forEach(function(el) {
       el.addEventListener('keydown', function(ev) {
-        if (ev.key === 'Enter') loadDashboard().catch(handleErr);
+        if (ev.key === 'Enter') scheduleLoadDashboard();
       });
     });
 
@@ -1990,4 +3575,17 @@ def _render_dashboard_html() -> str:
 </html>
 """
 
-    return html.replace("__TITLE__", escape("PB Analyzer Dashboard"))
+    # 내용 해시를 URL에 붙여 두면 CSS가 바뀔 때만 브라우저가 다시 받는다.
+    deferred_css_version = _deferred_css_bytes()[2].strip('"')
+    deferred_css_url = f"{_DEFERRED_CSS_PATH}?v={deferred_css_version}"
+    values = {
+        "TITLE": escape("PB Analyzer Dashboard"),
+        "STYLE": _CRITICAL_CSS,
+        "DEFERRED_CSS_URL": deferred_css_url,
+        "D3_SCRIPT_URL": _D3_SCRIPT_URL,
+        "D3_FORCE_SCRIPT_URL": _D3_FORCE_SCRIPT_URL,
+    }
+    # split 결과는 [본문, 이름, 본문, 이름, ...] 이므로 이름 칸만 값으로 바꿔 한 번에 잇는다.
+    parts = _SHELL_PLACEHOLDER_PATTERN.split(html)
+    parts[1::2] = [values[name] for name in parts[1::2]]
+    return "".join(parts)
@@ -56,9 +56,13 @@ def run_analyze(
     run_id: str | None = None,
     source_version: str | None = None,
     config_dir: Path | None = None,
+    workers: int = 1,
 ) -> AnalyzeOutcome:
     """Runs parse/analyze/persist stages."""
 
+    if workers < 1:
+        raise UserInputError(f"workers must be at least 1: {workers}")
+
     started_at = datetime.now(timezone.utc).isoformat()
 
     logger.info("analyze started: manifest=%s", manifest_path)
@@ -71,7 +75,7 @@ def run_analyze(
         if table_mapping_path.exists():
             table_mapping = load_table_mapping(table_mapping_path)
 
-    analysis_result = analyze(parse_result, table_mapping=table_mapping)
+    analysis_result = analyze(parse_result, table_mapping=table_mapping, workers=workers)
 
     finished_at = datetime.now(timezone.utc).isoformat()
     context = RunContext(
@@ -114,6 +118,7 @@ def run_all(
     report_format: str,
     orca_cmd: str | None = None,
     config_dir: Path | None = None,
+    workers: int = 1,
 ) -> PipelineOutcome:
     """Runs extract -> analyze -> report in sequence."""
 
@@ -136,6 +141,7 @@ def run_all(
         db_path=db_path,
         source_version=None,
         config_dir=config_dir,
+        workers=workers,
     )
 
     report_files = run_report(
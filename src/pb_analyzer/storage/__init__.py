@@ -1,6 +1,6 @@
 """Storage module."""
 
 from .differ import diff_runs
-from .sqlite_store import persist_analysis
+from .sqlite_store import ensure_indexes, persist_analysis
 
-__all__ = ["diff_runs", "persist_analysis"]
+__all__ = ["diff_runs", "ensure_indexes", "persist_analysis"]
@@ -0,0 +1,39 @@
+"""Run 단위 집계 테이블(run_summary, run_relation_counts) 적재."""
+
+from __future__ import annotations
+
+import sqlite3
+
+
+def materialize_run_stats(conn: sqlite3.Connection, run_id: str) -> None:
+    """Stores the dashboard summary and relation counts of a persisted run."""
+
+    # 저장이 끝난 run은 바뀌지 않으므로 대시보드가 매번 다시 세지 않도록 한 번만 집계해 둔다.
+    conn.execute(
+        """
+        INSERT OR REPLACE INTO run_summary
+            (run_id, total_objects, table_objects, app_objects, relations, sql_statements, sql_tables)
+        SELECT
+            ?,
+            COUNT(*),
+            COALESCE(SUM(CASE WHEN type = 'Table' THEN 1 ELSE 0 END), 0),
+            COALESCE(SUM(CASE WHEN type <> 'Table' THEN 1 ELSE 0 END), 0),
+            (SELECT COUNT(*) FROM relations WHERE run_id = ?),
+            (SELECT COUNT(*) FROM sql_statements WHERE run_id = ?),
+            (SELECT COUNT(*) FROM sql_tables WHERE run_id = ?)
+        FROM objects
+        WHERE run_id = ?
+        """,
+        (run_id, run_id, run_id, run_id, run_id),
+    )
+    conn.execute("DELETE FROM run_relation_counts WHERE run_id = ?", (run_id,))
+    conn.execute(
+        """
+        INSERT INTO run_relation_counts (run_id, relation_type, count)
+        SELECT run_id, relation_type, COUNT(*)
+        FROM relations
+        WHERE run_id = ?
+        GROUP BY relation_type
+        """,
+        (run_id,),
+    )
@@ -6,6 +6,9 @@ from pathlib import Path
 import sqlite3
 
 from pb_analyzer.common import AnalysisResult, PersistResult, RunContext, UserInputError
+from pb_analyzer.storage.run_stats import materialize_run_stats
+
+_SQL_ROOT_DIR = Path(__file__).resolve().parents[3] / "sql"
 
 
 def persist_analysis(db_path: Path, run_context: RunContext, analysis: AnalysisResult) -> PersistResult:
@@ -16,6 +19,8 @@ def persist_analysis(db_path: Path, run_context: RunContext, analysis: AnalysisR
 
     with sqlite3.connect(str(db_path)) as conn:
         conn.execute("PRAGMA foreign_keys = ON;")
+        # 대시보드의 읽기 전용 연결이 분석 쓰기와 서로 막지 않도록 WAL 저널을 쓴다.
+        conn.execute("PRAGMA journal_mode = WAL;")
         _initialize_schema(conn)
 
         conn.execute(
@@ -163,6 +168,7 @@ def persist_analysis(db_path: Path, run_context: RunContext, analysis: AnalysisR
             )
             data_windows_count += 1
 
+        materialize_run_stats(conn, run_context.run_id)
         conn.commit()
 
     return PersistResult(
@@ -176,6 +182,25 @@ def persist_analysis(db_path: Path, run_context: RunContext, analysis: AnalysisR
     )
 
 
+def ensure_indexes(db_path: Path) -> None:
+    """Creates any missing read-path indexes on an existing SQLite DB."""
+
+    _validate_db_path(db_path)
+
+    with sqlite3.connect(str(db_path)) as conn:
+        conn.executescript(_index_file().read_text(encoding="utf-8"))
+        _ensure_object_search(conn)
+        # 새 연결의 PRAGMA optimize는 통계가 없는 DB를 분석하지 않으므로 첫 통계는 직접 만든다.
+        has_stats = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+        ).fetchone()
+        if has_stats is None:
+            conn.execute("PRAGMA analysis_limit = 1000;")
+            conn.execute("ANALYZE;")
+        else:
+            conn.execute("PRAGMA optimize;")
+
+
 def _validate_db_path(db_path: Path) -> None:
     db_string = str(db_path)
     if db_string.startswith("postgresql://") or db_string.startswith("postgres://"):
@@ -185,9 +210,8 @@ def _validate_db_path(db_path: Path) -> None:
 
 
 def _initialize_schema(conn: sqlite3.Connection) -> None:
-    root_dir = Path(__file__).resolve().parents[3]
-    schema_file = root_dir / "sql" / "schema" / "001_init.sql"
-    index_file = root_dir / "sql" / "indexes" / "002_indexes.sql"
+    schema_file = _SQL_ROOT_DIR / "schema" / "001_init.sql"
+    index_file = _index_file()
 
     if not schema_file.exists() or not index_file.exists():
         raise UserInputError(
@@ -196,3 +220,26 @@ def _initialize_schema(conn: sqlite3.Connection) -> None:
 
     conn.executescript(schema_file.read_text(encoding="utf-8"))
     conn.executescript(index_file.read_text(encoding="utf-8"))
+    _ensure_object_search(conn)
+
+
+def _ensure_object_search(conn: sqlite3.Connection) -> None:
+    # 대시보드 부분 문자열 검색용 trigram FTS 색인. objects INSERT 트리거로 따라가며,
+    # FTS5/trigram(SQLite 3.34+)이 없는 빌드에서는 만들지 않고 LIKE 검색을 그대로 쓴다.
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'objects_search'"
+    ).fetchone()
+    if exists is not None:
+        return
+    try:
+        conn.executescript(_object_search_file().read_text(encoding="utf-8"))
+    except sqlite3.OperationalError:
+        return
+
+
+def _index_file() -> Path:
+    return _SQL_ROOT_DIR / "indexes" / "002_indexes.sql"
+
+
+def _object_search_file() -> Path:
+    return _SQL_ROOT_DIR / "indexes" / "003_object_search.sql"
@@ -71,6 +71,46 @@ def test_cli_run_all_command_returns_zero(tmp_path: Path) -> None:
     assert code == 0
 
 
+def test_cli_run_all_accepts_workers(tmp_path: Path) -> None:
+    source_dir = _create_source_tree(tmp_path)
+    out_dir = tmp_path / "pipeline"
+    db_file = tmp_path / "run.db"
+
+    code = main(
+        [
+            "run-all",
+            "--input",
+            str(source_dir),
+            "--out",
+            str(out_dir),
+            "--db",
+            str(db_file),
+            "--workers",
+            "2",
+        ]
+    )
+    assert code == 0
+
+
+def test_cli_analyze_returns_input_error_for_non_positive_workers(tmp_path: Path) -> None:
+    source_dir = _create_source_tree(tmp_path)
+    extract_dir = tmp_path / "work"
+    assert main(["extract", "--input", str(source_dir), "--out", str(extract_dir)]) == 0
+
+    code = main(
+        [
+            "analyze",
+            "--manifest",
+            str(extract_dir / "manifest.json"),
+            "--db",
+            str(tmp_path / "run.db"),
+            "--workers",
+            "0",
+        ]
+    )
+    assert code == 1
+
+
 def test_cli_run_all_handles_archive_input(tmp_path: Path) -> None:
     source_dir = _create_source_tree(tmp_path)
     archive_path = tmp_path / "source.zip"
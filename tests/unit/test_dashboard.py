@@ -1,13 +1,34 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+import http.client
+from http.server import ThreadingHTTPServer
+import json
+import os
+import re
 from pathlib import Path
+import sqlite3
+import threading
+from typing import Any
 
 import pytest
 
 from pb_analyzer.common import UserInputError
-from pb_analyzer.dashboard import get_dashboard_payload, list_runs
-from pb_analyzer.dashboard.service import DashboardFilters
+from pb_analyzer.dashboard import get_dashboard_payload, list_runs, run_dashboard
+from pb_analyzer.dashboard import service as dashboard_service
+from pb_analyzer.dashboard.service import (
+    DashboardFilters,
+    _accepts_gzip,
+    _build_graph_data,
+    _build_handler,
+    _decode_cursor,
+    _get_cached_dashboard_payload,
+    _iter_ndjson_sections,
+    _minify_css,
+    _ReadConnectionPool,
+)
 from pb_analyzer.pipeline import run_all
+from pb_analyzer.storage import ensure_indexes
 
 
 def _prepare_db(tmp_path: Path) -> Path:
@@ -111,3 +132,524 @@ def test_dashboard_payload_rejects_invalid_relation_type_filter(tmp_path: Path)
             db_path=db_path,
             filters=DashboardFilters(relation_type="invalid-type"),
         )
+
+
+def test_cached_dashboard_payload_is_reused_until_db_changes(tmp_path: Path) -> None:
+    db_path = _prepare_db(tmp_path)
+
+    first = _get_cached_dashboard_payload(db_path, None, 200, None)
+    second = _get_cached_dashboard_payload(db_path, None, 200, DashboardFilters(search=" "))
+
+    assert second is first
+
+    os.utime(db_path, ns=(0, db_path.stat().st_mtime_ns + 1_000_000_000))
+    third = _get_cached_dashboard_payload(db_path, None, 200, None)
+
+    assert third is not first
+    assert third == first
+
+
+def test_cached_dashboard_payload_coalesces_concurrent_misses(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    db_path = _prepare_db(tmp_path)
+    build = dashboard_service.get_dashboard_payload
+    # 마지막 연결이 닫히면 WAL 파일이 지워져 DB 버전(캐시 키)이 바뀌므로 연결 하나를 열어 둔다.
+    holder = sqlite3.connect(str(db_path))
+    holder.execute("SELECT 1 FROM runs").fetchall()
+    started = threading.Event()
+    release = threading.Event()
+    calls: list[int] = []
+
+    def slow_build(**kwargs: Any) -> dict[str, Any]:
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return build(**kwargs)
+
+    monkeypatch.setattr(dashboard_service, "get_dashboard_payload", slow_build)
+    results: list[dict[str, Any]] = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(_get_cached_dashboard_payload(db_path, None, 77, None))
+        )
+        for _ in range(3)
+    ]
+    threads[0].start()
+    assert started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    holder.close()
+
+    assert len(calls) == 1
+    assert len(results) == 3
+    assert all(result is results[0] for result in results)
+
+
+def test_cached_dashboard_payload_reads_through_connection_pool(tmp_path: Path) -> None:
+    db_path = _prepare_db(tmp_path)
+    pool = _ReadConnectionPool(db_path, size=1)
+
+    try:
+        pooled = _get_cached_dashboard_payload(
+            db_path, None, 50, DashboardFilters(object_name="w_main"), pool
+        )
+    finally:
+        pool.close()
+
+    assert pooled == get_dashboard_payload(
+        db_path=db_path, limit=50, filters=DashboardFilters(object_name="w_main")
+    )
+
+
+def test_connection_pool_prefill_reuses_opened_connections(tmp_path: Path) -> None:
+    db_path = _prepare_db(tmp_path)
+    pool = _ReadConnectionPool(db_path, size=2)
+
+    try:
+        pool.prefill()
+        opened = list(pool._idle.queue)
+        with pool.connection() as conn:
+            assert conn in opened
+            assert conn.execute("PRAGMA query_only").fetchone()[0] == 1
+        assert pool._idle.qsize() == 2
+    finally:
+        pool.close()
+
+    assert pool._idle.qsize() == 0
+
+
+def test_dashboard_payload_include_limits_panels(tmp_path: Path) -> None:
+    db_path = _prepare_db(tmp_path)
+
+    full = get_dashboard_payload(db_path=db_path)
+    graph_only = get_dashboard_payload(db_path=db_path, include={"graph_data"})
+
+    assert graph_only["graph_data"] == full["graph_data"]
+    assert "summary" not in graph_only
+    assert "screen_call_graph" not in graph_only
+    assert graph_only["filtered_counts"] == {}
+
+    inventory_only = get_dashboard_payload(db_path=db_path, include={"screen_inventory"})
+    assert "graph_data" not in inventory_only
+    assert inventory_only["screen_inventory"] == full["screen_inventory"]
+
+    with pytest.raises(ValueError):
+        get_dashboard_payload(db_path=db_path, include={"unknown_panel"})
+
+
+def test_encode_json_matches_stdlib_encoding(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    payload = get_dashboard_payload(db_path=_prepare_db(tmp_path))
+    encoded = dashboard_service._encode_json(payload)
+
+    monkeypatch.setattr(dashboard_service, "orjson", None)
+
+    assert dashboard_service._encode_json(payload) == encoded
+    assert json.loads(encoded) == payload
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_chunks_join_to_full_encoding(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    payload = get_dashboard_payload(db_path=_prepare_db(tmp_path))
+    if not use_orjson:
+        monkeypatch.setattr(dashboard_service, "orjson", None)
+    monkeypatch.setattr(dashboard_service, "_JSON_WRITE_CHUNK_SIZE", 64)
+
+    chunks = list(dashboard_service._iter_json_chunks(payload))
+
+    assert len(chunks) > 1
+    assert b"".join(chunks) == dashboard_service._encode_json(payload)
+    assert b"".join(dashboard_service._iter_json_chunks({})) == b"{}"
+
+
+def test_ndjson_sections_stream_overview_first_and_rebuild_payload(tmp_path: Path) -> None:
+    db_path = _prepare_db(tmp_path)
+    payload = get_dashboard_payload(db_path=db_path)
+
+    sections = [json.loads(line) for line in _iter_ndjson_sections(payload)]
+    keys = [next(iter(section)) for section in sections]
+
+    assert keys[:4] == ["run", "limit", "filters", "summary"]
+    assert keys.index("graph_data.nodes") < keys.index("screen_inventory")
+    merged: dict[str, Any] = {}
+    for section in sections:
+        for key, value in section.items():
+            name, _, field = key.partition(".")
+            if not field:
+                merged[key] = value
+            elif isinstance(value, list):
+                merged.setdefault(name, {}).setdefault(field, []).extend(value)
+            else:
+                merged.setdefault(name, {})[field] = value
+    assert merged == payload
+
+
+def test_ndjson_sections_batch_large_graph_lists(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(dashboard_service, "_STREAM_BATCH_SIZE", 2)
+    nodes = [{"id": f"n{index}"} for index in range(5)]
+    payload = {"graph_data": {"nodes": nodes, "edges": [], "node_count": 5}}
+
+    lines = [json.loads(line) for line in _iter_ndjson_sections(payload)]
+
+    assert lines == [
+        {"graph_data.nodes": nodes[0:2]},
+        {"graph_data.nodes": nodes[2:4]},
+        {"graph_data.nodes": nodes[4:5]},
+        {"graph_data.edges": []},
+        {"graph_data.node_count": 5},
+    ]
+
+
+def test_dashboard_payload_treats_trailing_star_as_prefix_filter(tmp_path: Path) -> None:
+    db_path = _prepare_db(tmp_path)
+
+    payload = get_dashboard_payload(
+        db_path=db_path,
+        filters=DashboardFilters(object_name="w_ma*"),
+    )
+
+    assert [item["name"] for item in payload["screen_inventory"]] == ["w_main"]
+    assert all(item["src_name"] == "w_main" for item in payload["screen_call_graph"])
+
+
+def test_dashboard_payload_pages_screen_inventory_with_cursor(tmp_path: Path) -> None:
+    db_path = _prepare_db(tmp_path)
+
+    first_page = get_dashboard_payload(db_path=db_path, limit=1)
+    cursor = first_page["next_cursor"]["screen_inventory"]
+    second_page = get_dashboard_payload(
+        db_path=db_path,
+        limit=1,
+        filters=DashboardFilters(inventory_after=_decode_cursor(cursor)),
+    )
+
+    assert [item["name"] for item in first_page["screen_inventory"]] == ["w_detail"]
+    assert [item["name"] for item in second_page["screen_inventory"]] == ["w_main"]
+    assert second_page["filters"]["inventory_after"] == cursor
+    # 다른 패널은 자기 커서가 없으므로 첫 페이지 그대로다.
+    assert second_page["unused_object_candidates"] == first_page["unused_object_candidates"]
+    assert second_page["filters"]["unused_after"] is None
+
+
+def test_dashboard_payload_pages_unused_candidates_independently(tmp_path: Path) -> None:
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    for name in ("w_alpha", "w_beta", "w_gamma"):
+        (source_dir / f"{name}.srw").write_text("", encoding="utf-8")
+    db_path = tmp_path / "run.db"
+    run_all(
+        input_path=source_dir,
+        output_path=tmp_path / "out",
+        db_path=db_path,
+        extractor_name="auto",
+        report_format="json",
+    )
+
+    first_page = get_dashboard_payload(db_path=db_path, limit=1)
+    cursor = first_page["next_cursor"]["unused_object_candidates"]
+    second_page = get_dashboard_payload(
+        db_path=db_path,
+        limit=1,
+        filters=DashboardFilters(unused_after=_decode_cursor(cursor)),
+    )
+
+    assert [item["name"] for item in first_page["unused_object_candidates"]] == ["w_alpha"]
+    assert [item["name"] for item in second_page["unused_object_candidates"]] == ["w_beta"]
+    assert second_page["screen_inventory"] == first_page["screen_inventory"]
+    assert second_page["next_cursor"]["screen_inventory"] == cursor
+
+
+def test_dashboard_cursor_rejects_malformed_value() -> None:
+    with pytest.raises(UserInputError, match="Invalid cursor"):
+        _decode_cursor("not-a-cursor")
+
+
+def test_ensure_indexes_restores_missing_dashboard_indexes(tmp_path: Path) -> None:
+    db_path = _prepare_db(tmp_path)
+    with sqlite3.connect(str(db_path)) as conn:
+        conn.execute("DROP INDEX idx_relations_run_dst")
+
+    ensure_indexes(db_path)
+
+    with sqlite3.connect(str(db_path)) as conn:
+        row = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND name = 'idx_relations_run_dst'"
+        ).fetchone()
+        stats = conn.execute("SELECT COUNT(*) FROM sqlite_stat1").fetchone()
+    assert row is not None
+    assert stats[0] > 0
+
+
+def test_unused_candidates_probe_indexes_per_object(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    db_path = _prepare_db(tmp_path)
+    ensure_indexes(db_path)
+    captured: list[tuple[str, list[Any]]] = []
+    fetch_dicts = dashboard_service._fetch_dicts
+
+    def capture(conn: sqlite3.Connection, sql: str, params: list[Any]) -> list[dict[str, Any]]:
+        captured.append((sql, list(params)))
+        return fetch_dicts(conn, sql, params)
+
+    monkeypatch.setattr(dashboard_service, "_fetch_dicts", capture)
+    get_dashboard_payload(db_path=db_path, include={"unused_object_candidates"})
+
+    with sqlite3.connect(str(db_path)) as conn:
+        sql, params = captured[-1]
+        plan = [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+    assert not [detail for detail in plan if detail.startswith("SCAN")]
+    assert sum("USING COVERING INDEX" in detail for detail in plan) == 4
+
+
+def test_latest_run_lookup_walks_started_at_index(tmp_path: Path) -> None:
+    db_path = _prepare_db(tmp_path)
+    ensure_indexes(db_path)
+
+    with sqlite3.connect(str(db_path)) as conn:
+        conn.row_factory = sqlite3.Row
+        latest = dashboard_service._query_run_row(conn, None)
+        plan = [
+            row[3]
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT run_id FROM runs ORDER BY started_at DESC, rowid DESC LIMIT 1"
+            )
+        ]
+
+    assert latest == list_runs(db_path, limit=1)[0]
+    assert any("idx_runs_started_at" in detail for detail in plan)
+    assert not any("TEMP B-TREE" in detail for detail in plan)
+
+
+def test_object_search_index_matches_like_search(tmp_path: Path) -> None:
+    db_path = _prepare_db(tmp_path)
+    filters = DashboardFilters(search="MAI")
+    panels = {"screen_inventory", "unused_object_candidates"}
+
+    with sqlite3.connect(str(db_path)) as conn:
+        indexed = conn.execute(
+            "SELECT COUNT(*) FROM objects_search WHERE objects_search MATCH '\"main\"'"
+        ).fetchone()[0]
+    with_index = get_dashboard_payload(db_path=db_path, filters=filters, include=panels)
+
+    with sqlite3.connect(str(db_path)) as conn:
+        conn.execute("DROP TABLE objects_search")
+    with_like = get_dashboard_payload(db_path=db_path, filters=filters, include=panels)
+
+    assert indexed > 0
+    assert with_index["screen_inventory"]
+    assert with_index == with_like
+
+
+def test_object_search_treats_underscore_as_literal_on_both_paths(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    for name in ("w_main", "wxmain"):
+        (source_dir / f"{name}.srw").write_text("", encoding="utf-8")
+    db_path = tmp_path / "run.db"
+    run_all(
+        input_path=source_dir,
+        output_path=tmp_path / "out",
+        db_path=db_path,
+        extractor_name="auto",
+        report_format="json",
+    )
+    filters = DashboardFilters(search="w_main")
+    captured: list[tuple[str, list[Any]]] = []
+    fetch_dicts = dashboard_service._fetch_dicts
+
+    def capture(conn: sqlite3.Connection, sql: str, params: list[Any]) -> list[dict[str, Any]]:
+        captured.append((sql, list(params)))
+        return fetch_dicts(conn, sql, params)
+
+    monkeypatch.setattr(dashboard_service, "_fetch_dicts", capture)
+    with_index = get_dashboard_payload(
+        db_path=db_path, filters=filters, include={"screen_inventory"}
+    )
+    with sqlite3.connect(str(db_path)) as conn:
+        sql, params = captured[-1]
+        plan = [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+        conn.execute("DROP TABLE objects_search")
+    with_like = get_dashboard_payload(
+        db_path=db_path, filters=filters, include={"screen_inventory"}
+    )
+
+    assert any("objects_search" in detail for detail in plan)
+    assert [item["name"] for item in with_index["screen_inventory"]] == ["w_main"]
+    assert with_like == with_index
+
+
+def test_run_dashboard_rejects_non_positive_workers(tmp_path: Path) -> None:
+    db_path = _prepare_db(tmp_path)
+
+    with pytest.raises(UserInputError):
+        run_dashboard(db_path=db_path, workers=0)
+
+
+def test_materialized_run_stats_match_live_counts(tmp_path: Path) -> None:
+    db_path = _prepare_db(tmp_path)
+    materialized = get_dashboard_payload(db_path=db_path, include={"summary", "relation_counts"})
+
+    with sqlite3.connect(str(db_path)) as conn:
+        conn.execute("DELETE FROM run_relation_counts")
+        conn.execute("DELETE FROM run_summary")
+    live = get_dashboard_payload(db_path=db_path, include={"summary", "relation_counts"})
+
+    assert materialized["summary"] == live["summary"]
+    assert materialized["relation_counts"] == live["relation_counts"]
+
+
+def test_live_summary_counts_zero_for_run_without_rows(tmp_path: Path) -> None:
+    db_path = _prepare_db(tmp_path)
+
+    with sqlite3.connect(str(db_path)) as conn:
+        conn.row_factory = sqlite3.Row
+        summary = dashboard_service._query_summary(conn, "missing-run")
+
+    assert summary == dict.fromkeys(
+        (
+            "total_objects",
+            "table_objects",
+            "app_objects",
+            "relations",
+            "sql_statements",
+            "sql_tables",
+        ),
+        0,
+    )
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("gzip, deflate, br", True),
+        ("br", False),
+        ("gzip;q=0", False),
+        ("*", True),
+        (None, False),
+        ("*, gzip;q=0", False),
+        ("gzip;q=0, *", False),
+        ("*;q=0, gzip", True),
+        ("br, *;q=0.5", True),
+    ],
+)
+def test_accepts_gzip_reads_accept_encoding(header: str | None, expected: bool) -> None:
+    assert _accepts_gzip(header) is expected
+
+
+def test_dashboard_html_has_no_control_characters() -> None:
+    html = dashboard_service._render_dashboard_html()
+
+    assert not re.search(r"[\x00-\x08\x0b-\x1f]", html)
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ('"abc-gz"', True),
+        ('"abc"', False),
+        ('"other", W/"abc-gz"', True),
+        ("*", True),
+        (None, False),
+    ],
+)
+def test_etag_matches_gzip_representation(header: str | None, expected: bool) -> None:
+    etag = dashboard_service._gzip_etag('"abc"')
+
+    assert etag == '"abc-gz"'
+    assert dashboard_service._etag_matches(header, etag) is expected
+
+
+def test_minify_css_strips_comments_and_keeps_strings() -> None:
+    css = """
+    /* Header */
+    .mono , .code > span {
+      font-family: "Cascadia Code",  monospace;
+      content: ' a ; b ';
+    }
+    """
+
+    assert _minify_css(css) == (
+        '.mono,.code>span{font-family:"Cascadia Code",monospace;content:\' a ; b \'}'
+    )
+
+
+def test_event_function_map_collects_calls_of_event_owner(tmp_path: Path) -> None:
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    (source_dir / "w_main.srw").write_text(
+        "event clicked\nfunction integer f_main()\n", encoding="utf-8"
+    )
+    (source_dir / "w_detail.srw").write_text("event open\nf_main()\n", encoding="utf-8")
+    db_path = tmp_path / "run.db"
+    run_all(
+        input_path=source_dir,
+        output_path=tmp_path / "out",
+        db_path=db_path,
+        extractor_name="auto",
+        report_format="json",
+    )
+
+    payload = get_dashboard_payload(db_path=db_path)
+
+    rows = {row["object_name"]: row for row in payload["event_function_map"]}
+    assert set(rows["w_detail"]) == {"object_name", "event_name", "script_ref", "called_objects"}
+    assert rows["w_detail"]["called_objects"] == "w_main"
+
+
+def test_streamed_json_failure_closes_connection_without_error_body(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    head = b'{"status":"' + b"x" * (dashboard_service._JSON_STREAM_THRESHOLD + 1)
+
+    def failing_chunks(payload: dict[str, Any]) -> Iterator[bytes]:
+        yield head
+        raise RuntimeError("serialization failed")
+
+    monkeypatch.setattr(dashboard_service, "_iter_json_chunks", failing_chunks)
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0), _build_handler(tmp_path / "run.db", None, 200)
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=5)
+        conn.request("GET", "/health")
+        response = conn.getresponse()
+        body = response.read()
+        conn.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # 헤더를 보낸 뒤의 실패는 500 응답을 덧붙이지 않고 잘린 본문으로 끝난다.
+    assert response.status == 200
+    assert body == head
+
+
+def test_build_graph_data_counts_degrees_from_edges() -> None:
+    def edge(src: str, dst: str) -> dict[str, Any]:
+        return {"src_name": src, "dst_name": dst, "relation_type": "calls", "confidence": None}
+
+    graph = _build_graph_data(
+        [edge("W_b", "w_a"), edge("w_b", "W_B"), edge("w_c", ""), edge("w_a", "W_b")]
+    )
+
+    assert [(node["name"], node["out_degree"], node["in_degree"]) for node in graph["nodes"]] == [
+        ("w_a", 1, 1),
+        ("W_b", 1, 1),
+        ("w_b", 1, 0),
+        ("W_B", 0, 1),
+    ]
+    assert graph["edge_count"] == 3
+    assert graph["edges"][0]["confidence"] == 0.0
@@ -1,6 +1,7 @@
 from pathlib import Path
 
 from pb_analyzer.analyzer import analyze
+from pb_analyzer.common import ParseResult, ParsedObject
 from pb_analyzer.extractor import ExtractionRequest, FileSystemExtractorAdapter
 from pb_analyzer.parser import parse_manifest
 
@@ -44,3 +45,91 @@ def test_parse_and_analyze_detects_relations_and_sql(tmp_path: Path) -> None:
     assert "reads_table" in relation_types
     assert "writes_table" in relation_types
     assert "TB_ORDER" in {name.upper() for name in table_names}
+
+
+def _parsed_object(object_type: str, name: str, script_text: str = "") -> ParsedObject:
+    return ParsedObject(
+        object_type=object_type,
+        name=name,
+        module="app",
+        source_path=f"{name}.src",
+        extracted_path=f"{name}.src",
+        script_text=script_text,
+        events=(),
+        functions=(),
+    )
+
+
+def test_analyze_detects_data_window_usage_by_whole_word() -> None:
+    parsed = ParseResult(
+        objects=(
+            _parsed_object("Window", "w_main", "DW_ORDER.Retrieve()\ndw_order_list.Reset()\n"),
+            _parsed_object("DataWindow", "dw_order"),
+            _parsed_object("DataWindow", "dw_order_list"),
+            _parsed_object("DataWindow", "dw_unused"),
+        )
+    )
+
+    analysis = analyze(parsed)
+
+    uses_dw = [
+        (item.src_name, item.dst_name)
+        for item in analysis.relations
+        if item.relation_type == "uses_dw"
+    ]
+    assert uses_dw == [("w_main", "dw_order"), ("w_main", "dw_order_list")]
+
+
+def test_analyze_keeps_non_ascii_prefix_attached_to_data_window_name() -> None:
+    parsed = ParseResult(
+        objects=(
+            _parsed_object("Window", "w_main", "\u0130dw_a-b.Retrieve()\n"),
+            _parsed_object("DataWindow", "dw_a-b"),
+        )
+    )
+
+    analysis = analyze(parsed)
+
+    assert [item for item in analysis.relations if item.relation_type == "uses_dw"] == []
+
+
+def test_analyze_ignores_open_call_glued_to_non_ascii_letter() -> None:
+    parsed = ParseResult(
+        objects=(
+            _parsed_object("Window", "w_main", "\u0130open(w_detail)\n"),
+            _parsed_object("Window", "w_detail"),
+        )
+    )
+
+    analysis = analyze(parsed)
+
+    assert [item for item in analysis.relations if item.relation_type == "opens"] == []
+
+
+def test_analyze_skips_commented_sql_and_keeps_unterminated_comment_text() -> None:
+    script = (
+        "/* select * from tb_hidden; */\n"
+        "select * from tb_order; -- delete from tb_line_comment\n"
+        "/* unterminated select * from tb_tail"
+    )
+    parsed = ParseResult(objects=(_parsed_object("Window", "w_main", script),))
+
+    analysis = analyze(parsed)
+
+    assert [item.sql_text_norm for item in analysis.sql_statements] == [
+        "SELECT * FROM TB_ORDER",
+        "SELECT * FROM TB_TAIL",
+    ]
+
+
+def test_analyze_with_workers_matches_serial_result() -> None:
+    parsed = ParseResult(
+        objects=(
+            _parsed_object("Window", "w_main", "open(w_detail)\nselect * from tb_order;\n"),
+            _parsed_object("Window", "w_detail", "dw_order.Retrieve()\nOPEN(W_MAIN)\n"),
+            _parsed_object("Window", "w_copy", "open(w_detail)\nupdate tb_order set a = 1;\n"),
+            _parsed_object("DataWindow", "dw_order", "select * from tb_order"),
+        )
+    )
+
+    assert analyze(parsed, workers=2) == analyze(parsed)